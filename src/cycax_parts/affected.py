@@ -0,0 +1,172 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Work out which registered parts are affected by changes to the source.
+
+The import graph is read from the source with ast, no part module is imported. A part
+is affected when the module defining it, or any module it imports from the same
+repository, changed. Every part also depends on the build pipeline, build.py and what it
+imports, like the optimisation and the build cache.
+"""
+
+import ast
+import logging
+import subprocess
+from importlib.machinery import PathFinder
+from pathlib import Path
+
+from cycax_parts.registry import PartEntry
+
+logger = logging.getLogger(__name__)
+
+BUILD_MODULE = "cycax_parts.build"  # Defines build_part, build_case and motherboard_case.
+
+
+def git(*args: str, cwd: Path | None = None) -> str:
+    result = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True, check=True)  # noqa: S603, S607
+    return result.stdout
+
+
+def repo_root(cwd: Path | None = None) -> Path:
+    return Path(git("rev-parse", "--show-toplevel", cwd=cwd).strip())
+
+
+def changed_files(ref: str | None = None, cwd: Path | None = None) -> set[Path]:
+    """The files changed since a git ref.
+
+    Without a ref the uncommitted changes, including untracked files, are returned.
+    """
+    root = repo_root(cwd)
+    names = git("diff", "--name-only", ref or "HEAD", cwd=root).splitlines()
+    if ref is None:
+        names.extend(git("ls-files", "--others", "--exclude-standard", cwd=root).splitlines())
+    return {(root / name).resolve() for name in names if name}
+
+
+def module_origin(module_name: str) -> Path | None:
+    """The source file of a module, without importing the module or its parent packages.
+
+    The module is looked up on sys.path one package level at a time, a name that is not a
+    module, like the class in "from pkg.mod import Class", is not found.
+    """
+    parts = module_name.split(".")
+    path = None
+    spec = None
+    for i in range(len(parts)):
+        if spec is not None:
+            if spec.submodule_search_locations is None:
+                return None
+            path = list(spec.submodule_search_locations)
+        try:
+            spec = PathFinder.find_spec(".".join(parts[: i + 1]), path)
+        except (ImportError, ValueError):
+            return None
+        if spec is None:
+            return None
+    if not spec.origin or not spec.origin.endswith(".py"):
+        return None
+    return Path(spec.origin).resolve()
+
+
+def lazy_attrs(tree: ast.Module) -> dict:
+    """The _LAZY_ATTRS mapping of a package __init__, see the computerboards package."""
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "_LAZY_ATTRS" for target in node.targets
+        ):
+            return ast.literal_eval(node.value)
+    return {}
+
+
+class ImportGraph:
+    """The import graph of the modules found below a root directory.
+
+    Args:
+        root: Only modules with a source file inside root are part of the graph.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root.resolve()
+        self._trees = {}
+        self._origins = {}
+
+    def origin(self, module_name: str) -> Path | None:
+        if module_name not in self._origins:
+            path = module_origin(module_name)
+            self._origins[module_name] = path if path is not None and path.is_relative_to(self.root) else None
+        return self._origins[module_name]
+
+    def tree(self, path: Path) -> ast.Module:
+        if path not in self._trees:
+            self._trees[path] = ast.parse(path.read_text(), filename=str(path))
+        return self._trees[path]
+
+    def resolve(self, module_name: str, attr: str | None = None) -> str:
+        """The module an attribute really comes from, following lazy package attributes."""
+        path = self.origin(module_name)
+        if attr and path is not None and path.name == "__init__.py":
+            return lazy_attrs(self.tree(path)).get(attr, module_name)
+        return module_name
+
+    def imports(self, module_name: str) -> set[str]:
+        """The modules imported anywhere in a module, including imports inside functions."""
+        path = self.origin(module_name)
+        if path is None:
+            return set()
+        package = module_name if path.name == "__init__.py" else module_name.rpartition(".")[0]
+        found = set()
+        for node in ast.walk(self.tree(path)):
+            if isinstance(node, ast.Import):
+                found.update(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom):
+                base = node.module or ""
+                if node.level:
+                    parent = package.rsplit(".", node.level - 1)[0] if node.level > 1 else package
+                    base = f"{parent}.{base}" if base else parent
+                found.add(base)
+                for alias in node.names:
+                    submodule = f"{base}.{alias.name}"
+                    if self.origin(submodule) is not None:
+                        found.add(submodule)
+                    else:
+                        found.add(self.resolve(base, alias.name))
+        # Importing a.b.c also runs a and a.b.
+        for name in list(found):
+            parts = name.split(".")
+            found.update(".".join(parts[:i]) for i in range(1, len(parts)))
+        return {name for name in found if self.origin(name) is not None}
+
+    def dependencies(self, module_name: str) -> set[str]:
+        """The module and every module it imports directly or indirectly."""
+        seen = set()
+        todo = [module_name]
+        while todo:
+            name = todo.pop()
+            if name in seen:
+                continue
+            seen.add(name)
+            todo.extend(self.imports(name) - seen)
+        return seen
+
+    def files(self, module_names) -> set[Path]:
+        return {path for path in (self.origin(name) for name in module_names) if path is not None}
+
+
+def entry_module(graph: ImportGraph, entry: PartEntry) -> str:
+    """The module that defines the class of a part entry."""
+    module_name, _, attr = entry.target.partition(":")
+    return graph.resolve(module_name, attr)
+
+
+def affected_entries(entries, changed: set[Path], graph: ImportGraph) -> list[PartEntry]:
+    """The entries whose source, or the source of anything they import, is in changed."""
+    affected = []
+    pipeline = graph.dependencies(BUILD_MODULE)
+    for entry in entries:
+        modules = graph.dependencies(entry_module(graph, entry)) | pipeline
+        hits = graph.files(modules) & changed
+        if hits:
+            logger.debug("%s is affected by %s", entry.part_no, ", ".join(sorted(str(hit) for hit in hits)))
+            affected.append(entry)
+    return affected
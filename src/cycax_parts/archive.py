@@ -0,0 +1,211 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Pack the build directory into a single compressed archive.
+
+The archive is a zip file with one directory per part:
+
+- Meshes of printable parts are converted to 3MF, itself a zipped mesh format.
+- STEP, STL of other parts and the JSON definitions are deflated.
+- manifest.json lists the members of every part with their size and hash, and the
+  tessellation settings the meshes were made with.
+
+Files are streamed into the archive, a part is never held in memory twice. A single part
+can be extracted without unpacking the rest since zip members are read independently:
+
+    python -m cycax_parts.archive build parts.zip
+    unzip parts.zip "conn-cube/*"
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import shutil
+import struct
+import sys
+import zipfile
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+from cycax_parts.tessellation import TESSELLATION_FILE
+
+logger = logging.getLogger(__name__)
+
+MANIFEST = "manifest.json"
+CHUNK_SIZE = 1024 * 1024
+STL_HEADER_SIZE = 84
+STL_TRIANGLE = struct.Struct("<12fH")
+
+CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="model" ContentType="application/vnd.ms-package.3dmanufacturing-3dmodel+xml"/>
+</Types>
+"""
+RELATIONSHIPS = """<?xml version="1.0" encoding="UTF-8"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Target="/3D/3dmodel.model" Id="rel0"
+ Type="http://schemas.microsoft.com/3dmanufacturing/2013/01/3dmodel"/>
+</Relationships>
+"""
+MODEL_HEADER = """<?xml version="1.0" encoding="UTF-8"?>
+<model unit="millimeter" xml:lang="en-US" xmlns="http://schemas.microsoft.com/3dmanufacturing/core/2015/02">
+<metadata name="Title">{name}</metadata>
+<resources>
+<object id="1" type="model">
+<mesh>
+"""
+MODEL_FOOTER = """</mesh>
+</object>
+</resources>
+<build>
+<item objectid="1"/>
+</build>
+</model>
+"""
+
+
+def is_binary_stl(path: Path) -> bool:
+    size = path.stat().st_size
+    if size < STL_HEADER_SIZE:
+        return False
+    with path.open("rb") as fh:
+        fh.seek(80)
+        (count,) = struct.unpack("<I", fh.read(4))
+    return size == STL_HEADER_SIZE + count * STL_TRIANGLE.size
+
+
+def iter_stl_triangles(path: Path):
+    """Yield the triangles of an ASCII or binary STL file as three (x, y, z) tuples."""
+    if is_binary_stl(path):
+        with path.open("rb") as fh:
+            fh.seek(STL_HEADER_SIZE)
+            while chunk := fh.read(STL_TRIANGLE.size * 4096):
+                for values in STL_TRIANGLE.iter_unpack(chunk):
+                    yield (values[3:6], values[6:9], values[9:12])
+        return
+    with path.open() as fh:
+        vertices = []
+        for line in fh:
+            words = line.split()
+            if words and words[0] == "vertex":
+                vertices.append(tuple(float(word) for word in words[1:4]))
+                if len(vertices) == 3:  # noqa: PLR2004
+                    yield tuple(vertices)
+                    vertices = []
+
+
+def write_3mf(stl_path: Path, fileobj, name: str):
+    """Convert an STL file to a 3MF package written to fileobj.
+
+    The STL is read twice, once to write the shared vertices and once for the triangles,
+    so only the vertex index is kept in memory.
+    """
+    with zipfile.ZipFile(fileobj, "w", compression=zipfile.ZIP_DEFLATED) as package:
+        package.writestr("[Content_Types].xml", CONTENT_TYPES)
+        package.writestr("_rels/.rels", RELATIONSHIPS)
+        with package.open("3D/3dmodel.model", "w", force_zip64=True) as model:
+            model.write(MODEL_HEADER.format(name=escape(name)).encode())
+            model.write(b"<vertices>\n")
+            index = {}
+            for triangle in iter_stl_triangles(stl_path):
+                for vertex in triangle:
+                    if vertex not in index:
+                        index[vertex] = len(index)
+                        model.write(b'<vertex x="%r" y="%r" z="%r"/>\n' % vertex)
+            model.write(b"</vertices>\n<triangles>\n")
+            for triangle in iter_stl_triangles(stl_path):
+                v1, v2, v3 = (index[vertex] for vertex in triangle)
+                # Skip triangles that collapsed when the vertices were merged.
+                if v1 != v2 and v3 not in (v1, v2):
+                    model.write(b'<triangle v1="%d" v2="%d" v3="%d"/>\n' % (v1, v2, v3))
+            model.write(b"</triangles>\n")
+            model.write(MODEL_FOOTER.encode())
+
+
+class HashingWriter:
+    """Wrap a writable file, counting and hashing what is written."""
+
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+        self.size = 0
+        self.digest = hashlib.sha256()
+
+    def write(self, data) -> int:
+        self.size += len(data)
+        self.digest.update(data)
+        return self.fileobj.write(data)
+
+    def flush(self):
+        self.fileobj.flush()
+
+
+def part_dirs(build_dir: Path) -> list[Path]:
+    """The directories below build_dir that hold a saved part."""
+    return sorted({path.parent for path in build_dir.rglob("*.json") if path.parent != build_dir})
+
+
+def export_archive(build_dir: Path, archive_path: Path, printable=None) -> dict:
+    """Stream the parts in build_dir into a compressed archive.
+
+    Args:
+        build_dir: The build directory.
+        archive_path: The zip file to create.
+        printable: Part numbers of the printable parts that are converted to 3MF, None for all.
+
+    Returns:
+        The manifest.
+    """
+    manifest = {"parts": {}}
+    with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for part_path in part_dirs(build_dir):
+            prefix = part_path.relative_to(build_dir).as_posix()
+            members = {}
+            for path in sorted(part_path.iterdir()):
+                if not path.is_file():
+                    continue
+                as_3mf = path.suffix.lower() == ".stl" and (printable is None or part_path.name in printable)
+                name = f"{prefix}/{path.stem}.3mf" if as_3mf else f"{prefix}/{path.name}"
+                # A 3MF is already compressed, store it as is.
+                compression = zipfile.ZIP_STORED if as_3mf else zipfile.ZIP_DEFLATED
+                info = zipfile.ZipInfo(name)
+                info.compress_type = compression
+                with archive.open(info, "w", force_zip64=True) as member:
+                    writer = HashingWriter(member)
+                    if as_3mf:
+                        write_3mf(path, writer, path.stem)
+                    else:
+                        with path.open("rb") as src:
+                            shutil.copyfileobj(src, writer, CHUNK_SIZE)
+                members[name] = {"size": writer.size, "sha256": writer.digest.hexdigest(), "source": path.name}
+            manifest["parts"][prefix] = members
+        record = build_dir / TESSELLATION_FILE
+        if record.is_file():
+            manifest["tessellation"] = json.loads(record.read_text())
+        archive.writestr(MANIFEST, json.dumps(manifest, indent=4))
+    logger.info("Archived %d parts to %s", len(manifest["parts"]), archive_path)
+    return manifest
+
+
+def extract_part(archive_path: Path, part: str, dest: Path) -> list[Path]:
+    """Extract the files of one part from an archive."""
+    with zipfile.ZipFile(archive_path) as archive:
+        manifest = json.loads(archive.read(MANIFEST))
+        names = list(manifest["parts"][part])
+        return [Path(archive.extract(name, dest)) for name in names]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Pack the build directory into a compressed archive.")
+    parser.add_argument("build_dir", type=Path, help="The build directory.")
+    parser.add_argument("archive", type=Path, help="The archive to create.")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    export_archive(args.build_dir, args.archive)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
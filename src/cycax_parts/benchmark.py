@@ -0,0 +1,169 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmarks of the part catalog.
+
+Every registered part is timed in three phases: construction (which includes definition()),
+save() and the build with PartEngineBuild123d. Every case assembly is timed as a whole.
+The results are written as JSON and can be compared to a stored baseline:
+
+    python -m cycax_parts.benchmark --output bench.json
+    python -m cycax_parts.benchmark --baseline bench.json --threshold 0.2
+
+The build cache and incremental builds are not used, every run does the full work.
+"""
+
+import argparse
+import json
+import logging
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from cycax_parts.cache import cycax_version
+from cycax_parts.registry import CASE, PART, default_registry
+
+logger = logging.getLogger(__name__)
+
+PHASES = ("definition", "save", "build")
+CASE_PHASE = "case"
+
+
+def timed(func, repeat: int = 1) -> float:
+    """The median wall time of calling func repeat times."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def bench_part(part_class, work_dir: Path, repeat: int = 3, *, engine: bool = True) -> dict:
+    """Time the phases of a single part."""
+    result = {"definition": timed(part_class, repeat)}
+    part = part_class()
+    result["save"] = timed(lambda: part.save(work_dir), repeat)
+    if engine:
+        from cycax.cycad.engines.part_build123d import PartEngineBuild123d
+
+        result["build"] = timed(lambda: PartEngineBuild123d().build(part))
+    return result
+
+
+def bench_case(part_class, work_dir: Path) -> dict:
+    """Time building a motherboard case assembly from scratch."""
+    from cycax_parts.build import build_case
+
+    return {CASE_PHASE: timed(lambda: build_case(part_class, work_dir))}
+
+
+def run(patterns=None, repeat: int = 3, *, engine: bool = True) -> dict:
+    registry = default_registry()
+    report = {
+        "meta": {
+            "created": datetime.now(tz=timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cycax": cycax_version(),
+            "repeat": repeat,
+            "engine": engine,
+        },
+        "results": {},
+    }
+    with tempfile.TemporaryDirectory(prefix="cycax-bench-") as tmp:
+        work_dir = Path(tmp)
+        for entry in registry.select(patterns, kind=PART):
+            logger.info("Benchmarking %s", entry.part_no)
+            report["results"][entry.part_no] = bench_part(entry.load(), work_dir, repeat, engine=engine)
+        if engine:
+            for entry in registry.select(patterns, kind=CASE):
+                logger.info("Benchmarking %s case", entry.part_no)
+                report["results"][entry.part_no] = bench_case(entry.load(), work_dir)
+    return report
+
+
+def compare(report: dict, baseline: dict, threshold: float, min_seconds: float = 0.005, thresholds=None) -> list:
+    """The regressions in report compared to baseline.
+
+    A phase regressed when it is slower than the baseline by more than the threshold fraction
+    and by more than min_seconds, the latter stops noise in very fast phases from failing a run.
+
+    Args:
+        report: The new benchmark results.
+        baseline: The stored benchmark results.
+        threshold: The allowed slow down as a fraction, 0.2 is 20%.
+        min_seconds: Differences smaller than this are ignored.
+        thresholds: Per phase thresholds overriding threshold.
+
+    Returns:
+        A list of (part_no, phase, baseline seconds, new seconds) tuples.
+    """
+    thresholds = thresholds or {}
+    regressions = []
+    for part_no, phases in report["results"].items():
+        base_phases = baseline.get("results", {}).get(part_no, {})
+        for phase, seconds in phases.items():
+            base = base_phases.get(phase)
+            if base is None:
+                continue
+            limit = thresholds.get(phase, threshold)
+            if seconds > base * (1 + limit) and seconds - base > min_seconds:
+                regressions.append((part_no, phase, base, seconds))
+    return regressions
+
+
+def parse_thresholds(values) -> dict:
+    thresholds = {}
+    for value in values or ():
+        phase, _, limit = value.partition("=")
+        if phase not in (*PHASES, CASE_PHASE) or not limit:
+            msg = f"Expected PHASE=FRACTION with PHASE one of {', '.join((*PHASES, CASE_PHASE))}, got {value}."
+            raise argparse.ArgumentTypeError(msg)
+        thresholds[phase] = float(limit)
+    return thresholds
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the CyCAx parts catalog.")
+    parser.add_argument("parts", nargs="*", help="Part numbers to benchmark, shell style wildcards are allowed.")
+    parser.add_argument("-o", "--output", type=Path, help="Write the results to this JSON file.")
+    parser.add_argument("-b", "--baseline", type=Path, help="Compare the results to this JSON file.")
+    parser.add_argument("-t", "--threshold", type=float, default=0.2, help="Allowed slow down, 0.2 is 20%%.")
+    parser.add_argument(
+        "--phase-threshold",
+        action="append",
+        metavar="PHASE=FRACTION",
+        help="Allowed slow down for one phase (definition, save, build or case).",
+    )
+    parser.add_argument("--min-seconds", type=float, default=0.005, help="Ignore differences smaller than this.")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="Repeat the fast phases and use the median.")
+    parser.add_argument("--no-engine", action="store_true", help="Skip the engine builds and the case assemblies.")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    report = run(args.parts, repeat=args.repeat, engine=not args.no_engine)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=4))
+    else:
+        json.dump(report, sys.stdout, indent=4)
+    if args.baseline is None:
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    regressions = compare(report, baseline, args.threshold, args.min_seconds, parse_thresholds(args.phase_threshold))
+    for part_no, phase, base, seconds in regressions:
+        logger.error(
+            "%s %s regressed: %.4fs -> %.4fs (%+.0f%%)", part_no, phase, base, seconds, 100 * (seconds / base - 1)
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,91 +2,414 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import argparse
 import logging
 import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import nullcontext
+from dataclasses import dataclass, field
 from pathlib import Path
 
-from cycax.cycad import Assembly, SheetMetal
-from cycax.cycad.engines.assembly_build123d import AssemblyBuild123d
-from cycax.cycad.engines.part_build123d import PartEngineBuild123d
-from dotenv import load_dotenv
-
-from cycax_parts.computerboards.atx import MicroATX, MiniITX, StandardATX
-from cycax_parts.computerboards.mini_itx import MiniItxMbLpPcie
-from cycax_parts.computerboards.odroid import (
-    OdroidGeneric,
-    OdroidH3,
-    OdroidH4,
-    OdroidH5,
-)
-from cycax_parts.construction.conn_cube import ConnCube
-from cycax_parts.powersupplies.apevia import ApeviaFlexATX
-from cycax_parts.powersupplies.meanwell import Meanwell15V
-from cycax_parts.powersupplies.pc import ATX
-from cycax_parts.powersupplies.silverstonetek import SilverstonetekFlexATX
-
-load_dotenv()
-if os.environ.get("DEBUG"):
-    logging.basicConfig(level=logging.DEBUG)
-else:
-    logging.basicConfig(level=logging.INFO)
+from cycax_parts.affected import ImportGraph, affected_entries, changed_files, repo_root
+from cycax_parts.archive import export_archive
+from cycax_parts.cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_SIZE, BuildCache, cached_build
+from cycax_parts.daemon import DAEMON_ENV, DaemonClient
+from cycax_parts.incremental import assembly_parts, build_assembly
+from cycax_parts.lod import LEVELS, LOD0, lod_path, mounting_keys, simplify_saved_part
+from cycax_parts.optimise import optimise_saved_part
+from cycax_parts.output import staged_output
+from cycax_parts.registry import CASE, PART, PartEntry, default_registry
+from cycax_parts.tessellation import PRINT, PROFILES, record_tessellation, tessellation_settings
+from cycax_parts.trace import get_tracer, span, summary, trace_path, write_trace
+from cycax_parts.workers import run_recycled
+
+logger = logging.getLogger(__name__)
+
+
+def setup_logging():
+    """Configure logging from the environment.
+
+    DEBUG enables debug logging and CYCAX_TRACE=trace.json records a trace of the build phases.
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    if os.environ.get("DEBUG"):
+        logging.basicConfig(level=logging.DEBUG)
+    else:
+        logging.basicConfig(level=logging.INFO)
+
+
+@dataclass
+class BuildResult:
+    """The outcome of a single build job."""
+
+    name: str
+    ok: bool
+    seconds: float
+    error: str = ""
+    events: list = field(default_factory=list)
+    printable: list = field(default_factory=list)
+    tessellation: dict = field(default_factory=dict)
 
 
 def motherboard_case(motherboard):
+    from cycax.cycad import Assembly, SheetMetal
+
     name = motherboard.part_no
-    assembly = Assembly(f"{name}_case")
-    assembly.add(motherboard)
-    upright = SheetMetal(
-        x_size=motherboard.x_size + 20,
-        y_size=motherboard.z_size + 10,
-        z_size=2,
-        part_no=f"{name}-upright",
+    with span("layout", name):
+        assembly = Assembly(f"{name}_case")
+        assembly.add(motherboard)
+        upright = SheetMetal(
+            x_size=motherboard.x_size + 20,
+            y_size=motherboard.z_size + 10,
+            z_size=2,
+            part_no=f"{name}-upright",
+        )
+        base = SheetMetal(
+            x_size=motherboard.x_size + 20,
+            y_size=motherboard.y_size + 10,
+            z_size=2,
+            part_no=f"{name}-base",
+        )
+
+        assembly.add(upright)
+        assembly.add(base)
+        upright.rotate("x")
+        base.level(front=upright.back, bottom=upright.bottom, left=upright.left)
+        motherboard.level(front=upright.back, bottom=base.top, left=base.left)
+        motherboard.move(x=10)
+        motherboard.level(front=upright.back, bottom=base.top, subtract=True)
+    return assembly
+
+
+def build_part(
+    part_class,
+    build_dir: Path,
+    cache: BuildCache | None = None,
+    params: dict | None = None,
+    lod: int = LOD0,
+    *,
+    tessellation: str = PRINT,
+) -> tuple[str, list, dict]:
+    """Save and build a single part.
+
+    Redundant cuts are removed from the saved definition before it is built and the engine
+    is skipped when the outputs for the definition are in the cache. Above LOD0 a proxy
+    of the part is built instead.
+
+    Returns:
+        The part number, a list with the part number if the part is printable and the
+        tessellation settings of the part.
+    """
+    from cycax.cycad import Print3D
+    from cycax.cycad.engines.part_build123d import PartEngineBuild123d
+
+    with span("definition", part_class.__name__) as record:
+        part = part_class(**(params or {}))
+        # Name the span like the other spans of the part.
+        record["part"] = part.part_no
+    with span("save", part.part_no):
+        part.save(build_dir)
+    with span("optimise", part.part_no):
+        optimise_saved_part(build_dir / part.part_no)
+        simplify_saved_part(build_dir / part.part_no, lod, mounting_keys(part))
+    settings = tessellation_settings(part, tessellation)
+    cached_build(part, build_dir / part.part_no, PartEngineBuild123d, cache, settings)
+    return part.part_no, [part.part_no] if isinstance(part, Print3D) else [], {part.part_no: settings}
+
+
+def build_case(
+    part_class,
+    build_dir: Path,
+    cache: BuildCache | None = None,
+    params: dict | None = None,
+    lod: int = LOD0,
+    *,
+    tessellation: str = PRINT,
+) -> tuple[str, list, dict]:
+    """Save and build the motherboard case assembly for a motherboard.
+
+    Only the members of the case whose definition changed since the previous build are rebuilt.
+
+    Returns:
+        The assembly name, the part numbers of the printable members and the tessellation
+        settings of the members.
+    """
+    from cycax.cycad import Print3D
+    from cycax.cycad.engines.assembly_build123d import AssemblyBuild123d
+    from cycax.cycad.engines.part_build123d import PartEngineBuild123d
+
+    with span("definition", part_class.__name__) as record:
+        part = part_class(**(params or {}))
+        # Name the span like the other spans of the part.
+        record["part"] = part.part_no
+    assembly = motherboard_case(part)
+    build_assembly(
+        assembly,
+        build_dir / assembly.name,
+        AssemblyBuild123d(part.part_no),
+        PartEngineBuild123d,
+        cache,
+        lod=lod,
+        tessellation=tessellation,
     )
-    base = SheetMetal(
-        x_size=motherboard.x_size + 20,
-        y_size=motherboard.y_size + 10,
-        z_size=2,
-        part_no=f"{name}-base",
+    members = assembly_parts(assembly)
+    return (
+        assembly.name,
+        [member.part_no for member in members if isinstance(member, Print3D)],
+        {f"{assembly.name}/{member.part_no}": tessellation_settings(member, tessellation) for member in members},
     )
 
-    assembly.add(upright)
-    assembly.add(base)
-    upright.rotate("x")
-    base.level(front=upright.back, bottom=upright.bottom, left=upright.left)
-    motherboard.level(front=upright.back, bottom=base.top, left=base.left)
-    motherboard.move(x=10)
-    motherboard.level(front=upright.back, bottom=base.top, subtract=True)
-    return assembly
 
+BUILDERS = {PART: build_part, CASE: build_case}
+
+
+def run_job(entry: PartEntry, build_dir: Path, **options) -> BuildResult:
+    """Build a registered part and capture the outcome instead of raising.
+
+    This is the unit of work handed to the process pool, a failing part must not stop the other jobs.
+    """
+    start = time.perf_counter()
+    tracer = get_tracer()
+    try:
+        with tracer.span(entry.kind, entry.part_no):
+            name, printable, tessellation = BUILDERS[entry.kind](
+                entry.load(), build_dir, params=dict(entry.params), **options
+            )
+    except Exception:
+        return BuildResult(
+            name=entry.part_no,
+            ok=False,
+            seconds=time.perf_counter() - start,
+            error=traceback.format_exc(),
+            events=tracer.drain(),
+        )
+    return BuildResult(
+        name=name,
+        ok=True,
+        seconds=time.perf_counter() - start,
+        events=tracer.drain(),
+        printable=printable,
+        tessellation=tessellation,
+    )
+
+
+def run_jobs(
+    jobs: list,
+    build_dir: Path,
+    workers: int = 1,
+    max_tasks: int | None = None,
+    max_rss_mb: float | None = None,
+    **options,
+) -> list[BuildResult]:
+    """Run the build jobs, in-process when workers is 1 else over a process pool.
+
+    With max_tasks or max_rss_mb the jobs run in worker processes that are recycled, see workers.py.
+    When a worker of the pool dies the jobs that did not finish are built again by run_recycled(), a job that
+    kills its worker twice is reported as failed.
+
+    Args:
+        jobs: The part entries to build.
+        build_dir: The directory the parts are saved to.
+        workers: The number of processes to use.
+        max_tasks: Recycle a worker after it built this many parts.
+        max_rss_mb: Recycle a worker when its resident memory is above this many MiB.
+        options: Keyword arguments passed on to every build function.
+    """
+    if max_tasks is not None or max_rss_mb is not None:
+        return run_recycled(jobs, build_dir, workers, max_tasks=max_tasks, max_rss_mb=max_rss_mb, **options)
+    results = []
+    if workers <= 1:
+        for entry in jobs:
+            result = run_job(entry, build_dir, **options)
+            log_result(result)
+            results.append(result)
+        return results
+
+    broken = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(run_job, entry, build_dir, **options): entry for entry in jobs}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except BrokenProcessPool:
+                # A worker died, the pool fails every job that had not finished.
+                broken.append(futures[future])
+                continue
+            log_result(result)
+            results.append(result)
+    if broken:
+        # Workers that are watched one by one find the job that kills its worker and build the others.
+        logger.warning("A build worker died, building the %d unfinished jobs in separate workers", len(broken))
+        results.extend(run_recycled(broken, build_dir, workers, **options))
+    return results
+
+
+def daemon_build(jobs: list, build_dir: Path, **options) -> list[BuildResult] | None:
+    """Build the jobs in the running build daemon, returns None when no daemon is running."""
+    client = DaemonClient()
+    if not client.ping():
+        logger.info("No build daemon on %s, building in this process", client.path)
+        return None
+    logger.info("Building in the daemon on %s", client.path)
+    results = client.build(jobs, build_dir, **options)
+    for result in results:
+        log_result(result)
+    return results
+
+
+def log_result(result: BuildResult):
+    if result.ok:
+        logger.info("Built %s in %.1fs", result.name, result.seconds)
+    else:
+        logger.error("Failed to build %s after %.1fs\n%s", result.name, result.seconds, result.error)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Build the CyCAx parts catalog.")
+    parser.add_argument("parts", nargs="*", help="Part numbers to build, shell style wildcards are allowed.")
+    parser.add_argument("-l", "--list", action="store_true", help="List the part numbers and exit.")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of parts to build in parallel (default: number of CPUs).",
+    )
+    parser.add_argument(
+        "--max-tasks",
+        type=int,
+        metavar="N",
+        help="Build in worker processes that are replaced after building N parts, bounds the memory use.",
+    )
+    parser.add_argument(
+        "--max-rss",
+        type=float,
+        metavar="MIB",
+        help="Build in worker processes that are replaced once they use more than MIB of memory.",
+    )
+    parser.add_argument(
+        "--changed-since",
+        metavar="REF",
+        help="Only build the parts affected by changes since the git ref.",
+    )
+    parser.add_argument(
+        "--affected",
+        action="store_true",
+        help="Only build the parts affected by the uncommitted changes in the working tree.",
+    )
+    parser.add_argument("--build-dir", type=Path, default=Path("./build"), help="Directory to write the parts to.")
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Send the jobs to the build daemon when one is running, also enabled by CYCAX_PARTS_DAEMON.",
+    )
+    parser.add_argument(
+        "--lod",
+        type=int,
+        choices=LEVELS,
+        default=LOD0,
+        help="Level of detail: 0 is the full part, 1 outer boxes and mounting holes, 2 bounding boxes only. "
+        "Proxies are written to a lodN directory in the build directory.",
+    )
+    parser.add_argument(
+        "--tessellation",
+        choices=list(PROFILES),
+        default=PRINT,
+        help="Tessellation profile of the STL files: draft for previews, print scales the tolerance to the part size. "
+        "A part can ask for a coarser profile. The settings used are recorded in tessellation.json.",
+    )
+    parser.add_argument(
+        "--archive",
+        type=Path,
+        metavar="ZIP",
+        help="Also pack the build directory into a compressed archive, printable parts as 3MF.",
+    )
+    parser.add_argument(
+        "--in-place",
+        action="store_true",
+        help="Build straight into the build directory, by default only the outputs that changed are written.",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Always run the engine, do not use the build cache.")
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR, help="Directory of the build cache.")
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_MAX_SIZE // 1024**2,
+        help="Size in MiB the build cache is trimmed to after a build.",
+    )
+    return parser.parse_args(argv)
 
-def main():
-    build_dir = Path("./build")
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    registry = default_registry()
+    if args.list:
+        for entry in registry.select(args.parts):
+            print(f"{entry.part_no:40} {entry.kind:6} {entry.target}")  # noqa: T201
+        return 0
+
+    setup_logging()
+    build_dir = lod_path(args.build_dir, args.lod)
     build_dir.mkdir(parents=True, exist_ok=True)
-    part_classes = [
-        ConnCube,
-        SilverstonetekFlexATX,
-        Meanwell15V,
-        ApeviaFlexATX,
-        ATX,
-        OdroidH3,
-        OdroidH4,
-        OdroidH5,
-        OdroidGeneric,
-    ]
-    for part_class in part_classes:
-        part = part_class()
-        part.save(build_dir)
-        cycax_server = PartEngineBuild123d()
-        cycax_server.build(part)
+    # The case assemblies are the slowest jobs, start them first so they do not end up as the tail of the run.
+    jobs = registry.select(args.parts, kind=CASE) + registry.select(args.parts, kind=PART)
+    if not jobs:
+        logger.error("No parts match %s", " ".join(args.parts))
+        return 1
+    if args.changed_since or args.affected:
+        changed = changed_files(args.changed_since)
+        jobs = affected_entries(jobs, changed, ImportGraph(repo_root()))
+        logger.info("%d changed files affect %d parts", len(changed), len(jobs))
+        if not jobs:
+            return 0
+    # Each job writes to its own part or assembly directory so the jobs do not clash in the build directory.
+    workers = max(1, min(args.jobs, len(jobs)))
+    cache = None if args.no_cache else BuildCache(args.cache_dir, max_size=args.cache_size * 1024**2)
+    # Only the directories of the jobs that succeeded are published, a failed job keeps its last good outputs.
+    built = set()
+    with nullcontext(build_dir) if args.in_place else staged_output(build_dir, built) as output_dir:
+        results = None
+        if args.daemon or os.environ.get(DAEMON_ENV):
+            results = daemon_build(jobs, output_dir, cache=cache, lod=args.lod, tessellation=args.tessellation)
+        if results is None:
+            results = run_jobs(
+                jobs,
+                output_dir,
+                workers=workers,
+                max_tasks=args.max_tasks,
+                max_rss_mb=args.max_rss,
+                cache=cache,
+                lod=args.lod,
+                tessellation=args.tessellation,
+            )
+        built.update(result.name for result in results if result.ok)
+        record_tessellation(
+            output_dir, {key: value for result in results for key, value in result.tessellation.items()}
+        )
+    if cache is not None:
+        cache.evict()
+    if args.archive:
+        printable = {part_no for result in results for part_no in result.printable}
+        export_archive(build_dir, args.archive, printable=printable)
+    path = trace_path()
+    if path is not None:
+        events = [event for result in results for event in result.events]
+        write_trace(path, events)
+        logger.info("Wrote the build trace to %s, the slowest spans:\n%s", path, "\n".join(summary(events)))
 
-    part_classes = [MiniItxMbLpPcie, StandardATX, MicroATX, MiniITX]
-    for part_class in part_classes:
-        part = part_class()
-        assembly = motherboard_case(part)
-        assembly.save(build_dir / assembly.name)
-        cycax_server = PartEngineBuild123d()
-        assembly.build(engine=AssemblyBuild123d(part.part_no), part_engines=[cycax_server])
+    failed = [result for result in results if not result.ok]
+    logger.info("Built %d of %d jobs", len(results) - len(failed), len(results))
+    if failed:
+        logger.error("Failed: %s", ", ".join(result.name for result in failed))
+        return 1
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,220 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""A local content-addressed cache for the outputs of the part engines.
+
+The key is a hash of the saved part definition, the engine, the cycax version and the
+tessellation settings.
+When nothing in that key changed the STL/STEP outputs are restored from the cache
+instead of running the CAD kernel again. The part number is left out of the key, the
+outputs are stored with a placeholder in their file names and renamed to the part number
+of the part they are restored for, so variants that only differ in their part number
+share an entry. The outputs of such a variant keep the names inside the STEP file of the
+part that was built first.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+from cycax_parts.tessellation import engine_tolerances, retessellate
+from cycax_parts.trace import span
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(os.environ.get("CYCAX_PARTS_CACHE", "~/.cache/cycax_parts")).expanduser()
+DEFAULT_MAX_SIZE = 2 * 1024**3  # 2 GiB
+PART_NO_PLACEHOLDER = "{part_no}"
+
+
+def cycax_version() -> str:
+    try:
+        return version("cycax")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def engine_name(engine) -> str:
+    """A stable name for an engine class or instance."""
+    engine_class = engine if isinstance(engine, type) else type(engine)
+    return f"{engine_class.__module__}.{engine_class.__qualname__}"
+
+
+def definition_files(part_path: Path) -> list[Path]:
+    """The part definition files, as written by part.save(), in a part directory."""
+    return sorted(part_path.glob("*.json"))
+
+
+def artifact_files(part_path: Path) -> list[Path]:
+    """The files produced by the engine in a part directory, that is everything but the definition."""
+    return sorted(path for path in part_path.iterdir() if path.is_file() and path.suffix != ".json")
+
+
+NAME_KEYS = ("name", "part_no")
+
+
+def definition_digest(part_path: Path, *, ignore_name: bool = False) -> str | None:
+    """A stable hash of the saved part definition.
+
+    The JSON is normalised before hashing so key order and whitespace does not change the hash.
+    With ignore_name parts that only differ in their part number have the same hash.
+    Returns None when the part directory holds no definition.
+    """
+    files = definition_files(part_path)
+    if not files:
+        return None
+    digest = hashlib.sha256()
+    for path in files:
+        data = json.loads(path.read_text())
+        if ignore_name and isinstance(data, dict):
+            data = {key: value for key, value in data.items() if key not in NAME_KEYS}
+        else:
+            digest.update(path.name.encode())
+        digest.update(json.dumps(data, sort_keys=True, separators=(",", ":")).encode())
+    return digest.hexdigest()
+
+
+def replace_file(src: Path, dest: Path, *, link: bool = False):
+    """Copy or hard link src to dest.
+
+    An existing dest is removed first rather than written to, it may be a hard link shared with another part.
+    """
+    dest.unlink(missing_ok=True)
+    if link:
+        try:
+            os.link(src, dest)
+        except OSError:
+            pass
+        else:
+            return
+    shutil.copy2(src, dest)
+
+
+def directory_size(path: Path) -> int:
+    return sum(item.stat().st_size for item in path.rglob("*") if item.is_file())
+
+
+class BuildCache:
+    """Content-addressed store of engine outputs with size based LRU eviction.
+
+    Each entry is a directory named after its key. The modification time of the entry
+    is updated on every hit, eviction removes the least recently used entries first.
+
+    Args:
+        path: The directory the cache lives in.
+        max_size: The size in bytes the cache is trimmed to by evict().
+    """
+
+    def __init__(self, path: Path = DEFAULT_CACHE_DIR, max_size: int = DEFAULT_MAX_SIZE):
+        self.path = Path(path)
+        self.max_size = max_size
+
+    def key(self, part_path: Path, engine, tessellation: dict | None = None) -> str | None:
+        """The cache key for a saved part built with the given engine and meshed with the tessellation settings."""
+        digest = definition_digest(part_path, ignore_name=True)
+        if digest is None:
+            return None
+        key = f"{digest}:{engine_name(engine)}:{cycax_version()}"
+        if tessellation is not None:
+            key = f"{key}:{json.dumps(tessellation, sort_keys=True)}"
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def entry_path(self, key: str) -> Path:
+        return self.path / key[:2] / key
+
+    def restore(self, key: str, part_path: Path, part_no: str) -> bool:
+        """Copy the cached outputs into the part directory, named for part_no, returns False on a cache miss."""
+        entry = self.entry_path(key)
+        if not entry.is_dir():
+            return False
+        for src in entry.iterdir():
+            replace_file(src, part_path / src.name.replace(PART_NO_PLACEHOLDER, part_no, 1))
+        # Mark the entry as recently used.
+        os.utime(entry)
+        return True
+
+    def store(self, key: str, part_path: Path, part_no: str):
+        """Add the engine outputs of part_no in the part directory to the cache."""
+        entry = self.entry_path(key)
+        if entry.is_dir():
+            return
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        # Populate a temporary directory and rename it so parallel builds never see a partial entry.
+        tmp_path = Path(tempfile.mkdtemp(dir=entry.parent, prefix=".tmp-"))
+        try:
+            for src in artifact_files(part_path):
+                shutil.copy2(src, tmp_path / src.name.replace(part_no, PART_NO_PLACEHOLDER, 1))
+            tmp_path.rename(entry)
+        except OSError:
+            # Another process stored the same entry first.
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+    def entries(self) -> list[Path]:
+        if not self.path.is_dir():
+            return []
+        return [entry for entry in self.path.glob("*/*") if entry.is_dir() and not entry.name.startswith(".")]
+
+    def evict(self) -> int:
+        """Remove the least recently used entries until the cache fits in max_size, returns the bytes freed."""
+        entries = []
+        total = 0
+        for entry in self.entries():
+            size = directory_size(entry)
+            entries.append((entry.stat().st_mtime, size, entry))
+            total += size
+        freed = 0
+        for _mtime, size, entry in sorted(entries):
+            if total - freed <= self.max_size:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            freed += size
+        if freed:
+            logger.info("Evicted %d bytes from the build cache", freed)
+        return freed
+
+
+def cached_build(
+    part, part_path: Path, engine_class, cache: BuildCache | None, tessellation: dict | None = None
+) -> bool:
+    """Build a saved part with the engine unless the outputs can be restored from the cache.
+
+    Args:
+        part: The part, it must already be saved to part_path.
+        part_path: The directory the part was saved to.
+        engine_class: The part engine class, it is only instantiated on a cache miss.
+        cache: The cache to use, None disables caching.
+        tessellation: The tessellation settings the STL is meshed with, see tessellation.py. None keeps the
+            mesh of the engine.
+
+    Returns:
+        True when the outputs came from the cache.
+    """
+    key = cache.key(part_path, engine_class, tessellation) if cache is not None else None
+    if key is not None:
+        with span("cache restore", part.part_no):
+            restored = cache.restore(key, part_path, part.part_no)
+        if restored:
+            logger.debug("Restored %s from the build cache", part.part_no)
+            return True
+    # Outputs may be hard links shared with other parts, never let the engine write through them.
+    for path in artifact_files(part_path):
+        path.unlink()
+    # The engine does the boolean operations and the export in one call.
+    with span("engine", part.part_no), engine_tolerances(engine_class, tessellation) as meshed:
+        engine = engine_class()
+        engine.build(part)
+        # The engine holds the kernel shapes of the part, they are not needed after the export.
+        del engine
+    if tessellation is not None and not meshed:
+        with span("tessellate", part.part_no):
+            retessellate(part_path, tessellation)
+    if key is not None:
+        with span("cache store", part.part_no):
+            cache.store(key, part_path, part.part_no)
+    return False
@@ -1,3 +1,50 @@
 # SPDX-FileCopyrightText: 2025 Tsolo.io
 #
 # SPDX-License-Identifier: Apache-2.0
+
+"""Computer boards, motherboards and single board computers.
+
+The part classes are imported on first use, importing the package does not import the CAD kernel.
+"""
+
+import importlib
+
+_LAZY_ATTRS = {
+    "BaseATX": "cycax_parts.computerboards.atx",
+    "MicroATX": "cycax_parts.computerboards.atx",
+    "MiniITX": "cycax_parts.computerboards.atx",
+    "StandardATX": "cycax_parts.computerboards.atx",
+    "MiniItxMb": "cycax_parts.computerboards.mini_itx",
+    "MiniItxMbLpPcie": "cycax_parts.computerboards.mini_itx",
+    "OdroidGeneric": "cycax_parts.computerboards.odroid",
+    "OdroidH3": "cycax_parts.computerboards.odroid",
+    "OdroidH4": "cycax_parts.computerboards.odroid",
+    "OdroidH5": "cycax_parts.computerboards.odroid",
+}
+
+__all__ = [
+    "BaseATX",
+    "MicroATX",
+    "MiniITX",
+    "MiniItxMb",
+    "MiniItxMbLpPcie",
+    "OdroidGeneric",
+    "OdroidH3",
+    "OdroidH4",
+    "OdroidH5",
+    "StandardATX",
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY_ATTRS})
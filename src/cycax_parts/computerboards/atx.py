@@ -14,6 +14,11 @@ Orientation of the mother board:
 
 from cycax.cycad import Print3D
 
+from cycax_parts.form_factors import ATX_MOUNTING, BOARD_CONNECTORS
+from cycax_parts.patterns import HolePattern, HoleSpec, mounting
+
+DEFAULT_STANDOFF = 8.0
+
 
 def atx_mounting_holes():
     """
@@ -22,32 +27,12 @@ def atx_mounting_holes():
     Top is the component side.
     """
     # This is the mounting holes as seen from the top.
-    # Mounting holes
-
-    inches = {  # These values are in inches.
-        "A": (11.35, 0.4),
-        "B": (8.25, 0.4),
-        "C": (6.45, 0.4),
-        "F": (0.25, 1.3),
-        "G": (11.35, 6.5),
-        "H": (6.45, 6.5),
-        "J": (0.25, 6.5),
-        "K": (11.35, 9.35),
-        "L": (6.45, 9.35),
-        "M": (0.25, 9.35),
-        "R": (9.05, 6.5),
-        "S": (8.25, 6.5),
-    }
-    in_mm = {}
-    for name, pos in inches.items():
-        # Convert the inches to mm.
-        in_mm[name] = (pos[0] * 25.4 + 3.8, pos[1] * 25.4 + 3.3)
-    return in_mm
+    return ATX_MOUNTING.as_dict()
 
 
 def atx_connectors():
     """Some random holes to mark the connector end of the Motherboard."""
-    return ((20, 20), (40, 20), (60, 20))
+    return BOARD_CONNECTORS.positions
 
 
 class BaseATX(Print3D):
@@ -61,7 +46,12 @@ class BaseATX(Print3D):
     board_y_size = 0
 
     def __init__(
-        self, *, standoff: float = 8.0, desktop: bool = True, pcie_full_height: bool = False, pcie_cards: int = 1
+        self,
+        *,
+        standoff: float = DEFAULT_STANDOFF,
+        desktop: bool = True,
+        pcie_full_height: bool = False,
+        pcie_cards: int = 1,
     ):
         self.pcie_full_height = pcie_full_height
         self.pcie_cards = pcie_cards
@@ -71,6 +61,8 @@ class BaseATX(Print3D):
         else:
             pci_type = "full" if self.pcie_full_height else "half"
             part_no = f"{self.part_no}-{pcie_cards}{pci_type}"
+        if standoff != DEFAULT_STANDOFF:  # Only non default standoffs are in the part number.
+            part_no = f"{part_no}-s{standoff:g}"
         super().__init__(
             part_no=part_no,
             x_size=self.board_x_size,
@@ -80,15 +72,12 @@ class BaseATX(Print3D):
         self.colour = "blue"
 
     def definition(self):
-        for pos in atx_mounting_holes().values():
-            if pos[0] < self.x_size and pos[1] < self.y_size:
-                self.top.hole(pos=pos, diameter=4)
-                bpos = (pos[0], self.y_size - pos[1])
-                self.bottom.hole(pos=bpos, diameter=3.2, external_subtract=True)
+        holes = ATX_MOUNTING.inside(self.x_size, self.y_size)
+        with mounting(self):
+            HolePattern(holes, HoleSpec(4)).apply(self.top)
+            HolePattern(holes.mirrored_y(self.y_size), HoleSpec(3.2, external_subtract=True)).apply(self.bottom)
         # A few silly features to identify the connector end.
-        for pos in atx_connectors():
-            if pos[0] < self.x_size and pos[1] < self.z_size:
-                self.front.hole(pos=pos, diameter=10, depth=5)
+        HolePattern(BOARD_CONNECTORS.inside(self.x_size, self.z_size), HoleSpec(10, depth=5)).apply(self.front)
         # Trim off the material not part of the face.
         self.front.box(pos=(6.25 * 25.4, 0), depth=3.3, length=self.x_size, width=self.z_size)
         # self.left.box(pos=(self.y_size+3.3,10), depth=3.8, length=self.y_size, width=self.z_size-20)
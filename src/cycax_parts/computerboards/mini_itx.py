@@ -5,7 +5,9 @@
 
 from cycax.cycad import Print3D
 
-MINIITX_PCB = 170  # Size of the PCB of a mini-itx board. The PCB is square.
+from cycax_parts.form_factors import MINI_ITX_MOUNTING, MINIITX_PCB  # noqa: F401
+from cycax_parts.patterns import mounting
+
 MINIITX_X_SIZE = 173  # From Spec: 172.62 = 6.35 + 7.52 + 158.75
 MINIITX_Y_SIZE = 172  #  Measure 2mm over.
 
@@ -17,19 +19,7 @@ def mini_itx_mounting_holes():
     Top is the component side.
     """
     # This is the mounting holes as seen from the top.
-    # Mounting holes
-    lr_holes = 157.48  # Distance between Left-Right holes.
-    lfb_holes = 154.94  # Distance between Front-Back holes on the left.
-    rfb_holes = 132.08  # Distance between Front-Back holes on the right.
-    l_edge = 6.35  # Holes on left from edge
-    f_edge = MINIITX_PCB - lfb_holes - 10.16  # The spec gives the distance from the back.
-
-    return (
-        (l_edge, f_edge),
-        (l_edge, f_edge + lfb_holes),
-        (l_edge + lr_holes, f_edge),
-        (l_edge + lr_holes, f_edge + rfb_holes),
-    )
+    return MINI_ITX_MOUNTING.positions
 
 
 class MiniItxMb(Print3D):
@@ -51,9 +41,10 @@ class MiniItxMb(Print3D):
 
     def definition(self):
         for pos in mini_itx_mounting_holes():
-            self.top.hole(pos=pos, diameter=4)
-            bpos = (pos[0], self.y_size - pos[1])
-            self.bottom.hole(pos=bpos, diameter=3.2, external_subtract=True)
+            with mounting(self):
+                self.top.hole(pos=pos, diameter=4)
+                bpos = (pos[0], self.y_size - pos[1])
+                self.bottom.hole(pos=bpos, diameter=3.2, external_subtract=True)
             # A few silly features to identify the back.
             self.back.hole(pos=(20, 20), diameter=10, depth=5)
             self.back.hole(pos=(40, 20), diameter=10, depth=5)
@@ -85,9 +76,10 @@ class MiniItxMbLpPcie(Print3D):
         # TODO: Add vent holes/slots for NIC.
         for _pos in mini_itx_mounting_holes():
             pos = (_pos[0] + pcie_extra, _pos[1])
-            self.top.hole(pos=pos, diameter=4)
-            bpos = (pos[0], self.y_size - pos[1])
-            self.bottom.hole(pos=bpos, diameter=3.2, external_subtract=True)
+            with mounting(self):
+                self.top.hole(pos=pos, diameter=4)
+                bpos = (pos[0], self.y_size - pos[1])
+                self.bottom.hole(pos=bpos, diameter=3.2, external_subtract=True)
             # A few silly features to identify the back.
             self.back.hole(pos=(20, 20), diameter=10, depth=5)
             self.back.hole(pos=(40, 20), diameter=10, depth=5)
@@ -1,7 +1,20 @@
 "Various Models of Odroids"
 
 from cycax.cycad import Cuboid
-from cycax.cycad.engines.part_build123d import PartEngineBuild123d
+
+from cycax_parts.form_factors import (
+    ODROID_GENERIC_H3_MOUNTING,
+    ODROID_GENERIC_H4_MOUNTING,
+    ODROID_H3_LENGTH,
+    ODROID_H3_MOUNTING,
+    ODROID_H4_MOUNTING,
+    ODROID_H5_MOUNTING,
+    ODROID_NANO_ITX_LENGTH,
+)
+from cycax_parts.patterns import ODROID_MOUNTING, HolePattern, mounting
+
+DEFAULT_STANDOFF_H3 = 12
+DEFAULT_STANDOFF_NANO_ITX = 6
 
 
 class OdroidH3(Cuboid):
@@ -12,9 +25,9 @@ class OdroidH3(Cuboid):
     https://wiki.odroid.com/odroid-h3/hardware#board_dimensions
     """
 
-    def __init__(self, *, standoff: float = 12):
-        self.length = 110
-        self.width = 110
+    def __init__(self, *, standoff: float = DEFAULT_STANDOFF_H3):
+        self.length = ODROID_H3_LENGTH
+        self.width = ODROID_H3_LENGTH
         self.overhang = 5  # Overhang of connectors in front of board
         if standoff > 10:  # Components reach 10 mm below the board
             self.height = 2 + 19 + 16 + standoff
@@ -22,7 +35,7 @@ class OdroidH3(Cuboid):
             msg = "The length of the standoff must be greater than 10 mm."
             raise ValueError(msg)
         super().__init__(
-            part_no="OdroidH3",
+            part_no="OdroidH3" if standoff == DEFAULT_STANDOFF_H3 else f"OdroidH3-s{standoff:g}",
             x_size=self.length,
             y_size=self.width + self.overhang,
             z_size=self.height,
@@ -37,14 +50,8 @@ class OdroidH3(Cuboid):
             self.front.box(pos=(sq_x, sq_y), length=10, width=10, depth=5)
 
         # Mounting holes
-        self.bottom.hole(pos=(3.81, 3.81), diameter=3.51)
-        self.bottom.hole(pos=(3.81, 3.81), diameter=3.2, external_subtract=True)
-        self.bottom.hole(pos=(self.x_size - 3.96, 3.81), diameter=3.51)
-        self.bottom.hole(pos=(self.x_size - 3.96, 3.81), diameter=3.2, external_subtract=True)
-        self.bottom.hole(pos=(3.81, 3.81 + 88.41), diameter=3.51)
-        self.bottom.hole(pos=(3.81, 3.81 + 88.41), diameter=3.2, external_subtract=True)
-        self.bottom.hole(pos=(self.x_size - 3.96, 3.81 + 81.43), diameter=3.51)
-        self.bottom.hole(pos=(self.x_size - 3.96, 3.81 + 81.43), diameter=3.2, external_subtract=True)
+        with mounting(self):
+            HolePattern(ODROID_H3_MOUNTING, ODROID_MOUNTING).apply(self.bottom)
 
 
 class OdroidH4(Cuboid):
@@ -55,9 +62,9 @@ class OdroidH4(Cuboid):
     https://wiki.odroid.com/odroid-h4/hardware#board_dimensions
     """
 
-    def __init__(self, *, standoff: float = 6):
-        self.length = 120
-        self.width = 120
+    def __init__(self, *, standoff: float = DEFAULT_STANDOFF_NANO_ITX):
+        self.length = ODROID_NANO_ITX_LENGTH
+        self.width = ODROID_NANO_ITX_LENGTH
         self.overhang = 5  # Overhang of connectors in front of board
         if standoff > 5:  # Components reach 5.2 mm below the board
             self.height = 2 + 35 + standoff
@@ -65,7 +72,7 @@ class OdroidH4(Cuboid):
             msg = "The length of the standoff must be greater than 5 mm."
             raise ValueError(msg)
         super().__init__(
-            part_no="OdroidH4",
+            part_no="OdroidH4" if standoff == DEFAULT_STANDOFF_NANO_ITX else f"OdroidH4-s{standoff:g}",
             x_size=self.length,
             y_size=self.width + self.overhang,
             z_size=self.height,
@@ -80,20 +87,8 @@ class OdroidH4(Cuboid):
             self.front.box(pos=(sq_x, sq_y), length=10, width=10, depth=5)
 
         # Mounting holes
-        self.bottom.hole(pos=(3.81, 3.81), diameter=3.51)
-        self.bottom.hole(pos=(3.81, 3.81), diameter=3.2, external_subtract=True)
-        self.bottom.hole(pos=(self.x_size - 3.96, 3.81), diameter=3.51)
-        self.bottom.hole(pos=(self.x_size - 3.96, 3.81), diameter=3.2, external_subtract=True)
-        self.bottom.hole(pos=(3.81, 3.81 + 98.41), diameter=3.51)
-        self.bottom.hole(pos=(3.81, 3.81 + 98.41), diameter=3.2, external_subtract=True)
-        self.bottom.hole(pos=(3.81 + 16.36, 3.81 + 72.37), diameter=3.51)
-        self.bottom.hole(pos=(3.81 + 16.36, 3.81 + 72.37), diameter=3.2, external_subtract=True)
-        self.bottom.hole(pos=(self.x_size - 13.96, 3.81 + 91.42), diameter=3.51)
-        self.bottom.hole(
-            pos=(self.x_size - 13.96, 3.81 + 91.42),
-            diameter=3.2,
-            external_subtract=True,
-        )
+        with mounting(self):
+            HolePattern(ODROID_H4_MOUNTING, ODROID_MOUNTING).apply(self.bottom)
 
 
 class OdroidH5(Cuboid):
@@ -104,9 +99,9 @@ class OdroidH5(Cuboid):
     https://wiki.odroid.com/odroid-h5/hardware#board_dimensions
     """
 
-    def __init__(self, *, standoff: float = 6):
-        self.length = 120
-        self.width = 120
+    def __init__(self, *, standoff: float = DEFAULT_STANDOFF_NANO_ITX):
+        self.length = ODROID_NANO_ITX_LENGTH
+        self.width = ODROID_NANO_ITX_LENGTH
         self.overhang = 3  # Overhang of connectors in front of board
         if standoff > 5:  # Components reach 5.2 mm below the board
             self.height = 2 + 31 + standoff
@@ -114,7 +109,7 @@ class OdroidH5(Cuboid):
             msg = "The length of the standoff must be greater than 5 mm."
             raise ValueError(msg)
         super().__init__(
-            part_no="OdroidH5",
+            part_no="OdroidH5" if standoff == DEFAULT_STANDOFF_NANO_ITX else f"OdroidH5-s{standoff:g}",
             x_size=self.length,
             y_size=self.width + self.overhang,
             z_size=self.height,
@@ -129,18 +124,8 @@ class OdroidH5(Cuboid):
             self.front.box(pos=(sq_x, sq_y), length=10, width=10, depth=5)
 
         # Mounting holes
-        self.bottom.hole(pos=(3.81, 3.81), diameter=3.51)
-        self.bottom.hole(pos=(3.81, 3.81), diameter=3.2, external_subtract=True)
-        self.bottom.hole(pos=(self.x_size - 3.96, 3.81), diameter=3.51)
-        self.bottom.hole(pos=(self.x_size - 3.96, 3.81), diameter=3.2, external_subtract=True)
-        self.bottom.hole(pos=(3.81, 3.81 + 98.41), diameter=3.51)
-        self.bottom.hole(pos=(3.81, 3.81 + 98.41), diameter=3.2, external_subtract=True)
-        self.bottom.hole(pos=(self.x_size - 13.96, 3.81 + 91.42), diameter=3.51)
-        self.bottom.hole(
-            pos=(self.x_size - 13.96, 3.81 + 91.42),
-            diameter=3.2,
-            external_subtract=True,
-        )
+        with mounting(self):
+            HolePattern(ODROID_H5_MOUNTING, ODROID_MOUNTING).apply(self.bottom)
 
 
 class OdroidGeneric(Cuboid):
@@ -156,9 +141,9 @@ class OdroidGeneric(Cuboid):
     Mounting holes are based on the H3 and H4.
     """
 
-    def __init__(self, *, standoff: float = 12):
-        self.length = 120
-        self.width = 120
+    def __init__(self, *, standoff: float = DEFAULT_STANDOFF_H3):
+        self.length = ODROID_NANO_ITX_LENGTH
+        self.width = ODROID_NANO_ITX_LENGTH
         self.overhang = 5  # Overhang of connectors in front of board
         if standoff > 10:  # Components reach 10 mm below the board
             self.height = 2 + 19 + 16 + standoff
@@ -166,7 +151,7 @@ class OdroidGeneric(Cuboid):
             msg = "The length of the standoff must be greater than 10 mm."
             raise ValueError(msg)
         super().__init__(
-            part_no="Odroid-Generic",
+            part_no="Odroid-Generic" if standoff == DEFAULT_STANDOFF_H3 else f"Odroid-Generic-s{standoff:g}",
             x_size=self.length,
             y_size=self.width + self.overhang,
             z_size=self.height,
@@ -180,30 +165,9 @@ class OdroidGeneric(Cuboid):
             sq_y = 5
             self.front.box(pos=(sq_x, sq_y), length=10, width=10, depth=5)
 
-        # Mounting holes H3
-        self.bottom.hole(pos=(3.81, 3.81), diameter=3.51)
-        self.bottom.hole(pos=(3.81, 3.81), diameter=3.2, external_subtract=True)
-        self.bottom.hole(pos=(self.x_size - 13.96, 3.81), diameter=3.51)
-        self.bottom.hole(pos=(self.x_size - 13.96, 3.81), diameter=3.2, external_subtract=True)
-        self.bottom.hole(pos=(3.81, 3.81 + 88.41), diameter=3.51)
-        self.bottom.hole(pos=(3.81, 3.81 + 88.41), diameter=3.2, external_subtract=True)
-        self.bottom.hole(pos=(self.x_size - 13.96, 3.81 + 81.43), diameter=3.51)
-        self.bottom.hole(
-            pos=(self.x_size - 13.96, 3.81 + 81.43),
-            diameter=3.2,
-            external_subtract=True,
-        )
+        with mounting(self):
+            # Mounting holes H3
+            HolePattern(ODROID_GENERIC_H3_MOUNTING, ODROID_MOUNTING).apply(self.bottom)
 
-        # Mounting holes H4
-        self.bottom.hole(pos=(self.x_size - 3.96, 3.81), diameter=3.51)
-        self.bottom.hole(pos=(self.x_size - 3.96, 3.81), diameter=3.2, external_subtract=True)
-        self.bottom.hole(pos=(3.81, 3.81 + 98.41), diameter=3.51)
-        self.bottom.hole(pos=(3.81, 3.81 + 98.41), diameter=3.2, external_subtract=True)
-        self.bottom.hole(pos=(3.81 + 16.36, 3.81 + 72.37), diameter=3.51)
-        self.bottom.hole(pos=(3.81 + 16.36, 3.81 + 72.37), diameter=3.2, external_subtract=True)
-        self.bottom.hole(pos=(self.x_size - 13.96, 3.81 + 91.42), diameter=3.51)
-        self.bottom.hole(
-            pos=(self.x_size - 13.96, 3.81 + 91.42),
-            diameter=3.2,
-            external_subtract=True,
-        )
+            # Mounting holes H4
+            HolePattern(ODROID_GENERIC_H4_MOUNTING, ODROID_MOUNTING).apply(self.bottom)
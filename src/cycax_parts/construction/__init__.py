@@ -2,3 +2,32 @@
 # SPDX-FileCopyrightText: 2025 Tsolo.io
 #
 # SPDX-License-Identifier: Apache-2.0
+
+"""Parts used to construct enclosures.
+
+The part classes are imported on first use, importing the package does not import the CAD kernel.
+"""
+
+import importlib
+
+_LAZY_ATTRS = {
+    "ConnCube": "cycax_parts.construction.conn_cube",
+}
+
+__all__ = [
+    "ConnCube",
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY_ATTRS})
@@ -5,9 +5,10 @@
 from pathlib import Path
 
 from cycax.cycad import Print3D
-from cycax.cycad.engines.part_server import PartEngineServer
 from cycax.cycad.features import NutCutOut
 
+from cycax_parts.patterns import mounting
+
 
 class ConnCube(Print3D):
     """A cube use for fixing 3 sides together with M3 bolts."""
@@ -29,9 +30,10 @@ class ConnCube(Print3D):
             x = 7 if xb else 4
             y = 7 if yb else 4
             pos = (x, y)
-            side.hole(pos=pos, diameter=3.2, external_subtract=True)
-            side.hole(pos=pos, diameter=3.0, depth=3)
-            side.hole(pos=pos, diameter=2.9)  # Through everything
+            with mounting(self):
+                side.hole(pos=pos, diameter=3.2, external_subtract=True)
+                side.hole(pos=pos, diameter=3.0, depth=3)
+                side.hole(pos=pos, diameter=2.9)  # Through everything
             side.nut(pos=pos, nut_type="M3", sink=1, vertical=xb)  # Coordinates based on center of the Nut.
 
         # Create the holes for the nuts to slide in.
@@ -54,6 +56,8 @@ class ConnCube(Print3D):
 
 
 if __name__ == "__main__":
+    from cycax.cycad.engines.part_server import PartEngineServer
+
     part = ConnCube()
     part.save(Path("./build"))
     cycax_server = PartEngineServer()
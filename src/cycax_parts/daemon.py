@@ -0,0 +1,320 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""A long running build daemon that keeps the CAD kernel loaded.
+
+The daemon listens on a Unix socket and keeps a pool of worker processes that imported
+the CAD kernel when they started, so a build request does not pay for the interpreter
+and kernel startup. The worker pool is replaced when the package sources change so the
+workers never build from stale modules.
+
+The protocol is one JSON object per line in each direction::
+
+    {"op": "build", "jobs": [{"part_no": "conn-cube", "target": "cycax_parts.construction:ConnCube",
+     "kind": "part", "params": []}], "build_dir": "/abs/build", "lod": 0, "tessellation": "print",
+     "cache_dir": "/abs/cache"}
+    {"ok": true, "results": [{"name": "conn-cube", "ok": true, "seconds": 0.4, "artifacts": ["/abs/build/..."]}]}
+
+Other requests are {"op": "ping"} and {"op": "shutdown"}. build.py sends its jobs to the
+daemon when it runs and CYCAX_PARTS_DAEMON is set or --daemon is given.
+
+Only parts in the registry are built, a job names a registered part class and may only
+change its part number and parameters. The socket is only accessible to the user that
+started the daemon. A job whose worker dies is reported as failed and the pool is
+replaced.
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, fields
+from pathlib import Path
+
+from cycax_parts.cache import DEFAULT_MAX_SIZE, BuildCache
+from cycax_parts.lod import LOD0
+from cycax_parts.registry import PartEntry, PartRegistry, default_registry
+from cycax_parts.tessellation import PRINT
+from cycax_parts.watch import PACKAGE_DIR, snapshot, warm_up
+
+logger = logging.getLogger(__name__)
+
+DAEMON_ENV = "CYCAX_PARTS_DAEMON"
+PING_TIMEOUT = 5.0
+SOCKET_MODE = 0o600
+
+
+def default_socket() -> Path:
+    """The socket path from CYCAX_PARTS_DAEMON, or a per user socket in XDG_RUNTIME_DIR or the temporary directory."""
+    path = os.environ.get(DAEMON_ENV, "")
+    # CYCAX_PARTS_DAEMON=1 only enables the daemon, it is not a path.
+    if path and path != "1":
+        return Path(path).expanduser()
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "cycax_parts.sock"
+    return Path(tempfile.gettempdir()) / f"cycax_parts-{os.getuid()}.sock"
+
+
+def entry_to_json(entry: PartEntry) -> dict:
+    return {"part_no": entry.part_no, "target": entry.target, "kind": entry.kind, "params": list(entry.params)}
+
+
+def entry_from_json(data: dict, registry: PartRegistry | None = None) -> PartEntry:
+    """The entry of a job, the part class and kind must be those of a registered part.
+
+    Raises:
+        ValueError: The job does not name a registered part class.
+    """
+    registry = registry or default_registry()
+    if not any(entry.target == data["target"] and entry.kind == data["kind"] for entry in registry):
+        msg = f"{data['part_no']} is not built from a registered part, {data['target']} ({data['kind']})."
+        raise ValueError(msg)
+    params = tuple((name, value) for name, value in data.get("params", []))
+    return PartEntry(data["part_no"], data["target"], data["kind"], params)
+
+
+def output_files(path: Path) -> list[str]:
+    if not path.is_dir():
+        return []
+    return sorted(str(item) for item in path.rglob("*") if item.is_file())
+
+
+class BuildDaemon:
+    """The warm worker pool and the handling of requests.
+
+    Args:
+        workers: The number of worker processes.
+    """
+
+    def __init__(self, workers: int = 1):
+        self.workers = workers
+        self.lock = threading.Lock()
+        self.sources = {}
+        self.executor = None
+
+    def pool(self) -> ProcessPoolExecutor:
+        """The worker pool, replaced by a fresh one when the package sources changed."""
+        with self.lock:
+            sources = snapshot(PACKAGE_DIR)
+            if self.executor is not None and sources != self.sources:
+                logger.info("The sources changed, restarting the workers")
+                self.executor.shutdown(wait=True)
+                self.executor = None
+            if self.executor is None:
+                # Spawned, a forked worker would inherit the modules this process imported before the change.
+                self.executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"), initializer=warm_up
+                )
+                self.sources = sources
+            return self.executor
+
+    def discard(self, executor: ProcessPoolExecutor):
+        """Drop a broken pool, the next call to pool() starts a new one."""
+        with self.lock:
+            if self.executor is executor:
+                self.executor = None
+        executor.shutdown(wait=False)
+
+    def warm(self):
+        """Start every worker of the pool and wait until it imported the CAD kernel.
+
+        The pool only starts workers when jobs are submitted, a trivial job per worker starts them all.
+        """
+        executor = self.pool()
+        for future in [executor.submit(os.getpid) for _ in range(self.workers)]:
+            future.result()
+
+    def build(self, request: dict) -> dict:
+        from cycax_parts.build import BuildResult, log_result, run_job
+
+        entries = [entry_from_json(job) for job in request.get("jobs", [])]
+        build_dir = Path(request["build_dir"])
+        build_dir.mkdir(parents=True, exist_ok=True)
+        cache_dir = request.get("cache_dir")
+        cache = BuildCache(cache_dir, max_size=request.get("cache_size", DEFAULT_MAX_SIZE)) if cache_dir else None
+        options = {"cache": cache, "lod": request.get("lod", LOD0), "tessellation": request.get("tessellation", PRINT)}
+        executor = self.pool()
+        try:
+            futures = [(entry, executor.submit(run_job, entry, build_dir, **options)) for entry in entries]
+        except BrokenProcessPool:
+            # A worker died after the previous request.
+            self.discard(executor)
+            executor = self.pool()
+            futures = [(entry, executor.submit(run_job, entry, build_dir, **options)) for entry in entries]
+        results = []
+        for entry, future in futures:
+            try:
+                result = future.result()
+            except BrokenProcessPool:
+                # A worker died, the pool fails every job that had not finished.
+                self.discard(executor)
+                result = BuildResult(name=entry.part_no, ok=False, seconds=0.0, error="The build worker died.")
+            log_result(result)
+            results.append({**asdict(result), "artifacts": output_files(build_dir / result.name)})
+        return {"ok": True, "results": results}
+
+    def handle(self, request: dict) -> dict:
+        op = request.get("op")
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid()}
+        if op == "build":
+            return self.build(request)
+        return {"ok": False, "error": f"Unknown request {op!r}"}
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """Answer the JSON requests on a connection, one per line."""
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                if request.get("op") == "shutdown":
+                    self.reply({"ok": True})
+                    threading.Thread(target=self.server.shutdown).start()
+                    return
+                response = self.server.daemon.handle(request)
+            except Exception as error:
+                logger.exception("Failed to handle a request")
+                response = {"ok": False, "error": str(error)}
+            self.reply(response)
+
+    def reply(self, response: dict):
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+        self.wfile.flush()
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: Path, daemon: BuildDaemon):
+        self.daemon = daemon
+        super().__init__(str(path), RequestHandler)
+
+    def server_bind(self):
+        super().server_bind()
+        # Before listen(), so no other user ever connects.
+        os.chmod(self.server_address, SOCKET_MODE)
+
+
+class DaemonClient:
+    """Send requests to a running build daemon.
+
+    Args:
+        path: The Unix socket of the daemon.
+        timeout: Seconds to wait for a reply, None waits as long as a build takes.
+    """
+
+    def __init__(self, path: Path | None = None, timeout: float | None = None):
+        self.path = path or default_socket()
+        self.timeout = timeout
+
+    def request(self, payload: dict, timeout: float | None = None) -> dict:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout or self.timeout)
+            sock.connect(str(self.path))
+            sock.sendall(json.dumps(payload).encode() + b"\n")
+            with sock.makefile("rb") as reply:
+                line = reply.readline()
+        if not line:
+            msg = f"The build daemon at {self.path} closed the connection"
+            raise ConnectionError(msg)
+        return json.loads(line)
+
+    def ping(self) -> bool:
+        """True when a daemon answers on the socket."""
+        try:
+            return self.request({"op": "ping"}, timeout=PING_TIMEOUT).get("ok", False)
+        except (OSError, ValueError):
+            return False
+
+    def build(
+        self, entries, build_dir: Path, cache: BuildCache | None = None, lod: int = LOD0, tessellation: str = PRINT
+    ) -> list:
+        """Build the entries in the daemon, returns the BuildResult of every entry."""
+        from cycax_parts.build import BuildResult
+
+        payload = {
+            "op": "build",
+            "jobs": [entry_to_json(entry) for entry in entries],
+            "build_dir": str(Path(build_dir).resolve()),
+            "lod": lod,
+            "tessellation": tessellation,
+        }
+        if cache is not None:
+            payload["cache_dir"] = str(cache.path.resolve())
+            payload["cache_size"] = cache.max_size
+        response = self.request(payload)
+        if not response.get("ok"):
+            msg = f"The build daemon failed: {response.get('error')}"
+            raise RuntimeError(msg)
+        names = {field.name for field in fields(BuildResult)}
+        return [
+            BuildResult(**{key: value for key, value in result.items() if key in names})
+            for result in response["results"]
+        ]
+
+
+def serve(path: Path, workers: int):
+    if path.exists():
+        if DaemonClient(path).ping():
+            msg = f"A build daemon is already running on {path}"
+            raise RuntimeError(msg)
+        # Left behind by a daemon that did not shut down cleanly.
+        path.unlink()
+    daemon = BuildDaemon(workers)
+    # Start the workers now so the first request finds them warm.
+    daemon.warm()
+    server = DaemonServer(path, daemon)
+    logger.info("Build daemon listening on %s with %d workers", path, workers)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        daemon.close()
+        path.unlink(missing_ok=True)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run a build daemon that keeps the CAD kernel loaded.")
+    parser.add_argument("--socket", type=Path, default=None, help="The Unix socket to listen on.")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="Number of warm worker processes.")
+    parser.add_argument("--stop", action="store_true", help="Stop the daemon running on the socket.")
+    args = parser.parse_args(argv)
+    path = args.socket or default_socket()
+
+    from cycax_parts.build import setup_logging
+
+    setup_logging()
+    if args.stop:
+        try:
+            DaemonClient(path).request({"op": "shutdown"})
+        except OSError:
+            logger.error("No build daemon is running on %s", path)
+            return 1
+        return 0
+    serve(path, max(1, args.jobs))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Check that parts fit together without building any solids.
+
+The checks work on the bounding boxes of the parts and the boxes of their features:
+
+- Parts whose bodies overlap collide.
+- Parts outside the enclosure do not fit.
+- Every external-subtract feature must land on a neighbouring part touching the face it
+  is made on, a feature that lands on nothing misses and one that only partly lands on a
+  part is partial.
+- Features that are nowhere near their own part are stray.
+
+The parts are indexed in a bounding volume hierarchy, see spatial.py, so only the parts
+near each other are compared.
+
+Run it on the whole catalog, for example from a pre-commit hook:
+
+    python -m cycax_parts.fitcheck
+"""
+
+import argparse
+import logging
+import sys
+import time
+from dataclasses import dataclass, field
+
+from cycax_parts.geometry import SIDE_AXIS, TOLERANCE, Box, FeatureBox, is_rotated, part_box, part_features
+from cycax_parts.incremental import assembly_parts
+from cycax_parts.registry import CASE, default_registry
+from cycax_parts.spatial import BoxTree
+
+logger = logging.getLogger(__name__)
+
+HIT = "hit"
+PARTIAL = "partial"
+MISS = "miss"
+
+
+@dataclass
+class Collision:
+    """Two parts whose bodies overlap."""
+
+    part_a: str
+    part_b: str
+    overlap: Box
+
+
+@dataclass
+class ExternalCut:
+    """Where an external-subtract feature lands."""
+
+    feature: FeatureBox
+    status: str
+    target: str | None = None
+
+
+@dataclass
+class FitReport:
+    name: str
+    collisions: list = field(default_factory=list)
+    external: list = field(default_factory=list)
+    stray: list = field(default_factory=list)
+    outside: list = field(default_factory=list)
+    unchecked: list = field(default_factory=list)
+
+    @property
+    def misses(self) -> list:
+        return [cut for cut in self.external if cut.status != HIT]
+
+    @property
+    def ok(self) -> bool:
+        return not (self.collisions or self.misses or self.stray or self.outside)
+
+    def lines(self) -> list[str]:
+        lines = [f"{self.name}: {'ok' if self.ok else 'FAILED'}"]
+        lines.extend(f"  collision {c.part_a} <-> {c.part_b} overlap {c.overlap.size}" for c in self.collisions)
+        for cut in self.misses:
+            feature = cut.feature
+            where = f" on {cut.target}" if cut.target else ""
+            lines.append(f"  {cut.status} external {feature.name} on {feature.part_no} {feature.side}")
+            lines.append(f"    at {feature.box.low}{where}")
+        lines.extend(f"  stray {f.name} on {f.part_no} {f.side} at {f.box.low}" for f in self.stray)
+        lines.extend(f"  outside enclosure {part_no}" for part_no in self.outside)
+        lines.extend(f"  features not checked on rotated part {part_no}" for part_no in self.unchecked)
+        return lines
+
+
+def projection(box: Box, axis: int) -> tuple:
+    """The (u0, v0, u1, v1) rectangle of a box seen along an axis."""
+    u, v = (i for i in range(3) if i != axis)
+    return (box.low[u], box.low[v], box.high[u], box.high[v])
+
+
+def rect_contains(outer: tuple, inner: tuple, tol: float = TOLERANCE) -> bool:
+    return (
+        outer[0] <= inner[0] + tol
+        and outer[1] <= inner[1] + tol
+        and inner[2] <= outer[2] + tol
+        and inner[3] <= outer[3] + tol
+    )
+
+
+def rect_overlaps(a: tuple, b: tuple, tol: float = TOLERANCE) -> bool:
+    return a[0] < b[2] - tol and b[0] < a[2] - tol and a[1] < b[3] - tol and b[1] < a[3] - tol
+
+
+def beyond_face(box: Box, axis: int, direction: int, face: float, tol: float = TOLERANCE) -> bool:
+    """True when the box touches the plane of a face from the outside of that face."""
+    if direction > 0:
+        return box.low[axis] <= face + tol and box.high[axis] > face + tol
+    return box.high[axis] >= face - tol and box.low[axis] < face - tol
+
+
+def face_region(feature: FeatureBox, face: float) -> Box:
+    """The footprint of a feature on the plane of the face it is made on."""
+    axis = SIDE_AXIS[feature.side][0]
+    low = list(feature.box.low)
+    high = list(feature.box.high)
+    low[axis] = high[axis] = face
+    return Box(*low, *high)
+
+
+def classify_external(feature: FeatureBox, owner: Box, candidates: dict) -> ExternalCut:
+    """Find the part an external-subtract feature lands on.
+
+    Args:
+        feature: The external-subtract feature.
+        owner: The box of the part the feature belongs to.
+        candidates: The boxes of the other parts by part number.
+    """
+    axis, direction = SIDE_AXIS[feature.side]
+    face = owner.face(feature.side)
+    footprint = feature.footprint()
+    partial = None
+    for part_no, box in candidates.items():
+        if not beyond_face(box, axis, direction, face):
+            continue
+        rect = projection(box, axis)
+        if rect_contains(rect, footprint):
+            return ExternalCut(feature, HIT, part_no)
+        if partial is None and rect_overlaps(rect, footprint):
+            partial = part_no
+    if partial is not None:
+        return ExternalCut(feature, PARTIAL, partial)
+    return ExternalCut(feature, MISS)
+
+
+def check_parts(parts, enclosure: Box | None = None, name: str = "") -> FitReport:
+    """Check a set of placed parts.
+
+    Args:
+        parts: The parts, placed where they are used.
+        enclosure: When given every part must be inside it.
+        name: Name used in the report.
+    """
+    report = FitReport(name=name or ", ".join(part.part_no for part in parts))
+    boxes = {part.part_no: part_box(part) for part in parts}
+    tree = BoxTree((box, part_no) for part_no, box in boxes.items())
+    for i, j in tree.pairs():
+        (box_a, part_a), (box_b, part_b) = tree.items[i], tree.items[j]
+        report.collisions.append(Collision(part_a, part_b, box_a.intersection(box_b)))
+    if enclosure is not None:
+        report.outside.extend(part_no for part_no, box in boxes.items() if not enclosure.contains(box))
+
+    for part in parts:
+        if is_rotated(part):
+            report.unchecked.append(part.part_no)
+            continue
+        owner = boxes[part.part_no]
+        for feature in part_features(part):
+            if not feature.box.touches(owner):
+                report.stray.append(feature)
+            elif feature.external_subtract and len(boxes) > 1:
+                region = face_region(feature, owner.face(feature.side))
+                # In the order of the parts, the first part the feature lands on is reported.
+                nearby = {tree.items[i][1]: tree.items[i][0] for i in sorted(tree.query(region, touching=True))}
+                nearby.pop(part.part_no, None)
+                report.external.append(classify_external(feature, owner, nearby))
+    return report
+
+
+def check_assembly(assembly, enclosure: Box | None = None) -> FitReport:
+    return check_parts(assembly_parts(assembly), enclosure=enclosure, name=assembly.name)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Check that the parts and case assemblies fit, without a CAD kernel.")
+    parser.add_argument("parts", nargs="*", help="Part numbers to check, shell style wildcards are allowed.")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    from cycax_parts.build import motherboard_case
+
+    failed = 0
+    start = time.perf_counter()
+    for entry in default_registry().select(args.parts):
+        part = entry.load()()
+        report = check_assembly(motherboard_case(part)) if entry.kind == CASE else check_parts([part])
+        if not report.ok:
+            failed += 1
+        for line in report.lines():
+            print(line)  # noqa: T201
+    logger.info("Checked in %.3fs", time.perf_counter() - start)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
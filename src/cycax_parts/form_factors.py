@@ -0,0 +1,203 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Mounting hole and connector positions of standard form factors.
+
+The tables are calculated once when the module is imported and are immutable, parts
+query them instead of recalculating the positions on every definition() call. Queries
+like inside() and mirrored_y() return new tables and are cached.
+
+All positions are in mm as seen on the face the feature is placed on.
+"""
+
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+
+INCH = 25.4
+
+
+@dataclass(frozen=True)
+class PositionTable:
+    """Named (x, y) positions stored as columns.
+
+    Args:
+        names: The name of each position.
+        xs: The x coordinate of each position.
+        ys: The y coordinate of each position.
+    """
+
+    names: tuple
+    xs: tuple
+    ys: tuple
+
+    def __post_init__(self):
+        if not len(self.names) == len(self.xs) == len(self.ys):
+            msg = "The names, xs and ys of a position table must have the same length."
+            raise ValueError(msg)
+
+    @classmethod
+    def from_points(cls, points, scale: float = 1, offset: tuple[float, float] = (0, 0)) -> "PositionTable":
+        """Create a table from a {name: (x, y)} dict or a sequence of (x, y).
+
+        The points are scaled and then offset, for example to convert inch to mm.
+        """
+        if not isinstance(points, dict):
+            points = {str(i): pos for i, pos in enumerate(points)}
+        names = tuple(points)
+        xs = tuple(pos[0] * scale + offset[0] for pos in points.values())
+        ys = tuple(pos[1] * scale + offset[1] for pos in points.values())
+        return cls(names, xs, ys)
+
+    @cached_property
+    def positions(self) -> tuple:
+        return tuple(zip(self.xs, self.ys, strict=True))
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        return iter(self.positions)
+
+    def as_dict(self) -> dict:
+        return dict(zip(self.names, self.positions, strict=True))
+
+    def select(self, mask) -> "PositionTable":
+        """The positions where mask is true."""
+        keep = tuple(i for i, flag in enumerate(mask) if flag)
+        return PositionTable(
+            tuple(self.names[i] for i in keep), tuple(self.xs[i] for i in keep), tuple(self.ys[i] for i in keep)
+        )
+
+    def inside(self, x_size: float, y_size: float) -> "PositionTable":
+        """The positions that fall inside an outline of x_size by y_size."""
+        return _inside(self, x_size, y_size)
+
+    def mirrored_y(self, y_size: float) -> "PositionTable":
+        """The positions as seen from the opposite face, for example the bottom of a board."""
+        return _mirrored_y(self, y_size)
+
+    def moved(self, x: float = 0, y: float = 0) -> "PositionTable":
+        return PositionTable(self.names, tuple(px + x for px in self.xs), tuple(py + y for py in self.ys))
+
+
+@lru_cache(maxsize=256)
+def _inside(table: PositionTable, x_size: float, y_size: float) -> PositionTable:
+    return table.select(x < x_size and y < y_size for x, y in table.positions)
+
+
+@lru_cache(maxsize=256)
+def _mirrored_y(table: PositionTable, y_size: float) -> PositionTable:
+    return PositionTable(table.names, table.xs, tuple(y_size - y for y in table.ys))
+
+
+# ATX, the mounting holes as seen from the top. Front is the connectors, right is the PCIe slots.
+ATX_MOUNTING = PositionTable.from_points(
+    {  # These values are in inches.
+        "A": (11.35, 0.4),
+        "B": (8.25, 0.4),
+        "C": (6.45, 0.4),
+        "F": (0.25, 1.3),
+        "G": (11.35, 6.5),
+        "H": (6.45, 6.5),
+        "J": (0.25, 6.5),
+        "K": (11.35, 9.35),
+        "L": (6.45, 9.35),
+        "M": (0.25, 9.35),
+        "R": (9.05, 6.5),
+        "S": (8.25, 6.5),
+    },
+    scale=INCH,
+    offset=(3.8, 3.3),  # The overhang of the board.
+)
+# Some random holes to mark the connector end of a motherboard.
+BOARD_CONNECTORS = PositionTable.from_points(((20, 20), (40, 20), (60, 20)))
+
+# Mini-ITX, the mounting holes as seen from the top. Back is the connectors, left is the PCIe slot.
+MINIITX_PCB = 170  # Size of the PCB of a mini-itx board. The PCB is square.
+_MINIITX_LR = 157.48  # Distance between Left-Right holes.
+_MINIITX_LFB = 154.94  # Distance between Front-Back holes on the left.
+_MINIITX_RFB = 132.08  # Distance between Front-Back holes on the right.
+_MINIITX_L_EDGE = 6.35  # Holes on left from edge
+_MINIITX_F_EDGE = MINIITX_PCB - _MINIITX_LFB - 10.16  # The spec gives the distance from the back.
+MINI_ITX_MOUNTING = PositionTable.from_points(
+    (
+        (_MINIITX_L_EDGE, _MINIITX_F_EDGE),
+        (_MINIITX_L_EDGE, _MINIITX_F_EDGE + _MINIITX_LFB),
+        (_MINIITX_L_EDGE + _MINIITX_LR, _MINIITX_F_EDGE),
+        (_MINIITX_L_EDGE + _MINIITX_LR, _MINIITX_F_EDGE + _MINIITX_RFB),
+    )
+)
+
+# Odroid boards, the mounting holes as seen from the bottom. Front is the connectors.
+ODROID_H3_LENGTH = 110
+ODROID_NANO_ITX_LENGTH = 120  # The H4 and H5 are the size of a Nano-ITX board.
+ODROID_H3_MOUNTING = PositionTable.from_points(
+    (
+        (3.81, 3.81),
+        (ODROID_H3_LENGTH - 3.96, 3.81),
+        (3.81, 3.81 + 88.41),
+        (ODROID_H3_LENGTH - 3.96, 3.81 + 81.43),
+    )
+)
+ODROID_H4_MOUNTING = PositionTable.from_points(
+    (
+        (3.81, 3.81),
+        (ODROID_NANO_ITX_LENGTH - 3.96, 3.81),
+        (3.81, 3.81 + 98.41),
+        (3.81 + 16.36, 3.81 + 72.37),
+        (ODROID_NANO_ITX_LENGTH - 13.96, 3.81 + 91.42),
+    )
+)
+ODROID_H5_MOUNTING = PositionTable.from_points(
+    (
+        (3.81, 3.81),
+        (ODROID_NANO_ITX_LENGTH - 3.96, 3.81),
+        (3.81, 3.81 + 98.41),
+        (ODROID_NANO_ITX_LENGTH - 13.96, 3.81 + 91.42),
+    )
+)
+# The generic Odroid is the size of the H4 with the H3 holes placed on it.
+ODROID_GENERIC_H3_MOUNTING = PositionTable.from_points(
+    (
+        (3.81, 3.81),
+        (ODROID_NANO_ITX_LENGTH - 13.96, 3.81),
+        (3.81, 3.81 + 88.41),
+        (ODROID_NANO_ITX_LENGTH - 13.96, 3.81 + 81.43),
+    )
+)
+ODROID_GENERIC_H4_MOUNTING = PositionTable.from_points(
+    (
+        (ODROID_NANO_ITX_LENGTH - 3.96, 3.81),
+        (3.81, 3.81 + 98.41),
+        (3.81 + 16.36, 3.81 + 72.37),
+        (ODROID_NANO_ITX_LENGTH - 13.96, 3.81 + 91.42),
+    )
+)
+
+# PSU mounting holes on the back face (where the C14 AC connector is) as seen from the back.
+ATX_PSU_SIZE = (150.0, 140.0, 86.0)
+_ATX_PSU_EDGE = (ATX_PSU_SIZE[0] - 138) / 2
+ATX_PSU_MOUNTING = PositionTable.from_points(
+    (
+        (_ATX_PSU_EDGE, ATX_PSU_SIZE[2] - _ATX_PSU_EDGE),
+        (_ATX_PSU_EDGE + 138, ATX_PSU_SIZE[2] - _ATX_PSU_EDGE),
+        (_ATX_PSU_EDGE, ATX_PSU_SIZE[2] - _ATX_PSU_EDGE - 64),
+        (_ATX_PSU_EDGE + 114, _ATX_PSU_EDGE),
+    )
+)
+FLEX_ATX_PSU_SIZE = (81.5, 150, 40.50)
+_FLEX_ATX_PSU_EDGE = (FLEX_ATX_PSU_SIZE[2] - 32) / 2  # Holes are 32mm apart
+FLEX_ATX_PSU_MOUNTING = PositionTable.from_points(
+    (
+        (FLEX_ATX_PSU_SIZE[0] - _FLEX_ATX_PSU_EDGE, _FLEX_ATX_PSU_EDGE),
+        (FLEX_ATX_PSU_SIZE[0] - _FLEX_ATX_PSU_EDGE, _FLEX_ATX_PSU_EDGE + 32),
+        (4.4, 36),  # Assume the hole placement is the same from both sides.
+        (15.2, 37),
+    )
+)
+# The Meanwell PSU mounts from the bottom.
+MEANWELL_15V_SIZE = (114.3, 215, 50)
+MEANWELL_15V_MOUNTING = PositionTable.from_points(
+    tuple((x, y) for x in (32, MEANWELL_15V_SIZE[0] - 32) for y in (32, MEANWELL_15V_SIZE[1] - 32))
+)
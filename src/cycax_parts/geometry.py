@@ -0,0 +1,236 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Axis aligned boxes for parts and features, no CAD kernel is involved.
+
+A part is described by its bounding box in the assembly and every feature by the box
+it occupies. Holes are represented by the box around the cylinder and carry the face
+they are made on, so the footprint on that face is exact.
+
+Features are placed in the assembly by moving them with the part. Parts that are rotated
+are only represented by their bounding box, their features are not placed.
+"""
+
+from dataclasses import dataclass
+
+LEFT = "LEFT"
+RIGHT = "RIGHT"
+FRONT = "FRONT"
+BACK = "BACK"
+TOP = "TOP"
+BOTTOM = "BOTTOM"
+
+# The axis a side faces along and the direction of its outward normal.
+SIDE_AXIS = {LEFT: (0, -1), RIGHT: (0, 1), FRONT: (1, -1), BACK: (1, 1), BOTTOM: (2, -1), TOP: (2, 1)}
+TOLERANCE = 1e-6
+
+
+@dataclass(frozen=True)
+class Box:
+    """An axis aligned box from (x0, y0, z0) to (x1, y1, z1)."""
+
+    x0: float
+    y0: float
+    z0: float
+    x1: float
+    y1: float
+    z1: float
+
+    @classmethod
+    def from_size(cls, low: tuple, size: tuple) -> "Box":
+        """A box from its lowest corner and its (x, y, z) size."""
+        return cls(*low, *(p + s for p, s in zip(low, size, strict=True)))
+
+    @property
+    def low(self) -> tuple:
+        return (self.x0, self.y0, self.z0)
+
+    @property
+    def high(self) -> tuple:
+        return (self.x1, self.y1, self.z1)
+
+    @property
+    def size(self) -> tuple:
+        return (self.x1 - self.x0, self.y1 - self.y0, self.z1 - self.z0)
+
+    @property
+    def volume(self) -> float:
+        x, y, z = self.size
+        return max(x, 0) * max(y, 0) * max(z, 0)
+
+    def moved(self, x: float = 0, y: float = 0, z: float = 0) -> "Box":
+        return Box(self.x0 + x, self.y0 + y, self.z0 + z, self.x1 + x, self.y1 + y, self.z1 + z)
+
+    def grown(self, clearance: float) -> "Box":
+        """The box with clearance added on all sides."""
+        c = clearance
+        return Box(self.x0 - c, self.y0 - c, self.z0 - c, self.x1 + c, self.y1 + c, self.z1 + c)
+
+    def intersects(self, other: "Box", tol: float = TOLERANCE) -> bool:
+        """True when the boxes share volume, boxes that only touch do not intersect."""
+        return (
+            self.x0 < other.x1 - tol
+            and other.x0 < self.x1 - tol
+            and self.y0 < other.y1 - tol
+            and other.y0 < self.y1 - tol
+            and self.z0 < other.z1 - tol
+            and other.z0 < self.z1 - tol
+        )
+
+    def touches(self, other: "Box", tol: float = TOLERANCE) -> bool:
+        """True when the boxes intersect or share part of a face."""
+        return (
+            self.x0 <= other.x1 + tol
+            and other.x0 <= self.x1 + tol
+            and self.y0 <= other.y1 + tol
+            and other.y0 <= self.y1 + tol
+            and self.z0 <= other.z1 + tol
+            and other.z0 <= self.z1 + tol
+        )
+
+    def contains(self, other: "Box", tol: float = TOLERANCE) -> bool:
+        return all(a <= b + tol for a, b in zip(self.low, other.low, strict=True)) and all(
+            b <= a + tol for a, b in zip(self.high, other.high, strict=True)
+        )
+
+    def intersection(self, other: "Box") -> "Box | None":
+        box = Box(
+            max(self.x0, other.x0),
+            max(self.y0, other.y0),
+            max(self.z0, other.z0),
+            min(self.x1, other.x1),
+            min(self.y1, other.y1),
+            min(self.z1, other.z1),
+        )
+        return box if box.volume > 0 else None
+
+    def union(self, other: "Box") -> "Box":
+        return Box(
+            min(self.x0, other.x0),
+            min(self.y0, other.y0),
+            min(self.z0, other.z0),
+            max(self.x1, other.x1),
+            max(self.y1, other.y1),
+            max(self.z1, other.z1),
+        )
+
+    def face(self, side: str) -> float:
+        """The coordinate of a face of the box along its axis."""
+        axis, direction = SIDE_AXIS[side]
+        return (self.high if direction > 0 else self.low)[axis]
+
+
+def bounding(boxes) -> Box | None:
+    """The box around all the boxes."""
+    result = None
+    for box in boxes:
+        result = box if result is None else result.union(box)
+    return result
+
+
+@dataclass(frozen=True)
+class FeatureBox:
+    """The space a feature of a part occupies.
+
+    Args:
+        part_no: The part the feature belongs to.
+        name: The feature type, hole, cube, nut or sphere.
+        side: The side of the part the feature is made on.
+        box: The box around the feature.
+        external_subtract: The feature is subtracted from neighbouring parts.
+        diameter: The diameter of holes and spheres.
+    """
+
+    part_no: str
+    name: str
+    side: str
+    box: Box
+    external_subtract: bool = False
+    diameter: float | None = None
+
+    def footprint(self) -> tuple:
+        """The (u0, v0, u1, v1) rectangle the feature covers on the face it is made on."""
+        axis = SIDE_AXIS[self.side][0]
+        u, v = (i for i in range(3) if i != axis)
+        return (self.box.low[u], self.box.low[v], self.box.high[u], self.box.high[v])
+
+
+def part_size(part) -> tuple:
+    return (part.x_size, part.y_size, part.z_size)
+
+
+def part_box(part) -> Box:
+    """The bounding box of a part where it is placed."""
+    bbox = getattr(part, "bounding_box", None)
+    if bbox:
+        return Box(bbox[LEFT], bbox[FRONT], bbox[BOTTOM], bbox[RIGHT], bbox[BACK], bbox[TOP])
+    return Box(0, 0, 0, *part_size(part))
+
+
+def is_rotated(part) -> bool:
+    """True when the placed part is not aligned with its own axes.
+
+    Only rotations that swap axes can be detected from the bounding box.
+    """
+    return any(abs(a - b) > TOLERANCE for a, b in zip(part_box(part).size, part_size(part), strict=True))
+
+
+def feature_box(data: dict, size: tuple) -> Box | None:
+    """The box a feature occupies in the coordinates of its part.
+
+    Args:
+        data: The exported feature, see CycadPart.export().
+        size: The (x_size, y_size, z_size) of the part.
+    """
+    name = data.get("name")
+    side = str(data.get("side", TOP)).upper()
+    point = [data.get("x", 0), data.get("y", 0), data.get("z", 0)]
+    if name == "cube":
+        low = point
+        high = [point[0] + data["x_size"], point[1] + data["y_size"], point[2] + data["z_size"]]
+        if data.get("center"):
+            half = [(h - lo) / 2 for lo, h in zip(low, high, strict=True)]
+            low = [p - h for p, h in zip(point, half, strict=True)]
+            high = [p + h for p, h in zip(point, half, strict=True)]
+        return Box(*low, *high)
+    if side not in SIDE_AXIS:
+        return None
+    axis, direction = SIDE_AXIS[side]
+    diameter = data.get("diameter") or data.get("side_to_side") or 0
+    radius = diameter / 2
+    depth = data.get("depth") or size[axis]
+    low = [p - radius for p in point]
+    high = [p + radius for p in point]
+    if name == "hole":
+        # The hole starts on the face and goes depth into the part.
+        low[axis], high[axis] = (
+            (point[axis] - depth, point[axis]) if direction > 0 else (point[axis], point[axis] + depth)
+        )
+    return Box(*low, *high)
+
+
+def part_features(part) -> list[FeatureBox]:
+    """The features of a part placed where the part is, an empty list for rotated parts."""
+    if is_rotated(part):
+        return []
+    offset = part_box(part).low
+    size = part_size(part)
+    features = []
+    for feature_list, external in ((part.features, False), (getattr(part, "move_holes", []), True)):
+        for feature in feature_list:
+            data = feature.export() if hasattr(feature, "export") else feature
+            box = feature_box(data, size)
+            if box is None:
+                continue
+            features.append(
+                FeatureBox(
+                    part_no=part.part_no,
+                    name=data.get("name", ""),
+                    side=str(data.get("side", TOP)).upper(),
+                    box=box.moved(*offset),
+                    external_subtract=external,
+                    diameter=data.get("diameter"),
+                )
+            )
+    return features
@@ -0,0 +1,149 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Incremental assembly builds.
+
+Every member part of an assembly is fingerprinted from its saved definition, that is
+after leveling and any subtract=True has been applied to it. Only the members whose
+fingerprint changed since the previous build are sent to the part engine, the assembly
+engine reuses the outputs already on disk for the rest.
+
+Members with the same definition apart from their part number, like the corner blocks of
+an enclosure, are instances of one shape. Only the first one is built, the outputs of
+the others are hard links to it. The position, size and rotation of every instance is
+written to instances.json, that is a record for tools, not transforms the engine uses.
+The assembly engine still adds a full copy of the shape for every instance, the
+assembly STEP file does not use references and grows with the repeat count.
+"""
+
+import json
+import logging
+from pathlib import Path
+
+from cycax_parts.cache import BuildCache, artifact_files, cached_build, definition_digest, replace_file
+from cycax_parts.geometry import is_rotated, part_box
+from cycax_parts.lod import LOD0, mounting_keys, simplify_saved_part
+from cycax_parts.optimise import optimise_saved_part
+from cycax_parts.tessellation import PRINT, tessellation_settings
+from cycax_parts.trace import span
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_FILE = "fingerprints.json"
+INSTANCES_FILE = "instances.json"
+
+
+def assembly_parts(assembly) -> list:
+    """The member parts of an assembly."""
+    parts = assembly.parts
+    if isinstance(parts, dict):
+        return list(parts.values())
+    return list(parts)
+
+
+def load_fingerprints(assembly_path: Path) -> dict:
+    state_file = assembly_path / FINGERPRINT_FILE
+    if not state_file.exists():
+        return {}
+    try:
+        return json.loads(state_file.read_text())
+    except ValueError:
+        logger.warning("Ignoring corrupt fingerprint file %s", state_file)
+        return {}
+
+
+def save_fingerprints(assembly_path: Path, fingerprints: dict):
+    state_file = assembly_path / FINGERPRINT_FILE
+    state_file.write_text(json.dumps(fingerprints, indent=4, sort_keys=True))
+
+
+def link_instance(prototype, prototype_path: Path, part, part_path: Path):
+    """Give an instance the outputs of its prototype, renamed to the part number of the instance."""
+    for path in artifact_files(part_path):
+        path.unlink()
+    for src in artifact_files(prototype_path):
+        name = src.name.replace(prototype.part_no, part.part_no, 1)
+        replace_file(src, part_path / name, link=True)
+
+
+def placement(part) -> dict:
+    box = part_box(part)
+    return {"part_no": part.part_no, "position": box.low, "size": box.size, "rotated": is_rotated(part)}
+
+
+def build_assembly(
+    assembly,
+    assembly_path: Path,
+    assembly_engine,
+    part_engine_class,
+    cache: BuildCache | None = None,
+    *,
+    lod: int = LOD0,
+    tessellation: str = PRINT,
+) -> list[str]:
+    """Save the assembly and build the members that changed, then build the assembly.
+
+    Args:
+        assembly: The assembly with all the parts added and placed.
+        assembly_path: The directory the assembly is saved to.
+        assembly_engine: The engine used to build the assembly.
+        part_engine_class: The part engine class used for members that changed.
+        cache: Build cache for the member parts, None disables caching.
+        lod: The level of detail the members are built at.
+        tessellation: The tessellation profile of the build, see tessellation.py.
+
+    Returns:
+        The part numbers of the members that were rebuilt.
+    """
+    with span("save", assembly.name):
+        assembly.save(assembly_path)
+    previous = load_fingerprints(assembly_path)
+    fingerprints = {}
+    prototypes = {}
+    instances = {}
+    rebuilt = []
+    for part in assembly_parts(assembly):
+        part_path = assembly_path / part.part_no
+        optimise_saved_part(part_path)
+        simplify_saved_part(part_path, lod, mounting_keys(part))
+        settings = tessellation_settings(part, tessellation)
+        # A member meshed with other tolerances is rebuilt.
+        mesh = f"{settings['tolerance']}:{settings['angular_tolerance']}"
+        fingerprint = definition_digest(part_path)
+        if fingerprint is not None:
+            fingerprint = f"{fingerprint}:{mesh}"
+        fingerprints[part.part_no] = fingerprint
+        shape = f"{definition_digest(part_path, ignore_name=True) or part.part_no}:{mesh}"
+        instances.setdefault(shape, []).append(placement(part))
+        if shape in prototypes:
+            prototype, prototype_path = prototypes[shape]
+            if prototype_path != part_path:
+                link_instance(prototype, prototype_path, part, part_path)
+            continue
+        prototypes[shape] = (part, part_path)
+        if fingerprint is not None and previous.get(part.part_no) == fingerprint and artifact_files(part_path):
+            logger.debug("Reusing %s in %s", part.part_no, assembly.name)
+            continue
+        cached_build(part, part_path, part_engine_class, cache, settings)
+        rebuilt.append(part.part_no)
+    # The members are built, the assembly engine only has to combine them.
+    for path in artifact_files(assembly_path):
+        path.unlink()
+    with span("assembly", assembly.name):
+        assembly.build(engine=assembly_engine, part_engines=[])
+    save_fingerprints(assembly_path, fingerprints)
+    (assembly_path / INSTANCES_FILE).write_text(
+        json.dumps(
+            {shape: {"prototype": placed[0]["part_no"], "instances": placed} for shape, placed in instances.items()},
+            indent=4,
+        )
+    )
+    logger.info(
+        "Rebuilt %d of %d parts (%d unique shapes) in %s",
+        len(rebuilt),
+        len(fingerprints),
+        len(prototypes),
+        assembly.name,
+    )
+    return rebuilt
@@ -0,0 +1,199 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Report the parts and cuts of an assembly that interfere where they should not.
+
+- Two parts whose bodies overlap interfere, unless the pair is allowed.
+- An external-subtract feature is cut out of the neighbours on the outside of the face it
+  is made on, as deep as the feature. Cutting the part it lands on, see
+  fitcheck.classify_external, is intended. Cutting any other part is reported unless the
+  pair is allowed.
+
+The parts are indexed in a bounding volume hierarchy, so each part and each feature is
+only checked against the parts near it. The exact check is then done on those
+candidates: a box test for cubes and nuts and a circle test for holes. This scales to
+rack assemblies with thousands of features::
+
+    python -m cycax_parts.interference --allow "*-base:*"
+"""
+
+import argparse
+import fnmatch
+import logging
+import math
+import sys
+import time
+from dataclasses import dataclass, field
+
+from cycax_parts.fitcheck import HIT, PARTIAL, classify_external, face_region, projection
+from cycax_parts.geometry import SIDE_AXIS, TOLERANCE, Box, FeatureBox, part_box, part_features
+from cycax_parts.incremental import assembly_parts
+from cycax_parts.registry import CASE, default_registry
+from cycax_parts.spatial import BoxTree
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Overlap:
+    """Two parts whose bodies overlap."""
+
+    part_a: str
+    part_b: str
+    overlap: Box
+
+
+@dataclass
+class StrayCut:
+    """An external-subtract feature that cuts a part it is not meant for."""
+
+    feature: FeatureBox
+    part_no: str
+
+
+@dataclass
+class InterferenceReport:
+    name: str
+    overlaps: list = field(default_factory=list)
+    cuts: list = field(default_factory=list)
+    features: int = 0
+    candidates: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return not (self.overlaps or self.cuts)
+
+    def lines(self) -> list[str]:
+        counts = f"{self.features} external features, {self.candidates} candidate pairs"
+        lines = [f"{self.name}: {'ok' if self.ok else 'FAILED'} ({counts})"]
+        lines.extend(f"  overlap {o.part_a} <-> {o.part_b} size {o.overlap.size}" for o in self.overlaps)
+        for cut in self.cuts:
+            feature = cut.feature
+            lines.append(f"  {feature.name} from {feature.part_no} {feature.side} cuts {cut.part_no}")
+            lines.append(f"    at {feature.box.low}")
+        return lines
+
+
+def parse_allowed(pairs) -> list[tuple[str, str]]:
+    """Allowed pairs from "PART_A:PART_B" strings, shell style wildcards are allowed."""
+    allowed = []
+    for pair in pairs:
+        part_a, sep, part_b = pair.partition(":")
+        if not sep:
+            msg = f"Expected PART_A:PART_B, got {pair!r}"
+            raise ValueError(msg)
+        allowed.append((part_a, part_b))
+    return allowed
+
+
+def is_allowed(part_a: str, part_b: str, allowed) -> bool:
+    """True when the pair, in either order, matches an allowed pair."""
+    return any(
+        (fnmatch.fnmatchcase(part_a, a) and fnmatch.fnmatchcase(part_b, b))
+        or (fnmatch.fnmatchcase(part_b, a) and fnmatch.fnmatchcase(part_a, b))
+        for a, b in allowed
+    )
+
+
+def outward_box(feature: FeatureBox, face: float) -> Box:
+    """The space an external-subtract feature removes from the neighbours outside the face."""
+    axis, direction = SIDE_AXIS[feature.side]
+    depth = feature.box.size[axis]
+    low = list(feature.box.low)
+    high = list(feature.box.high)
+    low[axis], high[axis] = (face, face + depth) if direction > 0 else (face - depth, face)
+    return Box(*low, *high)
+
+
+def cuts_into(feature: FeatureBox, cut: Box, box: Box, tol: float = TOLERANCE) -> bool:
+    """True when the feature, removing the cut box, removes material from a part with the given box.
+
+    Holes are cylinders, the hole only cuts the part when its circle reaches the box.
+    """
+    if not cut.intersects(box, tol):
+        return False
+    if feature.name != "hole" or not feature.diameter:
+        return True
+    axis = SIDE_AXIS[feature.side][0]
+    u0, v0, u1, v1 = feature.footprint()
+    centre = ((u0 + u1) / 2, (v0 + v1) / 2)
+    rect = projection(box, axis)
+    du = max(rect[0] - centre[0], 0, centre[0] - rect[2])
+    dv = max(rect[1] - centre[1], 0, centre[1] - rect[3])
+    return math.hypot(du, dv) < feature.diameter / 2 - tol
+
+
+def check_interference(parts, allowed=(), name: str = "") -> InterferenceReport:
+    """Find the unintended overlaps and external subtractions between placed parts.
+
+    Args:
+        parts: The parts, placed where they are used.
+        allowed: (part_a, part_b) patterns of pairs that may overlap or cut each other.
+        name: Name used in the report.
+    """
+    report = InterferenceReport(name=name or ", ".join(part.part_no for part in parts))
+    boxes = {part.part_no: part_box(part) for part in parts}
+    tree = BoxTree((box, part_no) for part_no, box in boxes.items())
+    for i, j in tree.pairs():
+        (box_a, part_a), (box_b, part_b) = tree.items[i], tree.items[j]
+        report.candidates += 1
+        if not is_allowed(part_a, part_b, allowed):
+            report.overlaps.append(Overlap(part_a, part_b, box_a.intersection(box_b)))
+
+    for part in parts:
+        owner = boxes[part.part_no]
+        for feature in part_features(part):
+            if not feature.external_subtract:
+                continue
+            report.features += 1
+            face = owner.face(feature.side)
+            region = face_region(feature, face)
+            landing = {tree.items[i][1]: tree.items[i][0] for i in sorted(tree.query(region, touching=True))}
+            landing.pop(part.part_no, None)
+            target = classify_external(feature, owner, landing)
+            intended = target.target if target.status in (HIT, PARTIAL) else None
+            cut = outward_box(feature, face)
+            for other in tree.values(cut):
+                if other in (part.part_no, intended):
+                    continue
+                report.candidates += 1
+                if cuts_into(feature, cut, boxes[other]) and not is_allowed(part.part_no, other, allowed):
+                    report.cuts.append(StrayCut(feature, other))
+    return report
+
+
+def check_assembly(assembly, allowed=()) -> InterferenceReport:
+    return check_interference(assembly_parts(assembly), allowed=allowed, name=assembly.name)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Report unintended overlaps and cuts between the parts of assemblies.")
+    parser.add_argument("parts", nargs="*", help="Part numbers to check, shell style wildcards are allowed.")
+    parser.add_argument(
+        "--allow",
+        action="append",
+        default=[],
+        metavar="PART_A:PART_B",
+        help="A pair of parts that may overlap or cut each other, shell style wildcards are allowed.",
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    allowed = parse_allowed(args.allow)
+
+    from cycax_parts.build import motherboard_case
+
+    failed = 0
+    start = time.perf_counter()
+    for entry in default_registry().select(args.parts, kind=CASE):
+        report = check_assembly(motherboard_case(entry.load()(**dict(entry.params))), allowed)
+        if not report.ok:
+            failed += 1
+        for line in report.lines():
+            print(line)  # noqa: T201
+    logger.info("Checked in %.3fs", time.perf_counter() - start)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
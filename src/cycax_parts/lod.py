@@ -0,0 +1,122 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Level of detail proxies for previewing parts and assemblies.
+
+A proxy is made by dropping features from the saved part definition before the engine
+builds it, so the CAD kernel has fewer boolean operations to do and the exported meshes
+are smaller.
+
+    LOD0: The full definition.
+    LOD1: The added solids and the mounting holes, other cuts like nuts, vents and connector openings
+        are dropped. A part marks its mounting holes with patterns.mounting().
+    LOD2: One cube that spans the part and the solids added to it.
+
+The build cache is keyed on the saved definition, every level is cached on its own.
+"""
+
+import json
+import logging
+from pathlib import Path
+
+from cycax_parts.cache import definition_files
+from cycax_parts.geometry import Box, bounding, feature_box
+from cycax_parts.optimise import is_cut
+
+logger = logging.getLogger(__name__)
+
+LOD0 = 0
+LOD1 = 1
+LOD2 = 2
+LEVELS = (LOD0, LOD1, LOD2)
+
+SIZE_KEYS = ("x_size", "y_size", "z_size")
+
+
+def feature_key(feature: dict) -> str:
+    """A feature as normalised JSON, the exported feature and the saved one have the same key."""
+    return json.dumps(feature, sort_keys=True, separators=(",", ":"))
+
+
+def mounting_keys(part) -> frozenset:
+    """The keys of the features the part marked as its mounting holes, see patterns.mounting()."""
+    return frozenset(feature_key(feature) for feature in getattr(part, "mounting_features", ()))
+
+
+def keep_feature(feature: dict, lod: int, mounting: frozenset = frozenset()) -> bool:
+    """True when the feature is part of LOD0 or LOD1, LOD2 replaces all the features, see bounding_cube().
+
+    Args:
+        feature: The saved feature.
+        lod: The level of detail.
+        mounting: The keys of the mounting holes of the part, see mounting_keys().
+    """
+    if lod <= LOD0:
+        return True
+    return not is_cut(feature) or feature_key(feature) in mounting
+
+
+def lod_path(build_dir: Path, lod: int) -> Path:
+    """The directory the proxies of a level are built in, the full parts are built in build_dir."""
+    return build_dir if lod <= LOD0 else build_dir / f"lod{lod}"
+
+
+def bounding_cube(data: dict) -> dict | None:
+    """An added cube around the body of the part and every solid added to it, None when there is nothing to bound."""
+    size = tuple(data[key] for key in SIZE_KEYS) if all(key in data for key in SIZE_KEYS) else None
+    added = [feature for feature in data.get("features", []) if not is_cut(feature)]
+    boxes = [Box(0, 0, 0, *size)] if size else []
+    boxes.extend(feature_box(feature, size or (0, 0, 0)) for feature in added)
+    box = bounding(box for box in boxes if box is not None)
+    if box is None:
+        return None
+    # Start from an added cube of the part, it has the keys the engine expects.
+    template = next((feature for feature in added if feature.get("name") == "cube"), {"name": "cube", "type": "add"})
+    x_size, y_size, z_size = box.size
+    return {
+        **template,
+        "x": box.x0,
+        "y": box.y0,
+        "z": box.z0,
+        "x_size": x_size,
+        "y_size": y_size,
+        "z_size": z_size,
+        "center": False,
+    }
+
+
+def simplify_definition(data: dict, lod: int, mounting: frozenset = frozenset()) -> int:
+    """Reduce the features to the level of detail in place, returns the number removed."""
+    features = data.get("features", [])
+    if lod >= LOD2:
+        cube = bounding_cube(data)
+        kept = [] if cube is None else [cube]
+        if kept != features:
+            data["features"] = kept
+        return max(len(features) - len(kept), 0)
+    kept = [feature for feature in features if keep_feature(feature, lod, mounting)]
+    if len(kept) != len(features):
+        data["features"] = kept
+    return len(features) - len(kept)
+
+
+def simplify_saved_part(part_path: Path, lod: int, mounting: frozenset = frozenset()) -> int:
+    """Reduce the definition saved in a part directory to a level of detail, returns the number of features removed.
+
+    The mounting holes are given by mounting_keys() of the part.
+    """
+    if lod <= LOD0:
+        return 0
+    removed = 0
+    for path in definition_files(part_path):
+        data = json.loads(path.read_text())
+        if not isinstance(data, dict):
+            continue
+        count = simplify_definition(data, lod, mounting)
+        if count:
+            path.write_text(json.dumps(data, indent=4))
+            removed += count
+    if removed:
+        logger.debug("Removed %d features from %s for LOD%d", removed, part_path.name, lod)
+    return removed
@@ -0,0 +1,250 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Nest the flat patterns of sheet metal panels onto stock sheets for laser cutting.
+
+The flat pattern of a SheetMetal part is its outline with the through cuts on its top
+or bottom face, this includes the external-subtract cut-outs the neighbouring parts made
+in it. Panels of the same thickness are packed onto stock sheets with a first fit
+decreasing shelf heuristic, a panel is turned a quarter turn when that keeps its shelf
+low. Every sheet is written as an R12 DXF file with the inner cuts before the outlines,
+so a part is never cut free before its holes are done::
+
+    python -m cycax_parts.nesting --copies 20 --sheet 2500x1250 --output build/nesting
+"""
+
+import argparse
+import logging
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from cycax_parts.geometry import BOTTOM, TOP, feature_box, part_size
+from cycax_parts.incremental import assembly_parts
+from cycax_parts.registry import CASE, default_registry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SHEET = (2500.0, 1250.0)  # Stock sheet width and height, in mm.
+DEFAULT_KERF = 5.0  # Space between panels and from the sheet edge, in mm.
+CUT_LAYER = "CUT"
+OUTLINE_LAYER = "OUTLINE"
+SHEET_LAYER = "SHEET"
+
+
+@dataclass(frozen=True)
+class FlatPattern:
+    """The outline and through cuts of a panel, in the coordinates of the panel.
+
+    Args:
+        part_no: The part number of the panel.
+        width: Size of the outline along x.
+        height: Size of the outline along y.
+        thickness: The sheet thickness.
+        holes: The (x, y, diameter) of the round holes.
+        cutouts: The (x0, y0, x1, y1) of the rectangular cut-outs.
+    """
+
+    part_no: str
+    width: float
+    height: float
+    thickness: float
+    holes: tuple = ()
+    cutouts: tuple = ()
+
+    @property
+    def area(self) -> float:
+        return self.width * self.height
+
+
+@dataclass(frozen=True)
+class Nested:
+    """A panel placed on a sheet, a rotated panel is turned a quarter turn anticlockwise."""
+
+    pattern: FlatPattern
+    x: float
+    y: float
+    rotated: bool = False
+
+    @property
+    def size(self) -> tuple:
+        if self.rotated:
+            return (self.pattern.height, self.pattern.width)
+        return (self.pattern.width, self.pattern.height)
+
+    def point(self, x: float, y: float) -> tuple:
+        """A point of the pattern on the sheet."""
+        if self.rotated:
+            return (self.x + self.pattern.height - y, self.y + x)
+        return (self.x + x, self.y + y)
+
+
+@dataclass
+class SheetLayout:
+    """The panels on one stock sheet."""
+
+    width: float
+    height: float
+    thickness: float
+    panels: list = field(default_factory=list)
+
+    @property
+    def utilisation(self) -> float:
+        return sum(panel.pattern.area for panel in self.panels) / (self.width * self.height)
+
+
+def flat_pattern(part) -> FlatPattern:
+    """The flat pattern of a SheetMetal part from its features, the part may be placed and rotated."""
+    size = part_size(part)
+    width, height, thickness = size
+    holes = []
+    cutouts = []
+    for data in (feature.export() for feature in part.features):
+        if data.get("type", "cut") != "cut" or str(data.get("side", TOP)).upper() not in (TOP, BOTTOM):
+            continue
+        box = feature_box(data, size)
+        # Only cuts through the sheet show in the flat pattern.
+        if box is None or box.z0 > 0 or box.z1 < thickness:
+            continue
+        if data.get("name") == "hole":
+            holes.append((data.get("x", 0), data.get("y", 0), data["diameter"]))
+        else:
+            cutouts.append((max(box.x0, 0), max(box.y0, 0), min(box.x1, width), min(box.y1, height)))
+    return FlatPattern(part.part_no, width, height, thickness, tuple(holes), tuple(cutouts))
+
+
+def nest(patterns: list[FlatPattern], sheet: tuple = DEFAULT_SHEET, kerf: float = DEFAULT_KERF) -> list[SheetLayout]:
+    """Pack the panels onto as few stock sheets as the heuristic finds.
+
+    The panels are taken tallest first and go on the first shelf of any sheet they fit on.
+    A new shelf is opened on the first sheet with room left, else a new sheet is started.
+    Panels of different thickness never share a sheet.
+    """
+    sheet_width, sheet_height = sheet
+    layouts = []
+    for thickness in sorted({pattern.thickness for pattern in patterns}):
+        group = [pattern for pattern in patterns if pattern.thickness == thickness]
+        # Lay the long side horizontally, that keeps the shelves low.
+        group.sort(key=lambda pattern: (-min(pattern.width, pattern.height), -max(pattern.width, pattern.height)))
+        sheets = []  # [layout, shelves, used height], a shelf is [layout, x, y, height]
+        for pattern in group:
+            width, height = max(pattern.width, pattern.height), min(pattern.width, pattern.height)
+            rotated = pattern.height > pattern.width
+            if width + 2 * kerf > sheet_width:
+                # Stand it up instead.
+                width, height, rotated = height, width, not rotated
+            if width + 2 * kerf > sheet_width or height + 2 * kerf > sheet_height:
+                msg = (
+                    f"{pattern.part_no} ({pattern.width:g} x {pattern.height:g}) does not fit on a "
+                    f"{sheet_width:g} x {sheet_height:g} sheet"
+                )
+                raise ValueError(msg)
+            shelf = find_shelf(sheets, width, height, kerf)
+            if shelf is None:
+                for entry in sheets:
+                    if entry[2] + height + kerf <= sheet_height:
+                        break
+                else:
+                    entry = [SheetLayout(sheet_width, sheet_height, thickness), [], kerf]
+                    sheets.append(entry)
+                shelf = [entry[0], kerf, entry[2], height]
+                entry[1].append(shelf)
+                entry[2] += height + kerf
+            layout = shelf[0]
+            layout.panels.append(Nested(pattern, shelf[1], shelf[2], rotated))
+            shelf[1] += width + kerf
+        layouts.extend(entry[0] for entry in sheets)
+    return layouts
+
+
+def find_shelf(sheets: list, width: float, height: float, kerf: float) -> list | None:
+    """The first shelf on any sheet with room for a panel of the given size."""
+    for layout, shelves, _used in sheets:
+        for shelf in shelves:
+            if height <= shelf[3] and shelf[1] + width + kerf <= layout.width:
+                return shelf
+    return None
+
+
+def dxf_line(layer: str, start: tuple, end: tuple) -> str:
+    return f"0\nLINE\n8\n{layer}\n10\n{start[0]:.4f}\n20\n{start[1]:.4f}\n11\n{end[0]:.4f}\n21\n{end[1]:.4f}\n"
+
+
+def dxf_rectangle(layer: str, corners: list) -> str:
+    return "".join(dxf_line(layer, corners[i - 1], corners[i]) for i in range(len(corners)))
+
+
+def dxf_circle(layer: str, centre: tuple, diameter: float) -> str:
+    return f"0\nCIRCLE\n8\n{layer}\n10\n{centre[0]:.4f}\n20\n{centre[1]:.4f}\n40\n{diameter / 2:.4f}\n"
+
+
+def write_dxf(layout: SheetLayout, path: Path):
+    """Write the cut file of a sheet, inner cuts first then the panel outlines."""
+    inner = []
+    outlines = []
+    for panel in layout.panels:
+        pattern = panel.pattern
+        for x, y, diameter in pattern.holes:
+            inner.append(dxf_circle(CUT_LAYER, panel.point(x, y), diameter))
+        for x0, y0, x1, y1 in pattern.cutouts:
+            corners = [panel.point(x, y) for x, y in ((x0, y0), (x1, y0), (x1, y1), (x0, y1))]
+            inner.append(dxf_rectangle(CUT_LAYER, corners))
+        w, h = pattern.width, pattern.height
+        corners = [panel.point(x, y) for x, y in ((0, 0), (w, 0), (w, h), (0, h))]
+        outlines.append(dxf_rectangle(OUTLINE_LAYER, corners))
+    sheet = dxf_rectangle(SHEET_LAYER, [(0, 0), (layout.width, 0), (layout.width, layout.height), (0, layout.height)])
+    path.write_text("0\nSECTION\n2\nENTITIES\n" + sheet + "".join(inner) + "".join(outlines) + "0\nENDSEC\n0\nEOF\n")
+
+
+def sheet_metal_parts(entries) -> list:
+    """The SheetMetal parts of the entries, the panels of the case assemblies included."""
+    from cycax.cycad import SheetMetal
+
+    from cycax_parts.build import motherboard_case
+
+    parts = []
+    for entry in entries:
+        part = entry.load()(**dict(entry.params))
+        members = assembly_parts(motherboard_case(part)) if entry.kind == CASE else [part]
+        parts.extend(member for member in members if isinstance(member, SheetMetal))
+    return parts
+
+
+def parse_size(text: str) -> tuple:
+    width, _, height = text.lower().partition("x")
+    return (float(width), float(height))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Nest the sheet metal panels of the parts onto stock sheets.")
+    parser.add_argument("parts", nargs="*", help="Part numbers, shell style wildcards are allowed.")
+    parser.add_argument("-n", "--copies", type=int, default=1, help="Number of copies of every panel.")
+    parser.add_argument(
+        "--sheet", type=parse_size, default=DEFAULT_SHEET, help="Stock sheet size as WIDTHxHEIGHT in mm."
+    )
+    parser.add_argument("--kerf", type=float, default=DEFAULT_KERF, help="Space between the panels in mm.")
+    parser.add_argument("--output", type=Path, default=Path("./build/nesting"), help="Directory for the DXF files.")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    patterns = [flat_pattern(part) for part in sheet_metal_parts(default_registry().select(args.parts))]
+    if not patterns:
+        logger.error("No sheet metal panels found")
+        return 1
+    start = time.perf_counter()
+    layouts = nest(patterns * args.copies, args.sheet, args.kerf)
+    logger.info(
+        "Nested %d panels on %d sheets in %.3fs", len(patterns) * args.copies, len(layouts), time.perf_counter() - start
+    )
+    args.output.mkdir(parents=True, exist_ok=True)
+    for number, layout in enumerate(layouts, start=1):
+        path = args.output / f"sheet-{layout.thickness:g}mm-{number:03}.dxf"
+        write_dxf(layout, path)
+        logger.info("%s: %d panels, %.0f%% used", path.name, len(layout.panels), layout.utilisation * 100)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Remove redundant cuts from a saved part definition before the engine builds it.
+
+Every cut in the definition is a boolean operation in the CAD kernel. Cuts that are exact
+duplicates, or holes that lie completely inside a larger coaxial hole, do not change the
+shape and are dropped. A cut is only dropped when no material is added between it and
+the cut that contains it, so the resulting solid is identical.
+"""
+
+import json
+import logging
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from cycax_parts.cache import definition_files
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class OptimiseReport:
+    """What the optimisation removed from a part definition."""
+
+    part_no: str
+    before: int = 0
+    removed: list = field(default_factory=list)
+
+    @property
+    def after(self) -> int:
+        return self.before - len(self.removed)
+
+
+def is_cut(feature: dict) -> bool:
+    return feature.get("type", "cut") == "cut"
+
+
+def hole_depth(feature: dict) -> float:
+    depth = feature.get("depth")
+    return math.inf if depth is None else depth
+
+
+def contains(outer: dict, inner: dict) -> bool:
+    """True when the cut inner is completely inside the cut outer."""
+    if outer == inner:
+        return True
+    if outer.get("name") != "hole" or inner.get("name") != "hole":
+        return False
+    same_axis = all(outer.get(key) == inner.get(key) for key in ("side", "x", "y", "z"))
+    return (
+        same_axis
+        and inner.get("diameter", math.inf) <= outer.get("diameter", 0)
+        and hole_depth(inner) <= hole_depth(outer)
+    )
+
+
+def axis_key(feature: dict) -> tuple:
+    """The side and position of a feature, a cut only contains cuts with the same key."""
+    key = tuple(feature.get(key) for key in ("side", "x", "y", "z"))
+    try:
+        hash(key)
+    except TypeError:
+        return tuple(map(repr, key))
+    return key
+
+
+def optimise_features(features: list) -> tuple[list, list]:
+    """Split the features into those that are kept and the redundant cuts.
+
+    The cuts are grouped on the material added before them and on their axis, a cut is
+    only compared with the cuts in its own group.
+
+    Returns:
+        The kept features in their original order and the removed features.
+    """
+    groups = {}
+    added = 0
+    for i, feature in enumerate(features):
+        if is_cut(feature):
+            groups.setdefault((added, axis_key(feature)), []).append(i)
+        else:
+            added += 1
+    removed = set()
+    for group in groups.values():
+        for i in group:
+            inner = features[i]
+            for j in group:
+                if i == j or j in removed:
+                    continue
+                outer = features[j]
+                # Of two identical cuts the first one is kept.
+                if outer == inner and j > i:
+                    continue
+                if contains(outer, inner):
+                    removed.add(i)
+                    break
+    kept = [feature for i, feature in enumerate(features) if i not in removed]
+    return kept, [features[i] for i in sorted(removed)]
+
+
+def optimise_definition(data: dict) -> OptimiseReport:
+    """Remove redundant cuts from a part definition in place."""
+    features = data.get("features", [])
+    report = OptimiseReport(part_no=data.get("name", ""), before=len(features))
+    if features:
+        data["features"], report.removed = optimise_features(features)
+    return report
+
+
+def optimise_saved_part(part_path: Path) -> OptimiseReport | None:
+    """Optimise the definition saved in a part directory, the file is only rewritten when cuts were removed."""
+    report = None
+    for path in definition_files(part_path):
+        data = json.loads(path.read_text())
+        if not isinstance(data, dict):
+            continue
+        report = optimise_definition(data)
+        if report.removed:
+            path.write_text(json.dumps(data, indent=4))
+            logger.info(
+                "Removed %d redundant cuts from %s (%d -> %d)",
+                len(report.removed),
+                report.part_no or part_path.name,
+                report.before,
+                report.after,
+            )
+    return report
@@ -0,0 +1,164 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Only write the build outputs that changed.
+
+The build runs in a staging directory next to the build directory. The staging directory
+is seeded with the current outputs, so incremental builds still find them, and when the
+build is done every staged file is compared with the published one:
+
+- A file the build did not touch is still a hard link to the published file and is skipped.
+- A file with the same content is left alone, the published file keeps its mtime.
+- A new or changed file is renamed into place, readers never see a partial file.
+- A published file the build removed is deleted.
+
+The outputs of a job that failed are not published, the build directory keeps the outputs
+of its last good build. STEP files carry the time of export in their header, it is
+ignored in the comparison.
+What changed is listed in changes.json in the build directory, a run where nothing
+changed writes nothing else.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from cycax_parts.cache import replace_file
+
+logger = logging.getLogger(__name__)
+
+CHANGES_FILE = "changes.json"
+STEP_SUFFIXES = (".step", ".stp")
+STEP_HEADER_SIZE = 64 * 1024
+# FILE_NAME('name', 'time stamp', ...
+STEP_TIMESTAMP = re.compile(rb"(FILE_NAME\s*\(\s*'(?:[^']|'')*'\s*,\s*)'[^']*'")
+CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class OutputReport:
+    """The files in the build directory that the build changed, relative to the build directory."""
+
+    added: list = field(default_factory=list)
+    changed: list = field(default_factory=list)
+    removed: list = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def written(self) -> int:
+        return len(self.added) + len(self.changed) + len(self.removed)
+
+    def as_dict(self) -> dict:
+        return {"added": self.added, "changed": self.changed, "removed": self.removed, "unchanged": self.unchanged}
+
+
+def content_digest(path: Path) -> str:
+    """The sha256 of a file, for STEP files without the export time stamp."""
+    digest = hashlib.sha256()
+    with path.open("rb") as stream:
+        if path.suffix.lower() in STEP_SUFFIXES:
+            digest.update(STEP_TIMESTAMP.sub(rb"\1''", stream.read(STEP_HEADER_SIZE), count=1))
+        while chunk := stream.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def same_content(staged: Path, published: Path) -> bool:
+    if not published.is_file():
+        return False
+    if os.path.samefile(staged, published):
+        return True
+    if published.suffix.lower() not in STEP_SUFFIXES and staged.stat().st_size != published.stat().st_size:
+        return False
+    return content_digest(staged) == content_digest(published)
+
+
+def relative_files(path: Path) -> set[Path]:
+    return {item.relative_to(path) for item in path.rglob("*") if item.is_file() or item.is_symlink()}
+
+
+def seed(build_dir: Path, staging: Path):
+    """Fill the staging directory with the published outputs.
+
+    Outputs are hard linked, the build always removes an output before it writes it. The
+    JSON files are rewritten in place by part.save() and the fingerprints, they are copied.
+    """
+    for rel in relative_files(build_dir):
+        if rel == Path(CHANGES_FILE):
+            continue
+        src = build_dir / rel
+        dest = staging / rel
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        replace_file(src, dest, link=src.suffix != ".json")
+
+
+def is_published(rel: Path, built) -> bool:
+    """True for files in the top of the build directory and in the directories of the jobs that succeeded."""
+    return built is None or len(rel.parts) == 1 or rel.parts[0] in built
+
+
+def publish(staging: Path, build_dir: Path, built=None) -> OutputReport:
+    """Move the staged files that changed into the build directory, see the module documentation.
+
+    Args:
+        staging: The staging directory.
+        build_dir: The build directory.
+        built: Names of the part and assembly directories whose job succeeded, the others are
+            left as they are. None publishes every directory.
+    """
+    report = OutputReport()
+    staged = relative_files(staging)
+    for rel in sorted(staged):
+        src = staging / rel
+        dest = build_dir / rel
+        if not is_published(rel, built) or same_content(src, dest):
+            report.unchanged += 1
+            continue
+        (report.changed if dest.exists() else report.added).append(str(rel))
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(src, dest)
+    for rel in sorted(relative_files(build_dir) - staged - {Path(CHANGES_FILE)}):
+        if not is_published(rel, built):
+            continue
+        (build_dir / rel).unlink()
+        report.removed.append(str(rel))
+    (build_dir / CHANGES_FILE).write_text(json.dumps(report.as_dict(), indent=4))
+    return report
+
+
+@contextmanager
+def staged_output(build_dir: Path, built=None):
+    """Run the build in a staging directory and publish only the outputs that changed.
+
+    Args:
+        build_dir: The build directory.
+        built: A set the caller fills with the names of the part and assembly directories
+            whose job succeeded before the block ends, see publish().
+
+    Yields:
+        The staging directory to build in.
+    """
+    build_dir.mkdir(parents=True, exist_ok=True)
+    # Next to the build directory, on the same file system, so the outputs can be renamed into place.
+    staging = Path(tempfile.mkdtemp(dir=build_dir.parent, prefix=f".{build_dir.name}.staging-"))
+    try:
+        seed(build_dir, staging)
+        yield staging
+        report = publish(staging, build_dir, built)
+        logger.info(
+            "%d outputs added, %d changed, %d removed and %d unchanged",
+            len(report.added),
+            len(report.changed),
+            len(report.removed),
+            report.unchanged,
+        )
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
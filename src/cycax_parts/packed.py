@@ -0,0 +1,294 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""A compact binary form of the part definitions written by part.save().
+
+The features are stored as a columnar table after a small JSON header. Features with the
+same keys, in the same order, share a schema and every key of a schema is a column:
+
+- Columns of floats or of integers are packed as 8 byte arrays.
+- Columns of strings, like the feature name and side, are stored as indices into the
+  list of distinct values kept in the header.
+- Anything else is stored as JSON.
+
+The header holds everything but the features, the offset of every column and the
+bounding box of the part, so a tool can read the metadata without decoding a feature. A
+single column is decoded on its own. Unpacking gives a definition equal to the JSON
+one, key order and the difference between 1 and 1.0 included::
+
+    python -m cycax_parts.packed pack build/
+    python -m cycax_parts.packed info build/conn-cube/conn-cube.cyp
+"""
+
+import argparse
+import json
+import logging
+import struct
+import sys
+from array import array
+from functools import cached_property
+from pathlib import Path
+
+from cycax_parts.cache import definition_files
+from cycax_parts.geometry import Box, bounding, feature_box
+from cycax_parts.incremental import FINGERPRINT_FILE, INSTANCES_FILE
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"CYCP"
+VERSION = 1
+SUFFIX = ".cyp"
+PREAMBLE = struct.Struct("<4sBI")  # Magic, version and header length.
+FEATURES_KEY = "features"
+SIZE_KEYS = ("x_size", "y_size", "z_size")
+# Written next to the definitions of an assembly by the build, they are not definitions.
+BUILD_STATE_FILES = (FINGERPRINT_FILE, INSTANCES_FILE)
+# Array type codes with a fixed size on every platform.
+FLOATS = "d"
+INTEGERS = "q"
+INDEX_CODES = ("B", "H", "I")
+INT64_RANGE = (-(2**63), 2**63 - 1)
+
+
+def is_float(value) -> bool:
+    return type(value) is float
+
+
+def is_int(value) -> bool:
+    return type(value) is int and INT64_RANGE[0] <= value <= INT64_RANGE[1]
+
+
+def index_code(count: int) -> str:
+    for code in INDEX_CODES:
+        if count <= 2 ** (8 * array(code).itemsize):
+            return code
+    msg = f"Too many distinct values: {count}"
+    raise ValueError(msg)
+
+
+class Writer:
+    """Collects the binary blocks and records where each one starts."""
+
+    def __init__(self):
+        self.blocks = []
+        self.offset = 0
+
+    def add(self, data: bytes) -> dict:
+        self.blocks.append(data)
+        block = {"offset": self.offset, "length": len(data)}
+        self.offset += len(data)
+        return block
+
+    def add_array(self, code: str, values) -> dict:
+        data = array(code, values)
+        if sys.byteorder != "little":
+            data.byteswap()
+        return {**self.add(data.tobytes()), "type": code}
+
+
+def encode_column(writer: Writer, values: list) -> dict:
+    if all(is_float(value) for value in values):
+        return writer.add_array(FLOATS, values)
+    if all(is_int(value) for value in values):
+        return writer.add_array(INTEGERS, values)
+    if all(type(value) is str for value in values):
+        distinct = list(dict.fromkeys(values))
+        lookup = {value: i for i, value in enumerate(distinct)}
+        return {**writer.add_array(index_code(len(distinct)), [lookup[value] for value in values]), "values": distinct}
+    return {**writer.add(json.dumps(values, separators=(",", ":")).encode()), "type": "json"}
+
+
+def decode_column(column: dict, data: bytes) -> list:
+    code = column["type"]
+    if code == "json":
+        return json.loads(data)
+    values = array(code)
+    values.frombytes(data)
+    if sys.byteorder != "little":
+        values.byteswap()
+    if "values" in column:
+        distinct = column["values"]
+        return [distinct[i] for i in values]
+    return values.tolist()
+
+
+def definition_bounds(meta: dict, features: list) -> list | None:
+    """The (x0, y0, z0, x1, y1, z1) around the part and its features, None when the size is not known."""
+    if not all(isinstance(meta.get(key), (int, float)) for key in SIZE_KEYS):
+        return None
+    size = tuple(meta[key] for key in SIZE_KEYS)
+    boxes = []
+    for feature in features:
+        try:
+            box = feature_box(feature, size)
+        except (KeyError, TypeError):
+            continue
+        if box is not None:
+            boxes.append(box)
+    box = bounding([Box(0, 0, 0, *size), *boxes])
+    return [box.x0, box.y0, box.z0, box.x1, box.y1, box.z1]
+
+
+def pack(data) -> bytes:
+    """Pack a part definition, as loaded from its JSON file."""
+    writer = Writer()
+    features = data.get(FEATURES_KEY) if isinstance(data, dict) else None
+    if not isinstance(features, list) or not all(isinstance(feature, dict) for feature in features):
+        header = {"document": data}
+    else:
+        meta = {key: value for key, value in data.items() if key != FEATURES_KEY}
+        schemas = {}
+        schema_of = []
+        for feature in features:
+            keys = tuple(feature)
+            schema_of.append(schemas.setdefault(keys, len(schemas)))
+        tables = []
+        for keys, number in schemas.items():
+            rows = [feature for feature, schema in zip(features, schema_of, strict=True) if schema == number]
+            columns = {key: encode_column(writer, [row[key] for row in rows]) for key in keys}
+            tables.append({"keys": list(keys), "count": len(rows), "columns": columns})
+        header = {
+            "meta": meta,
+            "order": list(data),
+            "count": len(features),
+            "schema_of": writer.add_array(index_code(len(schemas)), schema_of),
+            "schemas": tables,
+            "bounds": definition_bounds(meta, features),
+        }
+    header_bytes = json.dumps(header, separators=(",", ":")).encode()
+    return PREAMBLE.pack(MAGIC, VERSION, len(header_bytes)) + header_bytes + b"".join(writer.blocks)
+
+
+class PackedPart:
+    """A packed part definition, read lazily from a file.
+
+    Only the header is read when the object is created, the features are decoded when
+    they are first used.
+
+    Args:
+        path: The packed definition file.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with self.path.open("rb") as stream:
+            magic, version, length = PREAMBLE.unpack(stream.read(PREAMBLE.size))
+            if magic != MAGIC or version != VERSION:
+                msg = f"{self.path} is not a version {VERSION} packed part definition"
+                raise ValueError(msg)
+            self.header = json.loads(stream.read(length))
+        self.data_offset = PREAMBLE.size + length
+
+    @property
+    def meta(self) -> dict:
+        """The definition without its features."""
+        return self.header.get("meta", {})
+
+    @property
+    def bounds(self) -> tuple | None:
+        """The (x0, y0, z0, x1, y1, z1) around the part and its features."""
+        bounds = self.header.get("bounds")
+        return tuple(bounds) if bounds else None
+
+    def __len__(self) -> int:
+        return self.header.get("count", 0)
+
+    def read(self, block: dict) -> bytes:
+        with self.path.open("rb") as stream:
+            stream.seek(self.data_offset + block["offset"])
+            return stream.read(block["length"])
+
+    def column(self, key: str) -> list:
+        """The value of one key for every feature, None for the features without the key."""
+        schema_of = self.schema_of
+        values = [None] * len(schema_of)
+        for number, table in enumerate(self.header.get("schemas", [])):
+            if key not in table["columns"]:
+                continue
+            column = decode_column(table["columns"][key], self.read(table["columns"][key]))
+            rows = (i for i, schema in enumerate(schema_of) if schema == number)
+            for i, value in zip(rows, column, strict=True):
+                values[i] = value
+        return values
+
+    @cached_property
+    def schema_of(self) -> list:
+        if "schema_of" not in self.header:
+            return []
+        return decode_column(self.header["schema_of"], self.read(self.header["schema_of"]))
+
+    @cached_property
+    def features(self) -> list:
+        tables = []
+        for table in self.header.get("schemas", []):
+            if not table["keys"]:
+                # Features without keys have no columns to count the rows of.
+                tables.append(iter([{} for _ in range(table["count"])]))
+                continue
+            columns = [decode_column(table["columns"][key], self.read(table["columns"][key])) for key in table["keys"]]
+            tables.append(iter([dict(zip(table["keys"], row, strict=True)) for row in zip(*columns, strict=True)]))
+        return [next(tables[schema]) for schema in self.schema_of]
+
+    def definition(self):
+        """The full definition, equal to the JSON it was packed from."""
+        if "document" in self.header:
+            return self.header["document"]
+        meta = self.meta
+        return {key: self.features if key == FEATURES_KEY else meta[key] for key in self.header["order"]}
+
+
+def part_definitions(path: Path) -> list[Path]:
+    """The part definition files of a JSON file or of every part directory below a directory."""
+    if not path.is_dir():
+        return [path]
+    part_paths = sorted({json_path.parent for json_path in path.rglob("*.json")} - {path})
+    return [
+        json_path
+        for part_path in part_paths
+        for json_path in definition_files(part_path)
+        if json_path.name not in BUILD_STATE_FILES
+    ]
+
+
+def pack_file(json_path: Path) -> Path:
+    """Write the packed form of a JSON definition next to it, returns the packed file."""
+    packed_path = json_path.with_suffix(SUFFIX)
+    packed_path.write_bytes(pack(json.loads(json_path.read_text())))
+    return packed_path
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Pack part definitions into the compact binary form and back.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    pack_parser = commands.add_parser("pack", help="Pack the JSON definitions in a build directory.")
+    pack_parser.add_argument(
+        "paths", nargs="+", type=Path, help="JSON files or build directories searched for part definitions."
+    )
+    info_parser = commands.add_parser("info", help="Show the header of packed definitions.")
+    info_parser.add_argument("paths", nargs="+", type=Path)
+    unpack_parser = commands.add_parser("unpack", help="Print a packed definition as JSON.")
+    unpack_parser.add_argument("path", type=Path)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    if args.command == "pack":
+        before = after = 0
+        for path in args.paths:
+            for json_path in part_definitions(path):
+                packed_path = pack_file(json_path)
+                before += json_path.stat().st_size
+                after += packed_path.stat().st_size
+        logger.info("Packed %d bytes of JSON into %d bytes", before, after)
+    elif args.command == "info":
+        for path in args.paths:
+            part = PackedPart(path)
+            name = part.meta.get("name", path.stem)
+            print(f"{name:40} {len(part):6} features  bounds {part.bounds}")  # noqa: T201
+    else:
+        print(json.dumps(PackedPart(args.path).definition(), indent=4))  # noqa: T201
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,302 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Find a small enclosure for a set of boards and power supplies.
+
+Parts stand on the base of the enclosure and may be turned a quarter turn about the
+vertical axis. Every part is kept a gap away from its neighbours and the walls. The
+search tries combinations of orientations against a range of enclosure widths, and packs
+the footprints into shelves, first fit by decreasing depth. Every combination is tried
+when there are few parts, for more parts a random sample of them is tried. Only boxes
+are involved so a layout takes microseconds to evaluate and thousands are tried per
+second.
+
+The best layout is turned into an Assembly with the SheetMetal base, walls and lid sized
+to fit::
+
+    python -m cycax_parts.packing motherboard-mini-itx psu-meanwell-15v --gap 10
+"""
+
+import argparse
+import itertools
+import logging
+import math
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from cycax_parts.geometry import TOLERANCE, part_size
+from cycax_parts.registry import default_registry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GAP = 5.0  # Free space around every part, in mm.
+DEFAULT_HEADROOM = 10.0  # Free space above the tallest part, in mm.
+DEFAULT_THICKNESS = 2.0  # Thickness of the sheet metal panels, in mm.
+MAX_ORIENTATIONS = 4096
+MAX_WIDTHS = 32
+
+
+@dataclass(frozen=True)
+class Item:
+    """A part to place in the enclosure.
+
+    Args:
+        part_no: The part number of the part.
+        size: The (x, y, z) size of the part.
+        gap: Free space kept between the part and anything else.
+        rotate: The part may be turned a quarter turn about the z axis.
+    """
+
+    part_no: str
+    size: tuple
+    gap: float = DEFAULT_GAP
+    rotate: bool = True
+
+    @classmethod
+    def from_part(cls, part, gap: float = DEFAULT_GAP, *, rotate: bool = True) -> "Item":
+        return cls(part.part_no, part_size(part), gap, rotate)
+
+    def orientations(self) -> list[tuple]:
+        """The (width, depth, rotated) footprints of the part including its gap."""
+        x, y, _z = self.size
+        found = [(x + self.gap, y + self.gap, False)]
+        if self.rotate and abs(x - y) > TOLERANCE:
+            found.append((y + self.gap, x + self.gap, True))
+        return found
+
+
+@dataclass(frozen=True)
+class Placement:
+    """Where a part is placed, relative to the inside front left corner of the enclosure."""
+
+    part_no: str
+    x: float
+    y: float
+    rotated: bool
+
+
+@dataclass
+class Layout:
+    """The best layout found for a set of parts.
+
+    Attributes:
+        placements: Where every part goes.
+        size: The (x, y, z) inside size of the enclosure.
+        evaluated: The number of layouts that were tried.
+        seconds: Time spent on the search.
+    """
+
+    placements: list = field(default_factory=list)
+    size: tuple = (0.0, 0.0, 0.0)
+    evaluated: int = 0
+    seconds: float = 0.0
+
+    @property
+    def volume(self) -> float:
+        x, y, z = self.size
+        return x * y * z
+
+    def lines(self) -> list[str]:
+        x, y, z = self.size
+        lines = [f"Enclosure {x:g} x {y:g} x {z:g} mm, {self.evaluated} layouts in {self.seconds * 1000:.1f} ms"]
+        for placement in self.placements:
+            turned = " turned" if placement.rotated else ""
+            lines.append(f"  {placement.part_no:40} at ({placement.x:g}, {placement.y:g}){turned}")
+        return lines
+
+
+def thin(values: list, limit: int) -> list:
+    """An evenly spaced selection of at most limit values from a sorted list, the first and last included."""
+    if len(values) <= limit:
+        return values
+    step = (len(values) - 1) / (limit - 1)
+    return [values[round(i * step)] for i in range(limit)]
+
+
+def candidate_widths(choices: list, limit: int = MAX_WIDTHS) -> list[float]:
+    """Enclosure widths worth trying, the sums of the widths of subsets of the parts in any orientation.
+
+    The sums are thinned as they are collected so this stays fast for many parts. When
+    there are more than limit widths an evenly spaced selection is returned.
+
+    Args:
+        choices: The orientations of every item, see Item.orientations().
+    """
+    # Every orientation must fit across the enclosure of some layout.
+    narrowest = max(min(width for width, _depth, _rotated in orientations) for orientations in choices)
+    sums = [0.0]
+    for orientations in choices:
+        widths = {width for width, _depth, _rotated in orientations}
+        sums = thin(sorted({total + width for total in sums for width in widths} | set(sums)), limit * limit)
+    return thin([width for width in sums if width >= narrowest - TOLERANCE], limit)
+
+
+def orientation_combos(choices: list, limit: int, seed: int = 0):
+    """Combinations of orientations, one per item.
+
+    All of them when there are at most limit, else the two with every part the same way
+    around and a random sample of the others.
+    """
+    if math.prod(len(orientations) for orientations in choices) <= limit:
+        yield from itertools.product(*choices)
+        return
+    rng = random.Random(seed)  # noqa: S311
+    seen = set()
+    picks = [tuple(0 for _ in choices), tuple(len(orientations) - 1 for orientations in choices)]
+    attempts = 0
+    while len(seen) < limit and attempts < 4 * limit:
+        pick = picks.pop() if picks else tuple(rng.randrange(len(orientations)) for orientations in choices)
+        attempts += 1
+        if pick in seen:
+            continue
+        seen.add(pick)
+        yield tuple(orientations[i] for orientations, i in zip(choices, pick, strict=True))
+
+
+def shelf_pack(footprints: list, width: float) -> tuple[float, float, list]:
+    """Pack (width, depth) footprints into shelves across a strip, first fit by decreasing depth.
+
+    Returns:
+        The used width, the used depth and the (x, y) of every footprint in the given order.
+    """
+    order = sorted(range(len(footprints)), key=lambda i: (-footprints[i][1], -footprints[i][0]))
+    shelves = []  # [used width, y, depth]
+    positions = [None] * len(footprints)
+    depth = used = 0.0
+    for i in order:
+        item_width, item_depth = footprints[i]
+        for shelf in shelves:
+            if shelf[0] + item_width <= width + TOLERANCE:
+                break
+        else:
+            shelf = [0.0, depth, item_depth]
+            shelves.append(shelf)
+            depth += item_depth
+        positions[i] = (shelf[0], shelf[1])
+        shelf[0] += item_width
+        used = max(used, shelf[0])
+    return used, depth, positions
+
+
+def pack(items: list[Item], headroom: float = DEFAULT_HEADROOM, max_orientations: int = MAX_ORIENTATIONS) -> Layout:
+    """Search for the layout of the items with the smallest enclosure.
+
+    Args:
+        items: The parts to place.
+        headroom: Free space above the tallest part.
+        max_orientations: At most this many combinations of orientations are tried.
+    """
+    if not items:
+        msg = "Nothing to pack"
+        raise ValueError(msg)
+    start = time.perf_counter()
+    height = max(item.size[2] for item in items) + headroom
+    # The footprints carry the gap of their part, half of the largest gap more keeps the walls clear too.
+    margin = max(item.gap for item in items) / 2
+    best = None
+    evaluated = 0
+    choices = [item.orientations() for item in items]
+    widths = candidate_widths(choices)
+    for combo in orientation_combos(choices, max_orientations):
+        footprints = [(width, depth) for width, depth, _rotated in combo]
+        widest = max(width for width, _depth in footprints)
+        for width in widths:
+            if width < widest - TOLERANCE:
+                continue
+            used, depth, positions = shelf_pack(footprints, width)
+            evaluated += 1
+            area = (used + 2 * margin) * (depth + 2 * margin)
+            if best is None or area < best[0] - TOLERANCE:
+                best = (area, used, depth, combo, positions)
+    _area, used, depth, combo, positions = best
+    placements = [
+        Placement(item.part_no, x + margin + item.gap / 2, y + margin + item.gap / 2, rotated)
+        for item, (_width, _depth, rotated), (x, y) in zip(items, combo, positions, strict=True)
+    ]
+    return Layout(
+        placements=placements,
+        size=(used + 2 * margin, depth + 2 * margin, height),
+        evaluated=evaluated,
+        seconds=time.perf_counter() - start,
+    )
+
+
+def enclosure_assembly(layout: Layout, parts: list, name: str, thickness: float = DEFAULT_THICKNESS):
+    """An Assembly of the parts placed as in the layout, in a SheetMetal enclosure sized to fit.
+
+    The base and lid cover the walls, the front and back walls cover the side walls.
+    """
+    from cycax.cycad import Assembly, SheetMetal
+
+    x_size, y_size, z_size = layout.size
+    assembly = Assembly(name)
+    base = SheetMetal(
+        x_size=x_size + 2 * thickness, y_size=y_size + 2 * thickness, z_size=thickness, part_no=f"{name}-base"
+    )
+    lid = SheetMetal(
+        x_size=x_size + 2 * thickness, y_size=y_size + 2 * thickness, z_size=thickness, part_no=f"{name}-lid"
+    )
+    front = SheetMetal(x_size=x_size + 2 * thickness, y_size=z_size, z_size=thickness, part_no=f"{name}-front")
+    back = SheetMetal(x_size=x_size + 2 * thickness, y_size=z_size, z_size=thickness, part_no=f"{name}-back")
+    left = SheetMetal(x_size=y_size, y_size=z_size, z_size=thickness, part_no=f"{name}-left")
+    right = SheetMetal(x_size=y_size, y_size=z_size, z_size=thickness, part_no=f"{name}-right")
+    for panel in (base, lid, front, back, left, right):
+        assembly.add(panel)
+    for panel in (front, back):
+        panel.rotate("x")
+    for panel in (left, right):
+        panel.rotate("x")
+        panel.rotate("z")
+    front.level(front=base.front, bottom=base.top, left=base.left)
+    back.level(back=base.back, bottom=base.top, left=base.left)
+    left.level(left=base.left, front=front.back, bottom=base.top)
+    right.level(right=base.right, front=front.back, bottom=base.top)
+    lid.level(bottom=front.top, front=base.front, left=base.left)
+
+    by_part_no = {part.part_no: part for part in parts}
+    for placement in layout.placements:
+        part = by_part_no[placement.part_no]
+        assembly.add(part)
+        if placement.rotated:
+            part.rotate("z")
+        part.level(left=left.right, front=front.back, bottom=base.top)
+        part.move(x=placement.x, y=placement.y)
+    return assembly
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Find the smallest enclosure for a set of parts.")
+    parser.add_argument("parts", nargs="+", help="Part numbers to place, shell style wildcards are allowed.")
+    parser.add_argument("--gap", type=float, default=DEFAULT_GAP, help="Free space around every part in mm.")
+    parser.add_argument("--headroom", type=float, default=DEFAULT_HEADROOM, help="Free space above the parts in mm.")
+    parser.add_argument("--fixed", action="append", default=[], help="Part numbers that may not be turned.")
+    parser.add_argument("--name", default="enclosure", help="Name of the enclosure assembly.")
+    parser.add_argument("--build-dir", type=Path, help="Save and build the enclosure assembly in this directory.")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    parts = [entry.load()(**dict(entry.params)) for entry in default_registry().select(args.parts)]
+    if not parts:
+        logger.error("No parts match %s", " ".join(args.parts))
+        return 1
+    items = [Item.from_part(part, args.gap, rotate=part.part_no not in args.fixed) for part in parts]
+    layout = pack(items, headroom=args.headroom)
+    for line in layout.lines():
+        print(line)  # noqa: T201
+    if args.build_dir:
+        from cycax.cycad.engines.assembly_build123d import AssemblyBuild123d
+        from cycax.cycad.engines.part_build123d import PartEngineBuild123d
+
+        from cycax_parts.incremental import build_assembly
+
+        assembly = enclosure_assembly(layout, parts, args.name)
+        build_assembly(assembly, args.build_dir / assembly.name, AssemblyBuild123d(args.name), PartEngineBuild123d)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
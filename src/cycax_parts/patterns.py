@@ -0,0 +1,211 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Patterns of features placed on the side of a part in one go.
+
+Most mounting patterns are a set of positions that each get the same holes, typically a
+hole in the part and a clearance hole subtracted from the part it is mounted to. Holes
+made inside a mounting() block are the mounting holes of the part, the level of detail
+proxies keep those and drop the other cuts.
+
+Vent patterns fill an area of a side with openings. The positions are calculated once
+for a given pattern and cached. Every opening is still its own hole or box feature, and so
+its own boolean in the engine. Cutting a vent as one precomputed tool solid needs support
+in the cycax part engine, until then the build time grows with the number of openings.
+"""
+
+import math
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import cache
+
+from cycax_parts.form_factors import PositionTable
+
+
+@dataclass(frozen=True)
+class HoleSpec:
+    """The holes made at every position of a pattern.
+
+    Args:
+        diameter: Diameter of the hole.
+        depth: Depth of the hole, None goes through the part.
+        external_subtract: Subtract the hole from the parts this part is attached to.
+    """
+
+    diameter: float
+    depth: float | None = None
+    external_subtract: bool = False
+
+    def make(self, side, pos: tuple[float, float]):
+        kwargs = {"pos": pos, "diameter": self.diameter}
+        if self.depth is not None:
+            kwargs["depth"] = self.depth
+        if self.external_subtract:
+            kwargs["external_subtract"] = True
+        side.hole(**kwargs)
+
+
+@dataclass(frozen=True)
+class HolePattern:
+    """Holes of one or more specs at an array of positions.
+
+    Args:
+        positions: N (x, y) positions on the side or a PositionTable.
+        specs: The holes made at each position.
+
+    Example:
+        HolePattern(((3.81, 3.81), (106.04, 3.81)), ODROID_MOUNTING).apply(self.bottom)
+    """
+
+    positions: tuple
+    specs: tuple
+
+    def __post_init__(self):
+        if isinstance(self.positions, PositionTable):
+            # The tables are already immutable, do not convert them on every definition() call.
+            positions = self.positions.positions
+        else:
+            positions = tuple((float(x), float(y)) for x, y in self.positions)
+        specs = (self.specs,) if isinstance(self.specs, HoleSpec) else tuple(self.specs)
+        if not specs:
+            msg = "A hole pattern needs at least one hole spec."
+            raise ValueError(msg)
+        object.__setattr__(self, "positions", positions)
+        object.__setattr__(self, "specs", specs)
+
+    def __len__(self):
+        return len(self.positions) * len(self.specs)
+
+    def apply(self, side):
+        """Make the holes on the side of a part, grouped by spec."""
+        for spec in self.specs:
+            for pos in self.positions:
+                spec.make(side, pos)
+
+    def moved(self, x: float = 0, y: float = 0) -> "HolePattern":
+        """The same pattern shifted on the side."""
+        return HolePattern(tuple((px + x, py + y) for px, py in self.positions), self.specs)
+
+
+@contextmanager
+def mounting(part):
+    """Mark the features made on the part in the block as its mounting holes.
+
+    Holes with external_subtract are made in the parts this part is attached to, they are
+    not features of the part and are not marked.
+
+    Example:
+        with mounting(self):
+            HolePattern(ODROID_H3_MOUNTING, ODROID_MOUNTING).apply(self.bottom)
+    """
+    start = len(part.features)
+    yield
+    marked = getattr(part, "mounting_features", ())
+    part.mounting_features = (*marked, *(feature.export() for feature in part.features[start:]))
+
+
+HEX = "hex"
+GRID = "grid"
+SLOT = "slot"
+VENT_KINDS = (HEX, GRID, SLOT)
+
+
+@cache
+def vent_openings(kind: str, area: tuple, size: float, web: float, round_area: bool) -> tuple:  # noqa: FBT001
+    """The openings of a vent pattern, centred in the area.
+
+    Returns:
+        The (x, y) centres of the holes for HEX and GRID, the (x0, y0, x1, y1) of the slots for SLOT.
+    """
+    x0, y0, x1, y1 = area
+    width, height = x1 - x0, y1 - y0
+    pitch = size + web
+    if kind == SLOT:
+        # The slots run along the long side of the area.
+        across = height if width >= height else width
+        count = max(int((across + web) // pitch), 0)
+        start = (across - (count * pitch - web)) / 2
+        if width >= height:
+            return tuple((x0, y0 + start + i * pitch, x1, y0 + start + i * pitch + size) for i in range(count))
+        return tuple((x0 + start + i * pitch, y0, x0 + start + i * pitch + size, y1) for i in range(count))
+
+    row_pitch = pitch * math.sqrt(3) / 2 if kind == HEX else pitch
+    rows = max(int((height - size) // row_pitch) + 1, 0) if height >= size else 0
+    columns = max(int((width - size) // pitch) + 1, 0) if width >= size else 0
+    centre = ((x0 + x1) / 2, (y0 + y1) / 2)
+    limit = min(width, height) / 2 - size / 2
+    first_y = centre[1] - (rows - 1) * row_pitch / 2
+    openings = []
+    for row in range(rows):
+        y = first_y + row * row_pitch
+        # Every other row of a hex pattern is shifted by half a pitch and has one hole less.
+        shifted = kind == HEX and row % 2 == 1
+        count = columns - 1 if shifted else columns
+        first_x = centre[0] - (count - 1) * pitch / 2
+        for column in range(count):
+            x = first_x + column * pitch
+            if round_area and math.hypot(x - centre[0], y - centre[1]) > limit:
+                continue
+            openings.append((round(x, 6), round(y, 6)))
+    return tuple(openings)
+
+
+@dataclass(frozen=True)
+class VentPattern:
+    """Ventilation openings filling a rectangular area of a side.
+
+    Args:
+        area: The (x0, y0, x1, y1) of the area on the side.
+        kind: HEX for round holes on a hexagonal grid, GRID for round holes on a square grid
+            or SLOT for parallel slots.
+        size: The diameter of the holes or the width of the slots.
+        web: The material left between neighbouring openings.
+        round_area: Only fill the circle inside the area, for fan grills. Not for SLOT.
+        external_subtract: Cut the openings from the parts this part is attached to, the part
+            itself is left solid. The cuts then cost build time in those parts instead.
+
+    Example:
+        VentPattern((15, 10, 135, 130), HEX, size=5, round_area=True, external_subtract=True).apply(self.bottom)
+    """
+
+    area: tuple
+    kind: str = HEX
+    size: float = 5.0
+    web: float = 1.5
+    round_area: bool = False
+    external_subtract: bool = False
+
+    def __post_init__(self):
+        if self.kind not in VENT_KINDS:
+            msg = f"Unknown vent kind {self.kind!r}, expected one of {', '.join(VENT_KINDS)}."
+            raise ValueError(msg)
+        if self.round_area and self.kind == SLOT:
+            msg = "A round area is only supported for HEX and GRID vents."
+            raise ValueError(msg)
+        if self.size <= 0 or self.web < 0:
+            msg = "A vent needs a positive opening size and a web that is not negative."
+            raise ValueError(msg)
+        object.__setattr__(self, "area", tuple(float(value) for value in self.area))
+
+    @property
+    def openings(self) -> tuple:
+        return vent_openings(self.kind, self.area, self.size, self.web, self.round_area)
+
+    def __len__(self):
+        return len(self.openings)
+
+    def apply(self, side):
+        """Make the openings on the side of a part."""
+        kwargs = {"external_subtract": True} if self.external_subtract else {}
+        if self.kind == SLOT:
+            for x0, y0, x1, y1 in self.openings:
+                side.box(pos=(x0, y0), length=x1 - x0, width=y1 - y0, **kwargs)
+        else:
+            for pos in self.openings:
+                side.hole(pos=pos, diameter=self.size, **kwargs)
+
+
+# Commonly used mounting holes, a hole in the part and a clearance hole for an M3 bolt in the mounting surface.
+ODROID_MOUNTING = (HoleSpec(3.51), HoleSpec(3.2, external_subtract=True))
+PSU_MOUNTING = (HoleSpec(3, depth=4.0), HoleSpec(3.2, external_subtract=True))
@@ -2,5 +2,37 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from .silverstonetek import SilverstonetekFlexATX  # noqa
-from .apevia import ApeviaFlexATX  # noqa
+"""Power supplies.
+
+The part classes are imported on first use, importing the package does not import the CAD kernel.
+"""
+
+import importlib
+
+_LAZY_ATTRS = {
+    "ApeviaFlexATX": "cycax_parts.powersupplies.apevia",
+    "ATX": "cycax_parts.powersupplies.pc",
+    "Meanwell15V": "cycax_parts.powersupplies.meanwell",
+    "SilverstonetekFlexATX": "cycax_parts.powersupplies.silverstonetek",
+}
+
+__all__ = [
+    "ATX",
+    "ApeviaFlexATX",
+    "Meanwell15V",
+    "SilverstonetekFlexATX",
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY_ATTRS})
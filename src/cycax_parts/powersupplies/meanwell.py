@@ -4,13 +4,15 @@
 
 from cycax.cycad import Print3D
 
+from cycax_parts.form_factors import MEANWELL_15V_MOUNTING, MEANWELL_15V_SIZE
+from cycax_parts.patterns import HolePattern, HoleSpec
+
 
 class Meanwell15V(Print3D):
     def __init__(self):
-        super().__init__(part_no="psu-meanwell-15v", x_size=114.3, y_size=215, z_size=50)
+        x_size, y_size, z_size = MEANWELL_15V_SIZE
+        super().__init__(part_no="psu-meanwell-15v", x_size=x_size, y_size=y_size, z_size=z_size)
         self.colour = "red"
 
     def definition(self):
-        for x in (32, self.x_size - 32):
-            for y in (32, self.y_size - 32):
-                self.bottom.hole(pos=(x, y), diameter=4.2, external_subtract=True)
+        HolePattern(MEANWELL_15V_MOUNTING, HoleSpec(4.2, external_subtract=True)).apply(self.bottom)
@@ -5,6 +5,9 @@
 
 from cycax.cycad import Print3D
 
+from cycax_parts.form_factors import ATX_PSU_MOUNTING, ATX_PSU_SIZE
+from cycax_parts.patterns import PSU_MOUNTING, HolePattern, mounting
+
 
 class ATX(Print3D):
     """See ATXPS2-3.jpg.
@@ -13,22 +16,16 @@ class ATX(Print3D):
     """
 
     def __init__(self):
-        super().__init__(part_no="psu-atx-generic", x_size=150.0, y_size=140.0, z_size=86.0)
+        x_size, y_size, z_size = ATX_PSU_SIZE
+        super().__init__(part_no="psu-atx-generic", x_size=x_size, y_size=y_size, z_size=z_size)
         self.colour = "black"
         # There is a 2mm overhang at the back and left for the connector plate, if that is builtin.
 
     def definition(self):
         # Top is the Sticker.
         # Back is where the C14 AC connector is, the back of the server.
-        from_edge = (self.x_size - 138) / 2
-        self.back.hole(pos=(from_edge, self.z_size - from_edge), diameter=3, depth=4.0)
-        self.back.hole(pos=(from_edge, self.z_size - from_edge), diameter=3.2, external_subtract=True)
-        self.back.hole(pos=(from_edge + 138, self.z_size - from_edge), diameter=3, depth=4.0)
-        self.back.hole(pos=(from_edge + 138, self.z_size - from_edge), diameter=3.2, external_subtract=True)
-        self.back.hole(pos=(from_edge, self.z_size - from_edge - 64), diameter=3, depth=4.0)
-        self.back.hole(pos=(from_edge, self.z_size - from_edge - 64), diameter=3.2, external_subtract=True)
-        self.back.hole(pos=(from_edge + 114, from_edge), diameter=3, depth=4.0)
-        self.back.hole(pos=(from_edge + 114, from_edge), diameter=3.2, external_subtract=True)
+        with mounting(self):
+            HolePattern(ATX_PSU_MOUNTING, PSU_MOUNTING).apply(self.back)
 
         # Define large box for C14 power ports, on/off switch etc.
         self.back.box(pos=(10, 10), length=self.x_size - 16, width=self.z_size - 20, external_subtract=True)
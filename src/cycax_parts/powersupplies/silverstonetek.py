@@ -4,26 +4,22 @@
 
 from cycax.cycad import Print3D
 
+from cycax_parts.form_factors import FLEX_ATX_PSU_MOUNTING, FLEX_ATX_PSU_SIZE
+from cycax_parts.patterns import PSU_MOUNTING, HolePattern, HoleSpec, mounting
+
 
 class SilverstonetekFlexATX(Print3D):
     def __init__(self):
-        super().__init__(part_no="psu-flexatx-silverstonetek", x_size=81.5, y_size=150, z_size=40.50)
+        x_size, y_size, z_size = FLEX_ATX_PSU_SIZE
+        super().__init__(part_no="psu-flexatx-silverstonetek", x_size=x_size, y_size=y_size, z_size=z_size)
         self.colour = "black"
         # There is a 2mm overhang at the back and left for the connector plate, if that is builtin.
 
     def definition(self):
         # Top is the Sticker.
         # Back is where the C14 AC connector is, the back of the server.
-        x = 4.4  # Assume the hole placement is the same from both sides.
-        y = (self.z_size - 32) / 2  # Holes are 32mm apart
-        self.back.hole(pos=(self.x_size - y, y), diameter=3, depth=4.0)
-        self.back.hole(pos=(self.x_size - y, y), diameter=3.2, external_subtract=True)
-        self.back.hole(pos=(self.x_size - y, y + 32), diameter=3, depth=4.0)
-        self.back.hole(pos=(self.x_size - y, y + 32), diameter=3.2, external_subtract=True)
-        self.back.hole(pos=(x, 36), diameter=3, depth=4.0)
-        self.back.hole(pos=(x, 36), diameter=3.2, external_subtract=True)
-        self.back.hole(pos=(15.2, 37), diameter=3, depth=4.0)
-        self.back.hole(pos=(15.2, 37), diameter=3.2, external_subtract=True)
+        with mounting(self):
+            HolePattern(FLEX_ATX_PSU_MOUNTING, PSU_MOUNTING).apply(self.back)
         # Define box for C14 power ports.
         self.back.box(pos=(1, 1), length=60, width=31, external_subtract=True)
         # Define cutout for fan
@@ -42,12 +38,9 @@ class SilverstonetekFlexATX(Print3D):
         from_front_0 = 6.0 + 2.6  # Measured
         from_front_r = 128.6 + 2.6  # Measured
         from_front_l = 120 + 2.6  # Measured
-        hole_pos = (
-            (self.left, self.y_size - from_front_0),
-            (self.left, self.y_size - from_front_l),
-            (self.right, from_front_0),
-            (self.right, from_front_r),
-        )
-        for side, x in hole_pos:
-            side.hole(pos=(x, from_bottom), diameter=3.2, external_subtract=True)
-            side.hole(pos=(x, from_bottom), diameter=3.0, depth=4)
+        specs = (HoleSpec(3.2, external_subtract=True), HoleSpec(3.0, depth=4))
+        with mounting(self):
+            HolePattern(
+                ((self.y_size - from_front_0, from_bottom), (self.y_size - from_front_l, from_bottom)), specs
+            ).apply(self.left)
+            HolePattern(((from_front_0, from_bottom), (from_front_r, from_bottom)), specs).apply(self.right)
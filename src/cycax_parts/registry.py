@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""The catalog of parts that can be built.
+
+Parts are registered by part number with a "module:Class" target, the module is only
+imported when the part class is needed. Listing and selecting parts is therefore cheap,
+the CAD kernel is only imported once a build is requested.
+
+Third-party part packs register their parts through entry points::
+
+    [project.entry-points."cycax_parts.parts"]
+    my-bracket = "my_parts.brackets:MyBracket"
+
+    [project.entry-points."cycax_parts.cases"]
+    my-board = "my_parts.boards:MyBoard"
+
+Parts in the ``cycax_parts.cases`` group are motherboards that are built inside a case assembly.
+"""
+
+import fnmatch
+import importlib
+import logging
+from dataclasses import dataclass
+from functools import cache
+from importlib.metadata import entry_points
+
+logger = logging.getLogger(__name__)
+
+PART = "part"
+CASE = "case"
+ENTRY_POINT_GROUPS = {PART: "cycax_parts.parts", CASE: "cycax_parts.cases"}
+
+
+@dataclass(frozen=True)
+class PartEntry:
+    """A registered part.
+
+    Args:
+        part_no: The catalog part number.
+        target: Where to find the part class, as "module:Class".
+        kind: PART for a stand alone part, CASE for a motherboard built inside a case assembly.
+        params: Keyword arguments for the part class as (name, value) pairs, used for variants.
+    """
+
+    part_no: str
+    target: str
+    kind: str = PART
+    params: tuple = ()
+
+    @property
+    def module(self) -> str:
+        return self.target.partition(":")[0]
+
+    def load(self):
+        """Import and return the part class."""
+        module_name, _, attr = self.target.partition(":")
+        return getattr(importlib.import_module(module_name), attr)
+
+    def variant(self, part_no: str, **params) -> "PartEntry":
+        """The entry for the part built with other parameters."""
+        return PartEntry(part_no, self.target, self.kind, tuple(sorted(params.items())))
+
+
+BUILTIN_PARTS = (
+    PartEntry("conn-cube", "cycax_parts.construction:ConnCube"),
+    PartEntry("psu-flexatx-silverstonetek", "cycax_parts.powersupplies:SilverstonetekFlexATX"),
+    PartEntry("psu-meanwell-15v", "cycax_parts.powersupplies:Meanwell15V"),
+    PartEntry("psu-apevia", "cycax_parts.powersupplies:ApeviaFlexATX"),
+    PartEntry("psu-atx-generic", "cycax_parts.powersupplies:ATX"),
+    PartEntry("OdroidH3", "cycax_parts.computerboards:OdroidH3"),
+    PartEntry("OdroidH4", "cycax_parts.computerboards:OdroidH4"),
+    PartEntry("OdroidH5", "cycax_parts.computerboards:OdroidH5"),
+    PartEntry("Odroid-Generic", "cycax_parts.computerboards:OdroidGeneric"),
+    PartEntry("mini-itx-motherboard-lp-pci", "cycax_parts.computerboards:MiniItxMbLpPcie", kind=CASE),
+    PartEntry("motherboard-standard-atx", "cycax_parts.computerboards:StandardATX", kind=CASE),
+    PartEntry("motherboard-micro-atx", "cycax_parts.computerboards:MicroATX", kind=CASE),
+    PartEntry("motherboard-mini-itx", "cycax_parts.computerboards:MiniITX", kind=CASE),
+)
+
+
+class PartRegistry:
+    """Part entries by part number, in registration order."""
+
+    def __init__(self, entries=()):
+        self._entries = {}
+        for entry in entries:
+            self.register(entry)
+
+    def register(self, entry: PartEntry):
+        if entry.part_no in self._entries:
+            logger.warning("Part %s from %s replaces %s", entry.part_no, entry.target, self._entries[entry.part_no])
+        self._entries[entry.part_no] = entry
+
+    def get(self, part_no: str) -> PartEntry:
+        try:
+            return self._entries[part_no]
+        except KeyError:
+            msg = f"Unknown part number {part_no}."
+            raise KeyError(msg) from None
+
+    def load(self, part_no: str):
+        """Import and return the class of a part."""
+        return self.get(part_no).load()
+
+    def select(self, patterns=None, kind: str | None = None) -> list[PartEntry]:
+        """The entries matching any of the shell style patterns, all entries when no patterns are given."""
+        entries = [entry for entry in self._entries.values() if kind is None or entry.kind == kind]
+        if not patterns:
+            return entries
+        return [entry for entry in entries if any(fnmatch.fnmatchcase(entry.part_no, pat) for pat in patterns)]
+
+    def __iter__(self):
+        return iter(self._entries.values())
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, part_no):
+        return part_no in self._entries
+
+
+def discover_entry_points() -> list[PartEntry]:
+    """Part entries advertised by installed packages."""
+    entries = []
+    for kind, group in ENTRY_POINT_GROUPS.items():
+        for entry_point in entry_points(group=group):
+            entries.append(PartEntry(entry_point.name, entry_point.value, kind=kind))
+    return entries
+
+
+@cache
+def default_registry() -> PartRegistry:
+    """The builtin parts together with the parts from installed part packs."""
+    return PartRegistry((*BUILTIN_PARTS, *discover_entry_points()))
@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""A bounding volume hierarchy over axis aligned boxes.
+
+The tree narrows a search to the boxes near a query box, so finding the parts or features
+that may touch each other takes O(n log n) instead of comparing every pair. Callers do
+the exact check on the candidates the tree returns.
+"""
+
+from cycax_parts.geometry import TOLERANCE, Box, bounding
+
+LEAF_SIZE = 8
+
+
+class BoxTree:
+    """A static bounding volume hierarchy, built once from (box, value) items.
+
+    The items are split at the median of the box centres along the axis in which the
+    centres are spread the most, until a node holds at most LEAF_SIZE items.
+
+    Args:
+        items: The (box, value) pairs to index.
+    """
+
+    def __init__(self, items):
+        self.items = list(items)
+        self.order = list(range(len(self.items)))
+        # A node is (box, start, end, left, right), a leaf has no children and holds order[start:end].
+        self.nodes = []
+        if self.items:
+            self._build(0, len(self.items))
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def _build(self, start: int, end: int) -> int:
+        index = len(self.nodes)
+        self.nodes.append(None)
+        box = bounding(self.items[i][0] for i in self.order[start:end])
+        if end - start <= LEAF_SIZE:
+            self.nodes[index] = (box, start, end, -1, -1)
+            return index
+        centres = [
+            (i, [(low + high) / 2 for low, high in zip(self.items[i][0].low, self.items[i][0].high, strict=True)])
+            for i in self.order[start:end]
+        ]
+        spread = [max(c[axis] for _i, c in centres) - min(c[axis] for _i, c in centres) for axis in range(3)]
+        axis = spread.index(max(spread))
+        centres.sort(key=lambda item: item[1][axis])
+        self.order[start:end] = [i for i, _centre in centres]
+        middle = (start + end) // 2
+        left = self._build(start, middle)
+        right = self._build(middle, end)
+        self.nodes[index] = (box, start, end, left, right)
+        return index
+
+    def query(self, box: Box, *, touching: bool = False, tol: float = TOLERANCE) -> list[int]:
+        """The indices of the items whose box intersects the query box.
+
+        Args:
+            box: The query box.
+            touching: Also return the items that only touch the query box.
+            tol: Tolerance of the box tests.
+        """
+        found = []
+        if not self.nodes:
+            return found
+        stack = [0]
+        while stack:
+            node_box, start, end, left, right = self.nodes[stack.pop()]
+            if not node_box.touches(box, tol):
+                continue
+            if left < 0:
+                for i in self.order[start:end]:
+                    item_box = self.items[i][0]
+                    if item_box.touches(box, tol) if touching else item_box.intersects(box, tol):
+                        found.append(i)
+            else:
+                stack.append(left)
+                stack.append(right)
+        return found
+
+    def values(self, box: Box, *, touching: bool = False, tol: float = TOLERANCE) -> list:
+        """The values of the items whose box intersects the query box."""
+        return [self.items[i][1] for i in self.query(box, touching=touching, tol=tol)]
+
+    def pairs(self, *, touching: bool = False, tol: float = TOLERANCE) -> list[tuple[int, int]]:
+        """Every (i, j) pair of item indices, with i < j, whose boxes intersect, in order."""
+        found = []
+        for i, (box, _value) in enumerate(self.items):
+            found.extend((i, j) for j in sorted(self.query(box, touching=touching, tol=tol)) if j > i)
+        return found
@@ -0,0 +1,139 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Build a family of part variants from a grid of parameters.
+
+Every combination of the parameter values is a variant, for example all the ATX boards
+with 1 to 4 half or full height PCIe cards on three standoff heights:
+
+    python -m cycax_parts.sweep "motherboard-*" --param pcie_cards=1,2,3,4 \\
+        --param pcie_full_height=false,true --param standoff=6,8,10
+
+Variants with the same definition are only built once. Combinations the part rejects,
+like a standoff that is too short, are skipped.
+"""
+
+import argparse
+import itertools
+import json
+import logging
+import os
+import sys
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from cycax_parts.cache import DEFAULT_CACHE_DIR, BuildCache, definition_digest
+from cycax_parts.registry import PartEntry, default_registry
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Variant:
+    """A unique variant and the parameter sets that produce the same definition."""
+
+    entry: PartEntry
+    params: dict
+    digest: str
+    duplicates: list = field(default_factory=list)
+
+
+def parse_value(text: str):
+    """Parse a parameter value, numbers and true/false become numbers and booleans."""
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def parse_params(values) -> dict:
+    """Parse NAME=V1,V2,... arguments into a parameter grid."""
+    grid = {}
+    for value in values or ():
+        name, _, options = value.partition("=")
+        if not name or not options:
+            msg = f"Expected NAME=VALUE[,VALUE...], got {value}."
+            raise argparse.ArgumentTypeError(msg)
+        grid[name] = [parse_value(option) for option in options.split(",")]
+    return grid
+
+
+def expand_grid(grid: dict) -> list[dict]:
+    """Every combination of the parameter values."""
+    names = sorted(grid)
+    return [dict(zip(names, values, strict=True)) for values in itertools.product(*(grid[name] for name in names))]
+
+
+def plan_variants(entry: PartEntry, grid: dict, work_dir: Path) -> list[Variant]:
+    """The unique variants of a part over a parameter grid.
+
+    Each variant is defined and saved to work_dir to compare the definitions, that is cheap
+    compared to the build.
+
+    Raises:
+        ValueError: Two variants with different definitions have the same part number.
+    """
+    part_class = entry.load()
+    variants = {}
+    part_numbers = {}
+    for params in expand_grid(grid):
+        try:
+            part = part_class(**params)
+        except (TypeError, ValueError) as error:
+            logger.warning("Skipping %s %s: %s", entry.part_no, params, error)
+            continue
+        part.save(work_dir)
+        digest = definition_digest(work_dir / part.part_no, ignore_name=True)
+        if digest in variants:
+            variants[digest].duplicates.append(params)
+            continue
+        if part.part_no in part_numbers:
+            msg = f"{entry.part_no} {params} and {part_numbers[part.part_no]} are both {part.part_no}."
+            raise ValueError(msg)
+        part_numbers[part.part_no] = params
+        variants[digest] = Variant(entry.variant(part.part_no, **params), params, digest)
+    return list(variants.values())
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Build variants of parts over a grid of parameters.")
+    parser.add_argument("parts", nargs="+", help="Part numbers to sweep, shell style wildcards are allowed.")
+    parser.add_argument(
+        "-p", "--param", action="append", metavar="NAME=V1,V2", help="Values of a parameter of the part."
+    )
+    parser.add_argument("-n", "--dry-run", action="store_true", help="List the variants without building them.")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count() or 1, help="Number of variants to build in parallel."
+    )
+    parser.add_argument("--build-dir", type=Path, default=Path("./build"), help="Directory to write the parts to.")
+    parser.add_argument("--no-cache", action="store_true", help="Always run the engine, do not use the build cache.")
+    args = parser.parse_args(argv)
+
+    from cycax_parts.build import run_jobs, setup_logging
+
+    setup_logging()
+    grid = parse_params(args.param)
+    jobs = []
+    with tempfile.TemporaryDirectory(prefix="cycax-sweep-") as tmp:
+        for entry in default_registry().select(args.parts):
+            variants = plan_variants(entry, grid, Path(tmp))
+            for variant in variants:
+                same = f" (same as {len(variant.duplicates)} more)" if variant.duplicates else ""
+                logger.info("%s %s%s", variant.entry.part_no, variant.params, same)
+            jobs.extend(variant.entry for variant in variants)
+    logger.info("%d unique variants", len(jobs))
+    if args.dry_run or not jobs:
+        return 0
+
+    args.build_dir.mkdir(parents=True, exist_ok=True)
+    cache = None if args.no_cache else BuildCache(DEFAULT_CACHE_DIR)
+    results = run_jobs(jobs, args.build_dir, workers=max(1, min(args.jobs, len(jobs))), cache=cache)
+    if cache is not None:
+        cache.evict()
+    return 0 if all(result.ok for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
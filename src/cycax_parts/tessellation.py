@@ -0,0 +1,204 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tessellation profiles for the STL export.
+
+The linear tolerance of a profile is a fraction of the diagonal of the part, clamped to
+a range, so a large flat panel is meshed coarser than a small detailed part:
+
+    draft: For previews, coarse meshes that export fast.
+    print: For printing, parts up to about 100 mm across keep the fine mesh of the engine.
+
+A build uses one profile, build.py --tessellation, and a part can ask for a coarser one
+with a tessellation attribute. Sheet metal parts are cut from the STEP or DXF files, not
+printed, and use the draft profile. A tolerance less than REMESH_FACTOR times coarser
+than the default of the engine is not worth it, those parts keep the default.
+
+The engine has no option for the tolerances, it calls export_stl() with the defaults.
+engine_tolerances() gives that call the tolerances of the profile, so the part is meshed
+once. An engine that exports its STL another way has its mesh replaced by one made from
+the STEP file, see retessellate(). The tolerances are part of the cache key and every
+part built is listed in tessellation.json in the build directory.
+"""
+
+import json
+import logging
+import math
+import os
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from cycax_parts.geometry import part_size
+
+logger = logging.getLogger(__name__)
+
+DRAFT = "draft"
+PRINT = "print"
+TESSELLATION_FILE = "tessellation.json"
+STEP_SUFFIXES = (".step", ".stp")
+# The tolerances build123d's export_stl() uses, the STL the engine writes already has them.
+ENGINE_TOLERANCE = 1e-3
+ENGINE_ANGULAR_TOLERANCE = 0.1
+REMESH_FACTOR = 10
+EXPORT_STL_ARGS = ("tolerance", "angular_tolerance", "ascii_format")
+
+
+@dataclass(frozen=True)
+class Profile:
+    """Tolerances for meshing a part.
+
+    Args:
+        name: The name of the profile.
+        coarseness: Orders the profiles, the higher the coarser.
+        relative_tolerance: The linear tolerance as a fraction of the diagonal of the part.
+        min_tolerance: The smallest linear tolerance in mm.
+        max_tolerance: The largest linear tolerance in mm.
+        angular_tolerance: The angular tolerance in radians.
+    """
+
+    name: str
+    coarseness: int
+    relative_tolerance: float
+    min_tolerance: float
+    max_tolerance: float
+    angular_tolerance: float
+
+    def tolerance(self, size: tuple) -> float:
+        """The linear tolerance for a part of the given (x, y, z) size."""
+        diagonal = math.hypot(*size)
+        return min(max(self.relative_tolerance * diagonal, self.min_tolerance), self.max_tolerance)
+
+    def settings(self, size: tuple) -> dict:
+        """The tolerances for a part of the given size, those of the engine when meshing again does not pay."""
+        tolerance = self.tolerance(size)
+        if tolerance < REMESH_FACTOR * ENGINE_TOLERANCE:
+            return {"profile": self.name, "tolerance": ENGINE_TOLERANCE, "angular_tolerance": ENGINE_ANGULAR_TOLERANCE}
+        return {"profile": self.name, "tolerance": round(tolerance, 6), "angular_tolerance": self.angular_tolerance}
+
+
+PROFILES = {
+    DRAFT: Profile(DRAFT, 1, relative_tolerance=2e-3, min_tolerance=0.01, max_tolerance=1.0, angular_tolerance=0.5),
+    PRINT: Profile(
+        PRINT,
+        0,
+        relative_tolerance=1e-4,
+        min_tolerance=ENGINE_TOLERANCE,
+        max_tolerance=0.05,
+        angular_tolerance=ENGINE_ANGULAR_TOLERANCE,
+    ),
+}
+
+
+def get_profile(profile) -> Profile:
+    """The profile with the given name, a Profile is returned as is."""
+    if isinstance(profile, Profile):
+        return profile
+    try:
+        return PROFILES[profile]
+    except KeyError:
+        msg = f"Unknown tessellation profile {profile!r}, expected one of {', '.join(PROFILES)}"
+        raise ValueError(msg) from None
+
+
+def part_profile(part, build_profile=PRINT) -> Profile:
+    """The profile a part is meshed with, the coarser of the build profile and the one the part asks for."""
+    from cycax.cycad import SheetMetal
+
+    profile = get_profile(build_profile)
+    requested = getattr(part, "tessellation", None)
+    if requested is None and isinstance(part, SheetMetal):
+        requested = DRAFT
+    if requested is not None:
+        profile = max(profile, get_profile(requested), key=lambda item: item.coarseness)
+    return profile
+
+
+def tessellation_settings(part, build_profile=PRINT) -> dict:
+    """The profile and the tolerances a part is meshed with."""
+    return part_profile(part, build_profile).settings(part_size(part))
+
+
+def is_engine_default(settings: dict) -> bool:
+    """True when the engine already meshed the part with these tolerances."""
+    return settings["tolerance"] == ENGINE_TOLERANCE and settings["angular_tolerance"] == ENGINE_ANGULAR_TOLERANCE
+
+
+@contextmanager
+def engine_tolerances(engine, settings: dict | None):
+    """Mesh the STL files the engine exports in the block with the tolerances of the settings.
+
+    The export_stl() the module of the engine imported is replaced while the block runs,
+    builds in the same process must not overlap.
+
+    Yields:
+        The list the STL files meshed with the settings are added to, it stays empty when
+        the engine exports its STL another way.
+    """
+    engine_class = engine if isinstance(engine, type) else type(engine)
+    module = sys.modules.get(engine_class.__module__)
+    original = getattr(module, "export_stl", None)
+    meshed = []
+    if settings is None or is_engine_default(settings) or not callable(original):
+        yield meshed
+        return
+
+    def export_stl(to_export, file_path, *args, **kwargs):
+        kwargs.update(zip(EXPORT_STL_ARGS, args, strict=False))
+        kwargs["tolerance"] = settings["tolerance"]
+        kwargs["angular_tolerance"] = settings["angular_tolerance"]
+        meshed.append(Path(file_path))
+        return original(to_export, file_path, **kwargs)
+
+    module.export_stl = export_stl
+    try:
+        yield meshed
+    finally:
+        module.export_stl = original
+
+
+def retessellate(part_path: Path, settings: dict) -> int:
+    """Mesh the STL files in a part directory again from its STEP file, returns the number of files written.
+
+    The new file is renamed over the old one, the STL may be a hard link shared with other parts.
+    """
+    files = sorted(path for path in part_path.iterdir() if path.is_file())
+    step = next((path for path in files if path.suffix.lower() in STEP_SUFFIXES), None)
+    meshes = [path for path in files if path.suffix.lower() == ".stl"]
+    if is_engine_default(settings):
+        return 0
+    if step is None or not meshes:
+        logger.debug("No STEP and STL files to mesh in %s", part_path)
+        return 0
+    from build123d import export_stl, import_step
+
+    shape = import_step(step)
+    for path in meshes:
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        try:
+            export_stl(
+                shape, tmp_path, tolerance=settings["tolerance"], angular_tolerance=settings["angular_tolerance"]
+            )
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+    return len(meshes)
+
+
+def record_tessellation(build_dir: Path, parts: dict):
+    """Add the tessellation settings of the parts built to the record in the build directory.
+
+    Args:
+        build_dir: The build directory.
+        parts: The settings of every part, keyed on the part directory relative to build_dir.
+    """
+    path = build_dir / TESSELLATION_FILE
+    try:
+        record = json.loads(path.read_text())
+    except (OSError, ValueError):
+        record = {}
+    updated = {**record, **parts}
+    if updated != record:
+        path.write_text(json.dumps(dict(sorted(updated.items())), indent=4))
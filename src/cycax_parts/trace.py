@@ -0,0 +1,139 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tracing of the build phases.
+
+Set CYCAX_TRACE to a file name to record the wall time, CPU time and peak RSS of every
+part and phase. The trace is written in the Chrome trace event format and can be opened
+with chrome://tracing or https://ui.perfetto.dev. When CYCAX_TRACE is not set span()
+returns a shared no-op context manager.
+
+The peak RSS is the high water mark of the process at the end of the span.
+"""
+
+import json
+import os
+import resource
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from functools import cache
+from pathlib import Path
+
+TRACE_ENV = "CYCAX_TRACE"
+TRACE_TOP_ENV = "CYCAX_TRACE_TOP"
+
+
+def peak_rss_mb() -> float:
+    """The peak resident set size of this process in MiB."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # Linux reports kB.
+
+
+def rss_mb() -> float:
+    """The current resident set size of this process in MiB, the peak where it is not known."""
+    try:
+        pages = int(Path("/proc/self/statm").read_text().split()[1])
+    except (OSError, ValueError, IndexError):
+        return peak_rss_mb()
+    return pages * os.sysconf("SC_PAGE_SIZE") / 1024**2
+
+
+class Tracer:
+    """Records spans as Chrome trace complete events."""
+
+    def __init__(self):
+        self.events = []
+
+    @contextmanager
+    def span(self, phase: str, part: str = "", **args):
+        """Record the time spent in the block, the part can be set in the yielded dict when it is only known later."""
+        record = {"part": part}
+        ts = time.time_ns() / 1000
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield record
+        finally:
+            part = record["part"]
+            self.events.append(
+                {
+                    "name": f"{phase}: {part}" if part else phase,
+                    "cat": phase,
+                    "ph": "X",
+                    "ts": ts,
+                    "dur": (time.perf_counter() - wall) * 1e6,
+                    "pid": os.getpid(),
+                    "tid": threading.get_native_id(),
+                    "args": {
+                        "part": part,
+                        "cpu_s": time.process_time() - cpu,
+                        "peak_rss_mb": peak_rss_mb(),
+                        **args,
+                    },
+                }
+            )
+
+    def drain(self) -> list:
+        """Return and forget the recorded events, used to hand the events from a worker to the parent."""
+        events, self.events = self.events, []
+        return events
+
+
+class NullTracer:
+    """A tracer that does nothing."""
+
+    # The dict is shared and never read.
+    _context = nullcontext({})
+
+    def span(self, phase: str, part: str = "", **args):  # noqa: ARG002
+        return self._context
+
+    def drain(self) -> list:
+        return []
+
+
+@cache
+def get_tracer() -> Tracer | NullTracer:
+    return Tracer() if os.environ.get(TRACE_ENV) else NullTracer()
+
+
+def span(phase: str, part: str = "", **args):
+    """Trace a phase of the build of a part.
+
+    Example:
+        with span("save", part.part_no):
+            part.save(build_dir)
+    """
+    return get_tracer().span(phase, part, **args)
+
+
+def trace_path() -> Path | None:
+    path = os.environ.get(TRACE_ENV)
+    return Path(path) if path else None
+
+
+def write_trace(path: Path, events: list):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}))
+
+
+def summary(events: list, top: int | None = None) -> list[str]:
+    """The slowest spans, the times of spans with the same phase and part are added up.
+
+    The spans nest, the span of a job includes the phases of its part. Worker MiB is the peak
+    RSS of the worker processes that ran the span, not the memory the span itself used.
+    """
+    if top is None:
+        top = int(os.environ.get(TRACE_TOP_ENV, "10"))
+    totals = defaultdict(lambda: [0.0, 0.0, 0.0])
+    for event in events:
+        total = totals[event["name"]]
+        total[0] += event["dur"] / 1e6
+        total[1] += event["args"]["cpu_s"]
+        total[2] = max(total[2], event["args"]["peak_rss_mb"])
+    slowest = sorted(totals.items(), key=lambda item: item[1][0], reverse=True)[:top]
+    lines = [f"{'wall s':>9} {'cpu s':>9} {'worker MiB':>10}  span"]
+    lines.extend(f"{wall:9.2f} {cpu:9.2f} {rss:10.0f}  {name}" for name, (wall, cpu, rss) in slowest)
+    return lines
@@ -0,0 +1,220 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Rebuild the parts affected by a source file as soon as it is saved.
+
+The package sources are polled for changes. Once the changes settled for the debounce
+time the affected parts and case assemblies are worked out from the import graph, see
+affected.py, and only those are built in a child process. A build whose parts are
+affected by a newer change is out of date, it is cancelled and started again.
+
+The CAD kernel is imported once by the watcher, the child processes are forked from it
+and start warm. When a module the watcher itself imported changed the child is started
+with spawn instead so it imports the new source.
+"""
+
+import argparse
+import logging
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+
+from cycax_parts.affected import ImportGraph, affected_entries
+from cycax_parts.cache import DEFAULT_CACHE_DIR, BuildCache
+from cycax_parts.lod import LEVELS, LOD0, lod_path
+from cycax_parts.registry import CASE, PART, default_registry
+from cycax_parts.tessellation import DRAFT, PROFILES, record_tessellation
+
+logger = logging.getLogger(__name__)
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+
+
+def snapshot(path: Path) -> dict:
+    """The modification time of every Python source below path."""
+    files = {}
+    for source in path.rglob("*.py"):
+        try:
+            files[source.resolve()] = source.stat().st_mtime_ns
+        except FileNotFoundError:
+            # Editors replace files on save, it may be gone for a moment.
+            continue
+    return files
+
+
+def changed_paths(before: dict, after: dict) -> set[Path]:
+    """The files that were added, removed or modified between two snapshots."""
+    return {path for path in before.keys() | after.keys() if before.get(path) != after.get(path)}
+
+
+def imported_files() -> set[Path]:
+    """The source files of the modules imported in this process."""
+    files = set()
+    for module in list(sys.modules.values()):
+        origin = getattr(module, "__file__", None)
+        if origin:
+            files.add(Path(origin).resolve())
+    return files
+
+
+def entry_key(entry) -> tuple:
+    return (entry.kind, entry.part_no)
+
+
+def build_entries(entries: list, build_dir: Path, options: dict):
+    """Build the entries, this runs in the child process."""
+    from cycax_parts.build import run_jobs, setup_logging
+
+    setup_logging()
+    results = run_jobs(entries, build_dir, **options)
+    record_tessellation(build_dir, {key: value for result in results for key, value in result.tessellation.items()})
+    sys.exit(0 if all(result.ok for result in results) else 1)
+
+
+class Watcher:
+    """Poll the sources and keep the build of the affected parts up to date.
+
+    Args:
+        entries: The part entries that are rebuilt when they are affected by a change.
+        build_dir: The directory the parts are built in.
+        debounce: Seconds without a change before a build is started.
+        options: Keyword arguments passed on to the build functions.
+    """
+
+    def __init__(self, entries: list, build_dir: Path, debounce: float = 0.3, **options):
+        self.entries = entries
+        self.build_dir = build_dir
+        self.debounce = debounce
+        self.options = options
+        self.files = snapshot(PACKAGE_DIR)
+        self.stale = False
+        self.dirty = set()
+        self.last_change = 0.0
+        self.queued = {}
+        self.building = {}
+        self.process = None
+        self.started = 0.0
+
+    def poll(self):
+        """Pick up changes to the sources and start, cancel or finish builds."""
+        files = snapshot(PACKAGE_DIR)
+        changed = changed_paths(self.files, files)
+        self.files = files
+        if changed:
+            self.dirty |= changed
+            self.last_change = time.monotonic()
+            for path in sorted(changed):
+                logger.debug("Changed %s", path)
+        elif self.dirty and time.monotonic() - self.last_change >= self.debounce:
+            self.schedule(self.dirty)
+            self.dirty = set()
+        self.reap()
+        if self.process is None and self.queued:
+            self.start()
+
+    def schedule(self, changed: set[Path]):
+        # The import graph is read again, the change may have added or removed imports.
+        affected = affected_entries(self.entries, changed, ImportGraph(PACKAGE_DIR.parent))
+        # Only now, anything imported into this process since the last change is included.
+        if changed & imported_files():
+            self.stale = True
+        if not affected:
+            logger.info("No parts are affected by the change")
+            return
+        for entry in affected:
+            self.queued[entry_key(entry)] = entry
+        if self.process is not None and self.building.keys() & self.queued.keys():
+            logger.info(
+                "Cancelling the out of date build of %s", ", ".join(entry.part_no for entry in self.building.values())
+            )
+            self.process.terminate()
+            self.process.join()
+            self.process = None
+            # The cancelled build may not have got to all of its parts.
+            self.queued = {**self.building, **self.queued}
+            self.building = {}
+
+    def start(self):
+        self.building, self.queued = self.queued, {}
+        entries = sorted(self.building.values(), key=lambda entry: entry.kind != CASE)
+        method = "spawn" if self.stale or "fork" not in multiprocessing.get_all_start_methods() else "fork"
+        context = multiprocessing.get_context(method)
+        self.process = context.Process(
+            target=build_entries, args=(entries, self.build_dir, self.options), name="cycax-watch-build"
+        )
+        logger.info("Building %s", ", ".join(entry.part_no for entry in entries))
+        self.started = time.monotonic()
+        self.process.start()
+
+    def reap(self):
+        """Report the build that finished, if any."""
+        if self.process is None or self.process.is_alive():
+            return
+        self.process.join()
+        seconds = time.monotonic() - self.started
+        names = ", ".join(entry.part_no for entry in self.building.values())
+        if self.process.exitcode == 0:
+            logger.info("Built %s in %.1fs", names, seconds)
+        else:
+            logger.error("Building %s failed after %.1fs", names, seconds)
+        self.process = None
+        self.building = {}
+
+    def stop(self):
+        if self.process is not None:
+            self.process.terminate()
+            self.process.join()
+            self.process = None
+
+
+def warm_up():
+    """Import the CAD kernel so forked builds do not pay for it."""
+    from cycax.cycad.engines.assembly_build123d import AssemblyBuild123d  # noqa: F401
+    from cycax.cycad.engines.part_build123d import PartEngineBuild123d  # noqa: F401
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Rebuild the parts affected by a change as soon as a file is saved.")
+    parser.add_argument("parts", nargs="*", help="Only watch these part numbers, shell style wildcards are allowed.")
+    parser.add_argument("--build-dir", type=Path, default=Path("./build"), help="Directory to write the parts to.")
+    parser.add_argument("--lod", type=int, choices=LEVELS, default=LOD0, help="Level of detail to build at.")
+    parser.add_argument(
+        "--tessellation",
+        choices=list(PROFILES),
+        default=DRAFT,
+        help="Tessellation profile of the STL files, the draft meshes export fastest.",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Always run the engine, do not use the build cache.")
+    parser.add_argument("--interval", type=float, default=0.2, help="Seconds between polls of the sources.")
+    parser.add_argument("--debounce", type=float, default=0.3, help="Seconds without a change before building.")
+    args = parser.parse_args(argv)
+
+    from cycax_parts.build import setup_logging
+
+    setup_logging()
+    registry = default_registry()
+    entries = registry.select(args.parts, kind=CASE) + registry.select(args.parts, kind=PART)
+    if not entries:
+        logger.error("No parts match %s", " ".join(args.parts))
+        return 1
+    build_dir = lod_path(args.build_dir, args.lod)
+    build_dir.mkdir(parents=True, exist_ok=True)
+    cache = None if args.no_cache else BuildCache(DEFAULT_CACHE_DIR)
+    warm_up()
+    watcher = Watcher(
+        entries, build_dir, debounce=args.debounce, cache=cache, lod=args.lod, tessellation=args.tessellation
+    )
+    logger.info("Watching %s for changes to %d parts, press Ctrl-C to stop", PACKAGE_DIR, len(entries))
+    try:
+        while True:
+            time.sleep(args.interval)
+            watcher.poll()
+    except KeyboardInterrupt:
+        watcher.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Memory-bounded builds in worker processes that are recycled.
+
+The CAD kernel does not give all memory back after a part is built, so a worker that
+builds part after part grows. Here every worker retires after it built max_tasks parts
+or when its resident memory is above max_rss_mb after a part, and a fresh worker takes
+its place. The peak memory of a run therefore does not depend on the size of the catalog.
+
+A worker that dies during a build, killed by the OOM killer for example, takes only its
+current part with it. The part is retried once in a fresh worker before it is reported
+as failed.
+"""
+
+import gc
+import logging
+import multiprocessing
+import time
+from collections import deque
+from dataclasses import dataclass
+from multiprocessing.connection import wait
+from pathlib import Path
+
+from cycax_parts.trace import rss_mb
+
+logger = logging.getLogger(__name__)
+
+RETRIES = 1
+
+
+def worker_main(conn, build_dir: Path, options: dict, max_tasks: int | None, max_rss_mb: float | None):
+    """Build the jobs sent over the connection until told to stop or it is time to retire."""
+    from cycax_parts.build import run_job
+
+    done = 0
+    while True:
+        task = conn.recv()
+        if task is None:
+            return
+        index, entry = task
+        result = run_job(entry, build_dir, **options)
+        # The kernel shapes of the part are only referenced from cycles, free them now.
+        gc.collect()
+        done += 1
+        rss = rss_mb()
+        retire = (max_tasks is not None and done >= max_tasks) or (max_rss_mb is not None and rss > max_rss_mb)
+        conn.send((index, result, rss, retire))
+        if retire:
+            return
+
+
+@dataclass
+class Worker:
+    process: multiprocessing.Process
+    conn: object
+    task: tuple | None = None
+    started: float = 0.0
+
+
+def run_recycled(
+    jobs: list,
+    build_dir: Path,
+    workers: int = 1,
+    max_tasks: int | None = None,
+    max_rss_mb: float | None = None,
+    **options,
+) -> list:
+    """Run the build jobs in worker processes that are recycled.
+
+    Args:
+        jobs: The part entries to build.
+        build_dir: The directory the parts are saved to.
+        workers: The number of worker processes.
+        max_tasks: A worker retires after this many parts, None for no limit.
+        max_rss_mb: A worker retires when its resident memory is above this after a part, None for no limit.
+        options: Keyword arguments passed on to every build function.
+
+    Returns:
+        The BuildResult of every job, in the order they finished.
+    """
+    from cycax_parts.build import BuildResult, log_result
+
+    pending = deque(enumerate(jobs))
+    attempts = {}
+    results = []
+    active = []
+    recycled = 0
+
+    def start_worker() -> Worker:
+        parent_conn, child_conn = multiprocessing.Pipe()
+        process = multiprocessing.Process(
+            target=worker_main,
+            args=(child_conn, build_dir, options, max_tasks, max_rss_mb),
+            name="cycax-build-worker",
+        )
+        process.start()
+        child_conn.close()
+        return Worker(process, parent_conn)
+
+    def assign(worker: Worker):
+        if pending:
+            worker.task = pending.popleft()
+            worker.started = time.perf_counter()
+            worker.conn.send(worker.task)
+        else:
+            worker.task = None
+            worker.conn.send(None)
+
+    def finish(result):
+        log_result(result)
+        results.append(result)
+
+    while pending or any(worker.task is not None for worker in active):
+        while pending and sum(worker.task is not None for worker in active) < workers:
+            worker = start_worker()
+            active.append(worker)
+            assign(worker)
+        ready = wait([worker.conn for worker in active] + [worker.process.sentinel for worker in active])
+        for worker in list(active):
+            if worker.conn not in ready and worker.process.sentinel not in ready:
+                continue
+            message = None
+            if worker.conn.poll():
+                try:
+                    message = worker.conn.recv()
+                except EOFError:
+                    message = None
+            if message is not None:
+                _index, result, rss, retire = message
+                logger.debug("Worker %d at %.0f MiB after %s", worker.process.pid, rss, result.name)
+                finish(result)
+                worker.task = None
+                if not retire:
+                    assign(worker)
+                    if worker.task is not None:
+                        continue
+                else:
+                    recycled += 1
+            elif worker.process.is_alive():
+                continue
+            # The worker retired, is idle or died.
+            worker.process.join()
+            worker.conn.close()
+            active.remove(worker)
+            if worker.task is not None:
+                index, entry = worker.task
+                attempts[index] = attempts.get(index, 0) + 1
+                code = worker.process.exitcode
+                if attempts[index] <= RETRIES:
+                    logger.warning("Worker died with exit code %s building %s, retrying", code, entry.part_no)
+                    pending.appendleft(worker.task)
+                else:
+                    finish(
+                        BuildResult(
+                            name=entry.part_no,
+                            ok=False,
+                            seconds=time.perf_counter() - worker.started,
+                            error=f"The build worker died with exit code {code}, twice.",
+                        )
+                    )
+    for worker in active:
+        worker.process.join()
+        worker.conn.close()
+    if recycled:
+        logger.info("Recycled %d build workers", recycled)
+    return results
@@ -0,0 +1,55 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from cycax_parts.affected import ImportGraph, affected_entries, module_origin
+from cycax_parts.registry import default_registry
+
+PACKAGE_DIR = Path(__file__).resolve().parents[1] / "src" / "cycax_parts"
+
+
+@pytest.fixture(scope="module")
+def graph():
+    return ImportGraph(PACKAGE_DIR.parent)
+
+
+@pytest.fixture(scope="module")
+def entries():
+    return default_registry().select([])
+
+
+def part_numbers(entries) -> set[str]:
+    return {entry.part_no for entry in entries}
+
+
+def test_pipeline_change_affects_every_part(graph, entries):
+    affected = affected_entries(entries, {PACKAGE_DIR / "optimise.py"}, graph)
+    assert part_numbers(affected) == part_numbers(entries)
+
+
+def test_part_change_affects_only_that_part(graph, entries):
+    affected = affected_entries(entries, {PACKAGE_DIR / "construction" / "conn_cube.py"}, graph)
+    assert part_numbers(affected) == {"conn-cube"}
+
+
+def test_shared_module_affects_its_users(graph, entries):
+    affected = part_numbers(affected_entries(entries, {PACKAGE_DIR / "computerboards" / "odroid.py"}, graph))
+    assert "OdroidH3" in affected
+    assert "conn-cube" not in affected
+
+
+def test_unrelated_change_affects_nothing(graph, entries):
+    assert affected_entries(entries, {PACKAGE_DIR.parents[1] / "README.md"}, graph) == []
+
+
+def test_module_origin_does_not_import():
+    name = "cycax_parts.nesting"
+    sys.modules.pop(name, None)
+    assert module_origin(name) == PACKAGE_DIR / "nesting.py"
+    assert module_origin(f"{name}.FlatPattern") is None
+    assert name not in sys.modules
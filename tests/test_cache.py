@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+
+from cycax_parts.cache import BuildCache
+
+
+class Engine:
+    pass
+
+
+def save(build_dir, part_no, features=()):
+    part_path = build_dir / part_no
+    part_path.mkdir(parents=True)
+    (part_path / f"{part_no}.json").write_text(json.dumps({"name": part_no, "features": list(features)}))
+    return part_path
+
+
+def test_key_ignores_the_part_number(tmp_path):
+    cache = BuildCache(tmp_path / "cache")
+    first = save(tmp_path, "plate-1")
+    second = save(tmp_path, "plate-2")
+    other = save(tmp_path, "plate-3", [{"name": "hole"}])
+    assert cache.key(first, Engine) == cache.key(second, Engine)
+    assert cache.key(first, Engine) != cache.key(other, Engine)
+    assert cache.key(first, Engine) != cache.key(first, Engine, {"profile": "draft"})
+
+
+def test_outputs_are_restored_with_the_part_number(tmp_path):
+    cache = BuildCache(tmp_path / "cache")
+    first = save(tmp_path, "plate-1")
+    (first / "plate-1.stl").write_text("mesh")
+    key = cache.key(first, Engine)
+    cache.store(key, first, "plate-1")
+
+    second = save(tmp_path, "plate-2")
+    assert cache.restore(key, second, "plate-2")
+    assert (second / "plate-2.stl").read_text() == "mesh"
+    assert not (second / "plate-1.stl").exists()
+    assert not cache.restore(cache.key(save(tmp_path, "plate-3", [{"name": "hole"}]), Engine), second, "plate-3")
@@ -0,0 +1,82 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import stat
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from cycax_parts.daemon import BuildDaemon, DaemonClient, DaemonServer, default_socket, entry_from_json
+from cycax_parts.registry import CASE, PART
+
+
+def test_registered_part_and_variant_are_accepted():
+    entry = entry_from_json({"part_no": "conn-cube", "target": "cycax_parts.construction:ConnCube", "kind": PART})
+    assert entry.part_no == "conn-cube"
+    variant = entry_from_json(
+        {
+            "part_no": "OdroidH3-s14",
+            "target": "cycax_parts.computerboards:OdroidH3",
+            "kind": PART,
+            "params": [["standoff", 14]],
+        }
+    )
+    assert variant.params == (("standoff", 14),)
+
+
+@pytest.mark.parametrize(
+    ("target", "kind"),
+    [("os:system", PART), ("cycax_parts.construction:ConnCube", CASE), ("cycax_parts.construction:Other", PART)],
+)
+def test_unregistered_part_is_rejected(target, kind):
+    with pytest.raises(ValueError, match="not built from a registered part"):
+        entry_from_json({"part_no": "conn-cube", "target": target, "kind": kind})
+
+
+def test_socket_in_runtime_dir(monkeypatch, tmp_path):
+    monkeypatch.delenv("CYCAX_PARTS_DAEMON", raising=False)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    assert default_socket() == tmp_path / "cycax_parts.sock"
+
+
+def test_socket_is_private(tmp_path):
+    path = tmp_path / "daemon.sock"
+    server = DaemonServer(path, BuildDaemon())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+        assert DaemonClient(path).ping()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class PlainDaemon(BuildDaemon):
+    """A daemon whose workers do not import the CAD kernel."""
+
+    def pool(self) -> ProcessPoolExecutor:
+        with self.lock:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self.executor
+
+
+def test_broken_pool_is_replaced(tmp_path):
+    daemon = PlainDaemon()
+    broken = daemon.pool()
+    future = broken.submit(os._exit, 3)
+    with pytest.raises(BrokenProcessPool):
+        future.result()
+    try:
+        job = {"part_no": "conn-cube", "target": "cycax_parts.construction:ConnCube", "kind": PART}
+        response = daemon.build({"op": "build", "jobs": [job], "build_dir": str(tmp_path)})
+        assert [result["name"] for result in response["results"]] == ["conn-cube"]
+        assert daemon.executor is not broken
+        assert daemon.pool().submit(os.getpid).result() != os.getpid()
+    finally:
+        daemon.close()
@@ -0,0 +1,33 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from cycax_parts.form_factors import ATX_MOUNTING, PositionTable
+
+
+def test_from_points_scales_then_offsets():
+    table = PositionTable.from_points({"a": (1, 2), "b": (3, 4)}, scale=25.4, offset=(1, 0))
+    assert table.names == ("a", "b")
+    assert table.xs == pytest.approx((26.4, 77.2))
+    assert table.ys == pytest.approx((50.8, 101.6))
+    assert list(PositionTable.from_points([(1, 2)])) == [(1, 2)]
+
+
+def test_columns_must_have_the_same_length():
+    with pytest.raises(ValueError, match="same length"):
+        PositionTable(("a", "b"), (1, 2), (3,))
+
+
+def test_inside_mirrored_and_moved():
+    table = PositionTable(("a", "b", "c"), (10, 50, 10), (10, 10, 50))
+    inside = table.inside(40, 60)
+    assert inside.names == ("a", "c")
+    assert inside is table.inside(40, 60)
+    assert inside.mirrored_y(60).positions == ((10, 50), (10, 10))
+    assert inside.moved(1, 2).positions == ((11, 12), (11, 52))
+
+
+def test_every_atx_hole_fits_the_standard_board():
+    assert len(ATX_MOUNTING.inside(305 + 3.8, 244 + 3.3)) == len(ATX_MOUNTING)
@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+
+from cycax_parts.lod import LOD0, LOD1, LOD2, mounting_keys, simplify_definition, simplify_saved_part
+from cycax_parts.patterns import HolePattern, HoleSpec, mounting
+
+
+class Feature:
+    def __init__(self, **data):
+        self.data = data
+
+    def export(self) -> dict:
+        return dict(self.data)
+
+
+class Side:
+    def __init__(self, part, name):
+        self.part = part
+        self.name = name
+
+    def hole(self, pos, diameter, depth=None, *, external_subtract=False):
+        if not external_subtract:
+            x, y = pos
+            self.part.features.append(
+                Feature(name="hole", type="cut", side=self.name, x=x, y=y, z=0, diameter=diameter, depth=depth)
+            )
+
+
+class Part:
+    def __init__(self):
+        self.features = [Feature(name="cube", type="add", side="TOP", x=0, y=0, z=0, x_size=5, y_size=5, z_size=1)]
+        self.bottom = Side(self, "BOTTOM")
+        self.front = Side(self, "FRONT")
+
+    def definition(self):
+        with mounting(self):
+            HolePattern(((3, 3), (30, 3)), (HoleSpec(3.5), HoleSpec(3.2, external_subtract=True))).apply(self.bottom)
+        # A connector opening, not a mounting hole.
+        self.front.hole(pos=(10, 5), diameter=8)
+
+    def export(self) -> dict:
+        return {
+            "name": "board",
+            "x_size": 40,
+            "y_size": 10,
+            "z_size": 5,
+            "features": [f.export() for f in self.features],
+        }
+
+
+def saved_part():
+    part = Part()
+    part.definition()
+    # The definition as it is read back from the saved JSON.
+    return part, json.loads(json.dumps(part.export()))
+
+
+def test_mounting_marks_only_the_holes_made_in_the_block():
+    part, _data = saved_part()
+    marked = part.mounting_features
+    assert [(feature["side"], feature["x"]) for feature in marked] == [("BOTTOM", 3), ("BOTTOM", 30)]
+
+
+def test_lod1_keeps_added_solids_and_mounting_holes():
+    part, data = saved_part()
+    removed = simplify_definition(data, LOD1, mounting_keys(part))
+    assert removed == 1
+    assert [(feature["name"], feature["side"]) for feature in data["features"]] == [
+        ("cube", "TOP"),
+        ("hole", "BOTTOM"),
+        ("hole", "BOTTOM"),
+    ]
+
+
+def test_lod1_without_marks_drops_every_cut():
+    _part, data = saved_part()
+    simplify_definition(data, LOD1)
+    assert [feature["name"] for feature in data["features"]] == ["cube"]
+
+
+def test_lod2_is_one_cube(tmp_path):
+    part, data = saved_part()
+    (tmp_path / "board.json").write_text(json.dumps(data))
+    assert simplify_saved_part(tmp_path, LOD0, mounting_keys(part)) == 0
+    assert simplify_saved_part(tmp_path, LOD2, mounting_keys(part)) == 3
+    (cube,) = json.loads((tmp_path / "board.json").read_text())["features"]
+    assert (cube["name"], cube["x_size"], cube["y_size"], cube["z_size"]) == ("cube", 40, 10, 5)
@@ -0,0 +1,31 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import itertools
+
+import pytest
+
+from cycax_parts.geometry import Box
+from cycax_parts.nesting import FlatPattern, nest
+
+
+def test_nested_panels_do_not_overlap():
+    patterns = [FlatPattern(f"panel-{i}", 600 + 50 * i, 300, 2.0) for i in range(6)]
+    patterns.append(FlatPattern("thick", 400, 400, 3.0))
+    layouts = nest(patterns, sheet=(1250, 1250), kerf=5)
+    assert sum(len(layout.panels) for layout in layouts) == len(patterns)
+    for layout in layouts:
+        assert len({panel.pattern.thickness for panel in layout.panels}) == 1
+        boxes = [
+            Box(panel.x, panel.y, 0, panel.x + panel.size[0], panel.y + panel.size[1], 1) for panel in layout.panels
+        ]
+        for box in boxes:
+            assert Box(0, 0, 0, layout.width, layout.height, 1).contains(box)
+        for first, second in itertools.combinations(boxes, 2):
+            assert not first.intersects(second)
+
+
+def test_panel_too_large_for_the_sheet():
+    with pytest.raises(ValueError, match="does not fit"):
+        nest([FlatPattern("huge", 3000, 2000, 2.0)])
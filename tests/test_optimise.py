@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import time
+
+from cycax_parts.optimise import optimise_features, optimise_saved_part
+
+
+def hole(diameter=3.0, depth=2.0, x=10, y=10, side="TOP"):
+    return {"name": "hole", "type": "cut", "side": side, "x": x, "y": y, "z": 0, "diameter": diameter, "depth": depth}
+
+
+def boss(x=10, y=10):
+    return {"name": "cylinder", "type": "add", "side": "TOP", "x": x, "y": y, "z": 0, "diameter": 6.0, "depth": 2.0}
+
+
+def test_first_of_identical_cuts_is_kept():
+    first, second = hole(), hole()
+    kept, removed = optimise_features([first, second])
+    assert kept == [first]
+    assert removed == [second]
+    assert kept[0] is first
+
+
+def test_hole_inside_larger_hole_is_removed():
+    small, large = hole(diameter=2.0), hole(diameter=4.0, depth=None)
+    kept, removed = optimise_features([small, large])
+    assert kept == [large]
+    assert removed == [small]
+
+
+def test_holes_on_other_axes_are_kept():
+    features = [hole(), hole(x=11), hole(side="BOTTOM"), hole(diameter=4.0, depth=1.0)]
+    kept, removed = optimise_features(features)
+    assert kept == features
+    assert removed == []
+
+
+def test_cut_is_kept_when_material_is_added_between():
+    features = [hole(), boss(), hole()]
+    kept, removed = optimise_features(features)
+    assert kept == features
+    assert removed == []
+
+
+def test_many_holes_are_fast():
+    features = [hole(x=i % 40, y=i // 40) for i in range(1000)] * 2
+    start = time.perf_counter()
+    kept, removed = optimise_features(features)
+    assert time.perf_counter() - start < 0.5
+    assert len(kept) == len(removed) == 1000
+
+
+def test_saved_part_is_rewritten_only_when_cuts_are_removed(tmp_path):
+    path = tmp_path / "plate.json"
+    path.write_text(json.dumps({"name": "plate", "features": [hole(), boss()]}))
+    mtime = path.stat().st_mtime_ns
+    report = optimise_saved_part(tmp_path)
+    assert report.removed == []
+    assert path.stat().st_mtime_ns == mtime
+
+    path.write_text(json.dumps({"name": "plate", "features": [hole(), hole(), boss()]}))
+    report = optimise_saved_part(tmp_path)
+    assert (report.before, report.after) == (3, 2)
+    assert json.loads(path.read_text())["features"] == [hole(), boss()]
@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+
+from cycax_parts.output import CHANGES_FILE, content_digest, staged_output
+
+STEP = "ISO-10303-21;\nHEADER;\nFILE_NAME('plate','{time}',(''),(''),'','','');\nENDSEC;\nDATA;\n#1=POINT();\n"
+
+
+def write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # The build always removes an output before it writes it, seeded outputs are hard links.
+    path.unlink(missing_ok=True)
+    path.write_text(text)
+
+
+def publish_first_build(build_dir):
+    with staged_output(build_dir) as staging:
+        write(staging / "plate" / "plate.stl", "mesh")
+        write(staging / "plate" / "plate.step", STEP.format(time="2026-01-01T00:00:00"))
+        write(staging / "cube" / "cube.stl", "cube")
+
+
+def changes(build_dir) -> dict:
+    return json.loads((build_dir / CHANGES_FILE).read_text())
+
+
+def test_unchanged_outputs_are_not_written(tmp_path):
+    build_dir = tmp_path / "build"
+    publish_first_build(build_dir)
+    stl = build_dir / "plate" / "plate.stl"
+    os.utime(stl, ns=(0, 0))
+    with staged_output(build_dir) as staging:
+        write(staging / "plate" / "plate.stl", "mesh")
+        # Only the export time stamp differs.
+        write(staging / "plate" / "plate.step", STEP.format(time="2026-02-02T00:00:00"))
+    assert stl.stat().st_mtime_ns == 0
+    assert changes(build_dir) == {"added": [], "changed": [], "removed": [], "unchanged": 3}
+
+
+def test_changed_added_and_removed_outputs(tmp_path):
+    build_dir = tmp_path / "build"
+    publish_first_build(build_dir)
+    with staged_output(build_dir) as staging:
+        write(staging / "plate" / "plate.stl", "finer mesh")
+        write(staging / "plate" / "plate.dxf", "outline")
+        (staging / "cube" / "cube.stl").unlink()
+    assert (build_dir / "plate" / "plate.stl").read_text() == "finer mesh"
+    assert not (build_dir / "cube" / "cube.stl").exists()
+    report = changes(build_dir)
+    assert report["added"] == ["plate/plate.dxf"]
+    assert report["changed"] == ["plate/plate.stl"]
+    assert report["removed"] == ["cube/cube.stl"]
+
+
+def test_failed_job_keeps_its_last_good_outputs(tmp_path):
+    build_dir = tmp_path / "build"
+    publish_first_build(build_dir)
+    built = set()
+    with staged_output(build_dir, built) as staging:
+        write(staging / "plate" / "plate.stl", "new mesh")
+        # The cube job failed half way.
+        (staging / "cube" / "cube.stl").unlink()
+        write(staging / "tessellation.json", "{}")
+        built.add("plate")
+    assert (build_dir / "plate" / "plate.stl").read_text() == "new mesh"
+    assert (build_dir / "cube" / "cube.stl").read_text() == "cube"
+    assert (build_dir / "tessellation.json").exists()
+    assert changes(build_dir)["removed"] == []
+
+
+def test_staging_directory_is_removed(tmp_path):
+    build_dir = tmp_path / "build"
+    publish_first_build(build_dir)
+    assert [path.name for path in tmp_path.iterdir()] == ["build"]
+
+
+def test_step_time_stamp_is_ignored(tmp_path):
+    first, second = tmp_path / "a.step", tmp_path / "b.step"
+    first.write_text(STEP.format(time="2026-01-01T00:00:00"))
+    second.write_text(STEP.format(time="2026-03-03T12:00:00"))
+    assert content_digest(first) == content_digest(second)
+    second.write_text(STEP.format(time="2026-03-03T12:00:00").replace("POINT", "LINE"))
+    assert content_digest(first) != content_digest(second)
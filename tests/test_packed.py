@@ -0,0 +1,82 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+
+import pytest
+
+from cycax_parts.packed import PackedPart, pack, pack_file, part_definitions
+
+DEFINITION = {
+    "name": "plate",
+    "x_size": 40,
+    "y_size": 30.5,
+    "z_size": 2.0,
+    "features": [
+        {"name": "hole", "type": "cut", "side": "TOP", "x": 5, "y": 5.0, "z": 2.0, "diameter": 3.2, "depth": None},
+        {"name": "hole", "type": "cut", "side": "TOP", "x": 35, "y": 5.0, "z": 2.0, "diameter": 3.2, "depth": 2},
+        {"name": "cube", "type": "add", "x": 0, "y": 0, "z": 2.0, "x_size": 5, "y_size": 5, "z_size": 60.0},
+        {},
+        {"name": "nut", "side": "BOTTOM", "x": 1.5, "y": 2.5, "z": 0, "nut_type": "M3", "vertical": True},
+    ],
+    "colour": "red",
+}
+
+
+def packed(tmp_path, data=DEFINITION) -> PackedPart:
+    path = tmp_path / "plate.cyp"
+    path.write_bytes(pack(data))
+    return PackedPart(path)
+
+
+def test_round_trip_is_exact(tmp_path):
+    definition = packed(tmp_path).definition()
+    assert definition == DEFINITION
+    assert json.dumps(definition) == json.dumps(DEFINITION)
+
+
+def test_ints_and_floats_are_kept_apart(tmp_path):
+    features = packed(tmp_path).features
+    assert [type(feature.get("x")) for feature in features] == [int, int, int, type(None), float]
+    assert type(features[1]["depth"]) is int
+
+
+@pytest.mark.parametrize("data", [{"name": "empty", "features": []}, {"name": "none"}, [1, 2], {"features": "x"}])
+def test_documents_without_features(tmp_path, data):
+    part = packed(tmp_path, data)
+    assert part.definition() == data
+    assert len(part) == 0
+
+
+def test_header_is_read_without_the_features(tmp_path):
+    part = packed(tmp_path)
+    assert part.meta == {key: value for key, value in DEFINITION.items() if key != "features"}
+    assert len(part) == len(DEFINITION["features"])
+    # The cube reaches above the plate.
+    assert part.bounds[:3] == (0, 0, 0)
+    assert part.bounds[5] == 62.0
+    assert "features" not in part.__dict__
+
+
+def test_column(tmp_path):
+    assert packed(tmp_path).column("side") == ["TOP", "TOP", None, None, "BOTTOM"]
+
+
+def test_not_a_packed_file(tmp_path):
+    path = tmp_path / "plate.cyp"
+    path.write_bytes(b"JSON" + bytes(5))
+    with pytest.raises(ValueError, match="not a version"):
+        PackedPart(path)
+
+
+def test_part_definitions_skip_the_build_state(tmp_path):
+    for name in ("plate/plate.json", "case/case.json", "case/fingerprints.json", "case/instances.json"):
+        path = tmp_path / name
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(json.dumps(DEFINITION))
+    (tmp_path / "changes.json").write_text("{}")
+    found = [path.relative_to(tmp_path).as_posix() for path in part_definitions(tmp_path)]
+    assert found == ["case/case.json", "plate/plate.json"]
+    packed_path = pack_file(tmp_path / "plate" / "plate.json")
+    assert PackedPart(packed_path).definition() == DEFINITION
@@ -0,0 +1,35 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import itertools
+
+import pytest
+
+from cycax_parts.geometry import Box
+from cycax_parts.packing import Item, pack
+
+
+def footprint(item: Item, placement) -> Box:
+    x, y, _z = item.size
+    if placement.rotated:
+        x, y = y, x
+    return Box(placement.x, placement.y, 0, placement.x + x, placement.y + y, item.size[2])
+
+
+def test_packed_parts_keep_their_gap_and_fit():
+    items = [Item("board", (170, 170, 40)), Item("psu", (150, 81.5, 40.5)), Item("cube", (11, 11, 11), gap=2)]
+    layout = pack(items, headroom=10)
+    boxes = {item.part_no: footprint(item, placement) for item, placement in zip(items, layout.placements, strict=True)}
+    width, depth, height = layout.size
+    assert height == pytest.approx(50.5)
+    for box in boxes.values():
+        assert Box(0, 0, 0, width, depth, height).contains(box)
+    for first, second in itertools.combinations(items, 2):
+        gap = max(first.gap, second.gap) / 2
+        assert not boxes[first.part_no].grown(gap).intersects(boxes[second.part_no])
+
+
+def test_nothing_to_pack():
+    with pytest.raises(ValueError, match="Nothing to pack"):
+        pack([])
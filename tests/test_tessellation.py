@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: 2026 Tsolo.io
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import sys
+import types
+
+import pytest
+
+from cycax_parts.cache import cached_build
+from cycax_parts.tessellation import DRAFT, ENGINE_TOLERANCE, PRINT, PROFILES, engine_tolerances
+
+COARSE = {"profile": DRAFT, "tolerance": 0.5, "angular_tolerance": 0.5}
+ENGINE_DEFAULT = {"profile": PRINT, "tolerance": ENGINE_TOLERANCE, "angular_tolerance": 0.1}
+
+
+@pytest.fixture
+def engine_module(monkeypatch):
+    """A part engine module that exports its STL with export_stl(), like the build123d engine."""
+    module = types.ModuleType("fake_engine")
+    module.calls = []
+
+    def export_stl(to_export, file_path, tolerance=ENGINE_TOLERANCE, angular_tolerance=0.1, *, ascii_format=False):
+        module.calls.append((to_export, tolerance, angular_tolerance, ascii_format))
+        file_path.write_text(f"mesh {tolerance}")
+
+    class Engine:
+        def build(self, part):
+            module.export_stl("shape", part.path / f"{part.part_no}.stl", ascii_format=True)
+
+    Engine.__module__ = module.__name__
+    module.export_stl = export_stl
+    module.Engine = Engine
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    return module
+
+
+class Part:
+    part_no = "plate"
+
+    def __init__(self, path):
+        self.path = path
+
+
+def test_profile_snaps_to_the_engine_default():
+    assert PROFILES[PRINT].settings((50, 50, 2)) == ENGINE_DEFAULT
+    settings = PROFILES[DRAFT].settings((300, 200, 2))
+    assert settings["profile"] == DRAFT
+    assert settings["tolerance"] == round(2e-3 * (300**2 + 200**2 + 2**2) ** 0.5, 6)
+
+
+def test_engine_export_uses_the_profile(engine_module, tmp_path):
+    original = engine_module.export_stl
+    with engine_tolerances(engine_module.Engine, COARSE) as meshed:
+        engine_module.Engine().build(Part(tmp_path))
+    assert meshed == [tmp_path / "plate.stl"]
+    assert engine_module.calls == [("shape", 0.5, 0.5, True)]
+    assert engine_module.export_stl is original
+
+
+@pytest.mark.parametrize("settings", [None, ENGINE_DEFAULT])
+def test_engine_default_is_left_alone(engine_module, tmp_path, settings):
+    with engine_tolerances(engine_module.Engine, settings) as meshed:
+        engine_module.Engine().build(Part(tmp_path))
+    assert meshed == []
+    assert engine_module.calls == [("shape", ENGINE_TOLERANCE, 0.1, True)]
+
+
+def test_part_is_meshed_once(engine_module, tmp_path):
+    (tmp_path / "plate.json").write_text(json.dumps({"name": "plate", "features": []}))
+    # retessellate() would import build123d to mesh again from the STEP file.
+    assert not cached_build(Part(tmp_path), tmp_path, engine_module.Engine, None, COARSE)
+    assert len(engine_module.calls) == 1
+    assert (tmp_path / "plate.stl").read_text() == "mesh 0.5"